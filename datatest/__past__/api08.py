@@ -11,7 +11,8 @@ from datatest._load.temptable import load_data
 from datatest._load.temptable import new_table_name
 from datatest._load.temptable import savepoint
 from datatest._load.temptable import table_exists
-from datatest._query.query import DEFAULT_CONNECTION
+from datatest._query.index_advisor import IndexAdvisor
+from datatest._query.query import DEFAULT_POOL
 from datatest._query.query import BaseElement
 from datatest._utils import file_types
 from datatest._utils import string_types
@@ -49,7 +50,8 @@ class DataSource(datatest.Select):
             data_list = file
 
         new_cls = cls.__new__(cls)
-        new_cls._connection = DEFAULT_CONNECTION
+        new_cls._pool = DEFAULT_POOL
+        new_cls._index_advisor = IndexAdvisor()
         cursor = new_cls._connection.cursor()
         with savepoint(cursor):
             table = new_table_name(cursor)
@@ -65,7 +67,8 @@ class DataSource(datatest.Select):
     @classmethod
     def from_excel(cls, path, worksheet=0):
         new_cls = cls.__new__(cls)
-        new_cls._connection = DEFAULT_CONNECTION
+        new_cls._pool = DEFAULT_POOL
+        new_cls._index_advisor = IndexAdvisor()
         cursor = new_cls._connection.cursor()
         with savepoint(cursor):
             table = new_table_name(cursor)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""Hashable keys for unhashable elements (lists, dicts, sets, etc.).
+
+Set-based requirements and sequence comparisons need elements that
+can be hashed. Hashable elements are used as their own keys while
+unhashable elements are replaced by a "deep" key made from their
+contents--equal structures receive equal keys so they can be used
+for membership tests, de-duplication, and diffing.
+
+Keys are computed only for the elements that need them: callers try
+the element itself first and fall back to deep_key() when a TypeError
+is raised.
+"""
+from ._compatibility.collections.abc import Hashable
+from ._compatibility.collections.abc import Iterable
+from ._compatibility.collections.abc import Mapping
+from ._compatibility.collections.abc import Sequence
+from ._compatibility.collections.abc import Set
+from ._utils import IterItems
+
+
+class _DeepKeyMarker(object):
+    """Marks keys made for unhashable elements. The marker is pickled
+    by name so keys made in other processes compare equal.
+    """
+    def __reduce__(self):
+        return '_DEEP_KEY'
+
+    def __repr__(self):
+        return '<deep key>'
+
+
+_DEEP_KEY = _DeepKeyMarker()
+
+
+def _hashable_proxy(obj, in_progress):
+    """Return a hashable proxy for the contents of *obj*. The ids of
+    the compound objects being converted are kept in *in_progress*
+    to guard against recursive references.
+    """
+    # Adapted from "deephash" Copyright 2017 Shawn Brown, Apache License 2.0.
+    if isinstance(obj, Hashable) and not isinstance(obj, tuple):
+        return obj  # <- EXIT!
+
+    obj_id = id(obj)
+    if obj_id in in_progress:
+        return object()  # <- EXIT! (Recursive references never match.)
+    in_progress.add(obj_id)
+
+    # Sets and mappings compare equal to other sets and mappings with
+    # the same contents (like set and frozenset or dict and OrderedDict)
+    # so their proxies do not include the object's type.
+    try:
+        if isinstance(obj, Sequence):
+            items = tuple(_hashable_proxy(x, in_progress) for x in obj)
+            proxy = (obj.__class__, items)
+        elif isinstance(obj, Set):
+            proxy = frozenset(_hashable_proxy(x, in_progress) for x in obj)
+        elif isinstance(obj, Mapping):
+            items = frozenset((k, _hashable_proxy(v, in_progress))
+                              for k, v in IterItems(obj))
+            proxy = (Mapping, items)
+        else:
+            message = 'unhashable type: {0!r}'.format(obj.__class__.__name__)
+            raise TypeError(message)
+    finally:
+        in_progress.discard(obj_id)
+    return proxy
+
+
+def deep_key(obj):
+    """Return a hashable key for *obj*. Hashable objects are returned
+    unchanged and unhashable objects are converted into a key made
+    from their contents. Raises a TypeError if *obj* contains an
+    object that is neither hashable nor a sequence, set, or mapping.
+    """
+    try:
+        hash(obj)
+    except TypeError:
+        proxy = _hashable_proxy(obj, set())
+        if isinstance(proxy, frozenset):
+            return proxy  # <- EXIT! (Same key as an equal frozenset.)
+        return _DEEP_KEY, proxy
+    return obj
+
+
+class KeyedSet(Set):
+    """A set that accepts unhashable elements. Elements are stored by
+    their deep_key() and iterating over the set returns the original
+    elements. Membership can be tested with an element or its key
+    (keys are hashable so they are their own keys). Comparisons and
+    set operations also match elements by key.
+    """
+    def __init__(self, iterable=()):
+        self._elements = {}
+        self.update(iterable)
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return cls(iterable)
+
+    def update(self, iterable):
+        """Add the elements of *iterable* to the set."""
+        if isinstance(iterable, KeyedSet):
+            iterable = iterable.key_items()
+        else:
+            iterable = ((deep_key(x), x) for x in iterable)
+
+        elements = self._elements
+        for key, element in iterable:
+            if key not in elements:
+                elements[key] = element
+
+    def key_items(self):
+        """Return an iterable of (key, element) pairs."""
+        return IterItems(self._elements)
+
+    def __contains__(self, element):
+        return deep_key(element) in self._elements
+
+    @staticmethod
+    def _keyed(other):
+        if isinstance(other, KeyedSet):
+            return other
+        return KeyedSet(other)
+
+    def _compare_keys(self, other, larger):
+        """Return True if the keys of the larger set include all the
+        keys of the smaller set (or NotImplemented if *other* is not
+        a set).
+        """
+        if not isinstance(other, Set):
+            return NotImplemented
+        other = self._keyed(other)
+        smaller, larger = (other, self) if larger else (self, other)
+        if len(smaller) > len(larger):
+            return False
+        keys = larger._elements
+        return all(key in keys for key in smaller._elements)
+
+    def __le__(self, other):
+        return self._compare_keys(other, larger=False)
+
+    def __ge__(self, other):
+        return self._compare_keys(other, larger=True)
+
+    def __lt__(self, other):
+        if not isinstance(other, Set):
+            return NotImplemented
+        return len(self) < len(other) and self.__le__(other)
+
+    def __gt__(self, other):
+        if not isinstance(other, Set):
+            return NotImplemented
+        return len(self) > len(other) and self.__ge__(other)
+
+    def __eq__(self, other):
+        if not isinstance(other, Set):
+            return NotImplemented
+        return len(self) == len(other) and self.__le__(other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __sub__(self, other):
+        if not isinstance(other, Set):
+            if not isinstance(other, Iterable):
+                return NotImplemented
+        keys = self._keyed(other)._elements
+        result = KeyedSet()
+        result._elements = dict((k, x) for k, x in self.key_items()
+                                if k not in keys)
+        return result
+
+    def __iter__(self):
+        return iter(self._elements.values())
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, list(self))
+
+
+def make_set(iterable):
+    """Return a set of the elements in *iterable*--a KeyedSet is
+    returned if any element is unhashable.
+    """
+    if not isinstance(iterable, Sequence):
+        iterable = list(iterable)  # <- Can be read more than once.
+
+    try:
+        return set(iterable)
+    except TypeError:
+        return KeyedSet(iterable)
+
+
+def key_items(set_):
+    """Return an iterable of (key, element) pairs for *set_* (which
+    can be a KeyedSet or a set of hashable elements).
+    """
+    if isinstance(set_, KeyedSet):
+        return set_.key_items()
+    return ((x, x) for x in set_)
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""On-disk storage for differences that may not fit in memory.
+
+Differences are pickled and written to a private, temporary SQLite
+database (created using an empty filename). SQLite holds pages in
+memory until its cache is full and then spills them to a temporary
+file that is deleted automatically when the connection is closed.
+"""
+import heapq
+import pickle
+import sqlite3
+from io import BytesIO
+from sqlite3 import Binary
+from ._compatibility.collections.abc import Mapping
+from ._compatibility.itertools import count
+from ._compatibility.itertools import islice
+from .difference import BaseDifference
+from .difference import NANTOKEN
+from .difference import NOVALUE
+from ._utils import IterItems
+from ._utils import iterpeek
+from ._utils import nonstringiter
+
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+# Sentinels are not picklable so they are stored by name.
+_SENTINELS = {'NOVALUE': NOVALUE, 'NANTOKEN': NANTOKEN}
+_SENTINEL_NAMES = dict((id(v), k) for k, v in IterItems(_SENTINELS))
+
+# Records written to files use a protocol whose memo indexes are
+# explicit (protocols 4 and newer number them implicitly) so a
+# single pickler and unpickler can be used for a whole file.
+RECORD_PROTOCOL = min(pickle.HIGHEST_PROTOCOL, 3)
+
+
+class _Pickler(pickle.Pickler):
+    def persistent_id(self, obj, _get_name=_SENTINEL_NAMES.get):
+        return _get_name(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return _SENTINELS[pid]
+
+
+def dumps(obj):
+    """Return the pickled representation of *obj* as bytes (unlike
+    the standard pickle module, difference sentinels are supported).
+    """
+    buf = BytesIO()
+    _Pickler(buf, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buf.getvalue()
+
+
+def loads(data):
+    """Return the object for the pickled *data* given by dumps()."""
+    return _Unpickler(BytesIO(bytes(data))).load()
+
+
+class RecordWriter(object):
+    """Write pickled objects to the open binary *file* (like dumps(),
+    difference sentinels are supported). One pickler is used for all
+    records and its memo is cleared after each one.
+    """
+    def __init__(self, file):
+        self._pickler = _Pickler(file, RECORD_PROTOCOL)
+
+    def write(self, obj):
+        self._pickler.dump(obj)
+        self._pickler.clear_memo()
+
+
+def read_records(file):
+    """Generate the objects written to *file* by a RecordWriter
+    (starting from the file's current position).
+    """
+    unpickler = _Unpickler(file)
+    while True:
+        try:
+            yield unpickler.load()
+        except EOFError:
+            return
+
+
+class DifferenceStore(object):
+    """An iterable of differences backed by a temporary on-disk
+    database. Differences are written in batches of *chunk_size*
+    and at most *chunk_size* differences are held in memory when
+    sorting.
+    """
+    def __init__(self, chunk_size=None):
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        self._connection = sqlite3.connect('')  # <- Temporary database.
+        self._connection.execute(
+            'CREATE TABLE differences (key_hash INTEGER, key BLOB, diff BLOB)')
+        self._connection.execute(
+            'CREATE INDEX differences_key ON differences (key)')
+        self._connection.execute(
+            'CREATE INDEX differences_key_hash ON differences (key_hash)')
+        self._connection.commit()
+        self._sort_tables = count()  # <- Numbers tables for sorted().
+
+    def _insert(self, rows):
+        """Insert (key_hash, key, diff) *rows* in batches of chunk_size."""
+        statement = 'INSERT INTO differences (key_hash, key, diff) VALUES (?, ?, ?)'
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, self.chunk_size))
+            if not batch:
+                break
+            self._connection.executemany(statement, batch)
+            self._connection.commit()
+
+    def extend(self, differences):
+        """Write an iterable of *differences* to the store."""
+        self._insert((None, None, Binary(dumps(diff))) for diff in differences)
+
+    def _iter_blobs(self, table, where='', params=()):
+        """Yield the "diff" values from *table* in insertion order.
+        Rows are read in pages of chunk_size so that no statement
+        is left pending while other statements write to the store.
+        """
+        statement = (
+            'SELECT rowid, diff FROM {0} WHERE rowid > ?{1} '
+            'ORDER BY rowid LIMIT {2}'
+        ).format(table, where, int(self.chunk_size))
+        last_rowid = 0
+        while True:
+            cursor = self._connection.execute(statement, (last_rowid,) + params)
+            rows = cursor.fetchall()
+            if not rows:
+                return
+            for last_rowid, blob in rows:
+                yield blob
+
+    def _iter_differences(self):
+        return (loads(blob) for blob in self._iter_blobs('differences'))
+
+    def __iter__(self):
+        return self._iter_differences()
+
+    def __len__(self):
+        cursor = self._connection.execute('SELECT COUNT(*) FROM differences')
+        return cursor.fetchone()[0]
+
+    def __bool__(self):
+        cursor = self._connection.execute('SELECT 1 FROM differences LIMIT 1')
+        return cursor.fetchone() is not None
+
+    __nonzero__ = __bool__  # For Python 2.x compatibility.
+
+    def sorted(self, key=None):
+        """Return an iterator of stored differences in sorted order
+        (an external merge sort is used when the store contains more
+        than chunk_size differences). Each call writes its sorted
+        runs to its own table so iterators do not interfere with
+        each other.
+        """
+        key = key or (lambda x: x)
+        connection = self._connection
+        table = 'sort_runs{0}'.format(next(self._sort_tables))
+
+        # Write sorted runs of chunk_size differences.
+        iterator = self._iter_differences()
+        run = 0
+        while True:
+            chunk = sorted(islice(iterator, self.chunk_size), key=key)
+            if not chunk:
+                break
+            if run == 0 and len(chunk) < self.chunk_size:
+                return iter(chunk)  # <- EXIT! (Only one run, no merge.)
+            if run == 0:
+                connection.execute(
+                    'CREATE TABLE {0} (run INTEGER, diff BLOB)'.format(table))
+                connection.execute(
+                    'CREATE INDEX {0}_run ON {0} (run)'.format(table))
+            connection.executemany(
+                'INSERT INTO {0} (run, diff) VALUES (?, ?)'.format(table),
+                ((run, Binary(dumps(diff))) for diff in chunk),
+            )
+            connection.commit()
+            run += 1
+
+        if run == 0:
+            return iter([])  # <- EXIT! (Store is empty.)
+        return self._merge_runs(table, run, key)
+
+    def _merge_runs(self, table, runs, key):
+        """Generate the differences from the sorted *runs* in *table*
+        in merged order. The table is dropped when finished.
+        """
+        def read_run(run):
+            blobs = self._iter_blobs(table, ' AND run=?', (run,))
+            for position, blob in enumerate(blobs):
+                diff = loads(blob)
+                yield key(diff), run, position, diff
+
+        try:
+            for item in heapq.merge(*[read_run(x) for x in range(runs)]):
+                yield item[3]
+        finally:
+            try:
+                self._connection.execute('DROP TABLE {0}'.format(table))
+            except sqlite3.Error:
+                pass  # Store was closed before the iterator finished.
+
+    def close(self):
+        """Close the store and delete its temporary database."""
+        self._connection.close()
+
+    def __repr__(self):
+        return '<{0} of {1} differences>'.format(
+            self.__class__.__name__, len(self))
+
+
+class MappedDifferenceStore(DifferenceStore, Mapping):
+    """A mapping of keys to differences backed by a temporary on-disk
+    database. Keys with a single difference map to the difference
+    itself, other keys map to a list of differences.
+
+    Keys are looked up by hash and compared by equality (equal keys
+    can have different pickles, like 1, 1.0, and True).
+    """
+    def add(self, key, differences):
+        """Write *differences* for the given *key* to the store."""
+        if isinstance(differences, BaseDifference):
+            differences = [differences]
+        key_hash = hash(key)
+        key = Binary(dumps(key))
+        self._insert((key_hash, key, Binary(dumps(diff))) for diff in differences)
+
+    def extend_items(self, items):
+        """Write an iterable of (key, difference) *items* to the store."""
+        self._insert((hash(k), Binary(dumps(k)), Binary(dumps(v))) for k, v in items)
+
+    def __iter__(self):
+        cursor = self._connection.execute(
+            'SELECT key FROM differences GROUP BY key ORDER BY MIN(rowid)')
+        return (loads(row[0]) for row in cursor.fetchall())
+
+    def __len__(self):
+        cursor = self._connection.execute(
+            'SELECT COUNT(DISTINCT key) FROM differences')
+        return cursor.fetchone()[0]
+
+    def _get_differences(self, key_blob):
+        blobs = self._iter_blobs('differences', ' AND key=?', (key_blob,))
+        return [loads(blob) for blob in blobs]
+
+    def __getitem__(self, key):
+        cursor = self._connection.execute(
+            'SELECT DISTINCT key FROM differences WHERE key_hash=?', (hash(key),))
+        for key_blob, in cursor.fetchall():
+            if loads(key_blob) == key:
+                value = self._get_differences(key_blob)
+                if len(value) == 1:
+                    return value[0]
+                return value
+        raise KeyError(key)
+
+    def count(self):
+        """Return the total number of differences for all keys."""
+        cursor = self._connection.execute('SELECT COUNT(*) FROM differences')
+        return cursor.fetchone()[0]
+
+    def __repr__(self):
+        return '<{0} of {1} keys>'.format(self.__class__.__name__, len(self))
+
+
+def store_differences(differences, chunk_size=None):
+    """Write *differences* to a new on-disk store. The *differences*
+    can be an iterable of difference objects, a mapping, or an iterable
+    of key/value items (where values are differences or iterables of
+    differences).
+    """
+    if isinstance(differences, BaseDifference):
+        differences = [differences]
+
+    if not isinstance(differences, Mapping):
+        first_item, differences = iterpeek(differences)
+        if isinstance(first_item, BaseDifference):
+            store = DifferenceStore(chunk_size)
+            store.extend(differences)
+            return store  # <- EXIT!
+
+    store = MappedDifferenceStore(chunk_size)
+    items = IterItems(differences)
+    for key, value in items:
+        if not nonstringiter(value):
+            value = [value]
+        store.add(key, value)
+    return store
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Fuzzy matching using the ratio() method of difflib.SequenceMatcher.
+
+Before a full ratio() is computed, the cheaper real_quick_ratio() and
+quick_ratio() methods are checked--these are upper bounds of ratio()
+so strings that can not meet the cutoff are rejected early without
+changing any results.
+
+SequenceMatcher preprocesses its second sequence (building an index
+of element positions). Matchers are kept for recently used second
+sequences so this preprocessing is reused when the same value is
+compared many times (e.g., an expected value that appears in many
+differences or a data value that is checked against several keys).
+Each thread keeps its own matchers so threads do not need to wait
+for each other.
+"""
+import difflib
+import threading
+from ._utils import LRUCache
+from ._utils import string_types
+
+
+MATCHER_CACHE_SIZE = 256  # Number of second sequences to keep matchers for.
+
+_local = threading.local()
+
+
+def _get_matcher(b):
+    """Return a SequenceMatcher whose second sequence is *b* from
+    the current thread's cache (matchers are modified when they are
+    used so each thread has its own cache).
+    """
+    try:
+        cache = _local.matchers
+    except AttributeError:
+        cache = _local.matchers = LRUCache(MATCHER_CACHE_SIZE)
+
+    try:
+        matcher = cache.get(b)
+    except TypeError:
+        return difflib.SequenceMatcher(b=b)  # <- EXIT! (Unhashable, not kept.)
+
+    if matcher is None:
+        matcher = difflib.SequenceMatcher(b=b)
+        cache.put(b, matcher)
+    return matcher
+
+
+def fuzzy_match(a, b, cutoff):
+    """Return True if the similarity of *a* and *b* is greater than
+    or equal to *cutoff*. The result is the same as checking the
+    value of difflib.SequenceMatcher(a=a, b=b).ratio() directly.
+    Returns False if *a* or *b* is not a sequence.
+    """
+    if isinstance(a, string_types) and a == b:
+        return 1.0 >= cutoff  # <- EXIT! (Equal strings have a ratio of 1.0.)
+
+    try:
+        matcher = _get_matcher(b)
+        matcher.set_seq1(a)
+        return (matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and matcher.ratio() >= cutoff)
+    except TypeError:
+        return False
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""Column-projected loading for sources that can be read repeatedly.
+
+Instead of loading every column when a source is added, a table is
+created with only the columns needed so far. When more columns are
+needed later, they are added to the table and filled-in by reading
+the sources again (rows are matched to their original insertion
+order using rowid values).
+"""
+import warnings
+from .._utils import string_types
+from . import load_csv as _load_csv
+from .get_reader import get_reader
+from .temptable import alter_table
+from .temptable import create_table
+from .temptable import insert_records
+from .temptable import normalize_names
+from .temptable import savepoint
+
+
+class LazySource(object):
+    """A data source that is read when its columns are needed. The
+    *obj* must be a file path or a list of records so that it can
+    be read more than once. The *\\*args* and *\\*\\*kwds* are the
+    same as those used for loading the source directly.
+    """
+    def __init__(self, obj, *args, **kwds):
+        if not isinstance(obj, (string_types, list)):
+            msg = ('lazy loading requires a file path or a list of '
+                   'records, got {0!r}')
+            raise TypeError(msg.format(obj.__class__.__name__))
+
+        self.obj = obj
+        self._fallback_error = None
+        self.is_csv = isinstance(obj, string_types) and obj.lower().endswith('.csv')
+        if self.is_csv:
+            encoding = args[0] if args else kwds.pop('encoding', None)
+            args = ()
+            if encoding:
+                self._encodings = [encoding]
+            else:
+                fallback = _load_csv.fallback_encoding
+                if not isinstance(fallback, list):
+                    fallback = [fallback]
+                self._encodings = [_load_csv.preferred_encoding] + fallback
+            self.default = kwds.get('restval', '')
+        else:
+            self.default = ''
+        self.args = args
+        self.kwds = kwds
+
+        self.row_count = None  # Set when rows are first inserted.
+        self.fieldnames = self.read(lambda reader: list(next(reader, [])))
+
+    def _get_reader(self):
+        if self.is_csv:
+            return get_reader.from_csv(self.obj, self._encodings[0], **self.kwds)
+        return iter(get_reader(self.obj, *self.args, **self.kwds))
+
+    def read(self, func):
+        """Call *func* with a new reader for the source and return
+        its result. If a CSV file can not be decoded (and no encoding
+        was specified), *func* is called again using the fallback
+        encodings--so *func* should undo any partial work when it
+        raises a UnicodeDecodeError.
+        """
+        while True:
+            try:
+                result = func(self._get_reader())
+            except UnicodeDecodeError as error:
+                if not self.is_csv or len(self._encodings) < 2:
+                    raise
+                self._fallback_error = self._fallback_error or error
+                self._encodings.pop(0)
+                continue
+
+            if self._fallback_error:
+                msg = (
+                    '{0}: loaded {1!r} using fallback {2!r}: specify an '
+                    'appropriate text encoding to assure correct operation'
+                ).format(self._fallback_error, self.obj, self._encodings[0])
+                warnings.warn(msg)
+                self._fallback_error = None
+            return result
+
+    def get_rows(self, reader, columns):
+        """Return an iterator of rows from *reader* containing values
+        for the given *columns* (in order).
+        """
+        next(reader, None)  # Skip header row.
+        indexes = [self.fieldnames.index(x) for x in columns]
+        default = self.default
+        for row in reader:
+            try:
+                yield [row[i] for i in indexes]
+            except IndexError:
+                yield [row[i] if i < len(row) else default for i in indexes]
+
+
+def insert_source(cursor, table, source, columns):
+    """Insert rows from *source* into *table* using only the given
+    *columns* (other columns receive their default value). Returns
+    the number of rows inserted.
+    """
+    present = [x for x in columns if x in source.fieldnames]
+
+    def insert(reader):
+        with savepoint(cursor):
+            if present:
+                rows = source.get_rows(reader, present)
+                return insert_records(cursor, table, present, rows)
+
+            statement = 'INSERT INTO {0} DEFAULT VALUES'.format(table)
+            total = 0
+            for _ in source.get_rows(reader, []):
+                cursor.execute(statement)
+                total += 1
+            return total
+
+    return source.read(insert)
+
+
+def load_columns(cursor, table, sources, columns):
+    """Create *table* with the given *columns* and insert the rows
+    from all *sources*.
+    """
+    default = sources[0].default if sources else ''
+    create_table(cursor, table, columns, default=default)
+    for source in sources:
+        source.row_count = insert_source(cursor, table, source, columns)
+
+
+def add_columns(cursor, table, sources, columns):
+    """Add *columns* to an existing *table* and fill them in with
+    values read from *sources*. The sources must be given in the same
+    order they were originally inserted.
+    """
+    default = sources[0].default if sources else ''
+    alter_table(cursor, table, columns, default=default)
+
+    first_rowid = 1
+    for source in sources:
+        present = [x for x in columns if x in source.fieldnames]
+        if present:
+            assignments = ', '.join('{0}=?'.format(x) for x in normalize_names(present))
+            statement = 'UPDATE {0} SET {1} WHERE rowid=?'.format(table, assignments)
+
+            def update(reader):
+                with savepoint(cursor):
+                    rows = source.get_rows(reader, present)
+                    params = (row + [rowid] for rowid, row in
+                              enumerate(rows, first_rowid))
+                    cursor.executemany(statement, params)
+
+            source.read(update)
+        first_rowid += source.row_count
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Persistent on-disk cache of loaded tables.
+
+Each cache file is an SQLite database containing a single table of
+rows loaded from a source file. Cache files are named using a hash
+of the source path, its size, its modification time, and the
+arguments used to load it--when any of these change, a new cache
+file is built.
+"""
+import hashlib
+import os
+import sqlite3
+from .get_reader import get_reader
+from .load_csv import load_csv
+from .temptable import load_data
+from .temptable import new_table_name
+from .temptable import table_exists
+
+
+CACHE_VERSION = 1  # Increment when the cache file format changes.
+CACHE_TABLE = 'cached_data'
+
+
+def _is_csv_path(path):
+    return path.lower().endswith('.csv')
+
+
+def get_cache_path(cache_dir, path, *args, **kwds):
+    """Return path of the cache file for loading *path* with the
+    given *args* and *kwds*.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    fingerprint = repr((
+        CACHE_VERSION,
+        path,
+        stat.st_size,
+        stat.st_mtime,
+        args,
+        sorted(kwds.items()),
+    ))
+    digest = hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, 'datatest-{0}.sqlite3'.format(digest))
+
+
+def build_cache(cache_path, path, *args, **kwds):
+    """Load data from *path* and save it as a new cache file at
+    *cache_path*. Returns False if no data was loaded (the cache
+    file is not created in this case).
+    """
+    cache_dir = os.path.dirname(cache_path)
+    if cache_dir and not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+
+    types = kwds.pop('types', None)
+    temp_path = '{0}.{1}.tmp'.format(cache_path, os.getpid())
+    connection = sqlite3.connect(temp_path)
+    connection.isolation_level = None  # <- Run in 'autocommit' mode.
+    try:
+        connection.execute('PRAGMA synchronous=OFF')
+        cursor = connection.cursor()
+        table = new_table_name(cursor)
+        if _is_csv_path(path):
+            load_csv(cursor, table, path, *args, types=types, **kwds)
+        else:
+            reader = get_reader(path, *args, **kwds)
+            load_data(cursor, table, reader, types=types)
+
+        is_loaded = table_exists(cursor, table)
+        if is_loaded:
+            # The loading functions create a temporary table so its
+            # contents are copied into a table in the main database.
+            cursor.execute('CREATE TABLE main.{0} AS SELECT * FROM temp.{1} '
+                           'ORDER BY rowid'.format(CACHE_TABLE, table))
+    except Exception:
+        connection.close()
+        os.remove(temp_path)
+        raise
+    connection.close()
+
+    if not is_loaded:
+        os.remove(temp_path)
+        return False  # <- EXIT! (No data to cache.)
+
+    try:
+        os.rename(temp_path, cache_path)
+    except OSError:  # Another process may have built the same
+        os.remove(temp_path)  # cache file in the meantime.
+    return True
+
+
+def load_from_cache(cursor, table, cache_path, default='', types=None):
+    """Load data from the cache file at *cache_path* and insert it
+    into *table*.
+    """
+    connection = sqlite3.connect(cache_path)
+    try:
+        cache_cursor = connection.cursor()
+        cache_cursor.execute('PRAGMA table_info({0})'.format(CACHE_TABLE))
+        columns = [x[1] for x in cache_cursor]
+        cache_cursor.execute(
+            'SELECT * FROM {0} ORDER BY rowid'.format(CACHE_TABLE))
+        load_data(cursor, table, columns, cache_cursor, default=default,
+                  types=types)
+    finally:
+        connection.close()
+
+
+def load_cached(cursor, table, cache_dir, path, *args, **kwds):
+    """Load *path* into *table* using a cache file from *cache_dir*
+    (building the cache file first if it does not exist).
+    """
+    cache_path = get_cache_path(cache_dir, path, *args, **kwds)
+    if not os.path.exists(cache_path):
+        if not build_cache(cache_path, path, *args, **kwds):
+            return  # <- EXIT!
+
+    if _is_csv_path(path):
+        default = kwds.get('restval', '')
+    else:
+        default = ''
+    load_from_cache(cursor, table, cache_path, default=default,
+                    types=kwds.get('types'))
@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
 import warnings
+from .._compatibility.itertools import islice
 from .._utils import exhaustible
 from .._utils import seekable
 from .._utils import file_types
@@ -7,26 +13,34 @@ from .get_reader import get_reader
 from .temptable import load_data
 from .temptable import savepoint
 
+try:
+    from queue import Empty
+except ImportError:
+    from Queue import Empty  # <- Python 2.
+
 
 preferred_encoding = 'utf-8'
 fallback_encoding = ['latin-1']
 
 
-def load_csv(cursor, table, csvfile, encoding=None, **kwds):
-    """Load *csvfile* and insert data into *table*."""
+# Number of rows pickled together when a worker process spools a file.
+READ_BATCH_SIZE = 1000
+
+
+def _call_with_encoding(func, csvfile, encoding=None):
+    """Return the result of calling *func* with a text encoding for
+    *csvfile*. If *encoding* is unspecified, *func* is called with the
+    preferred encoding and, failing that, with the fallback encodings
+    (*func* should raise a UnicodeDecodeError when the encoding does
+    not work).
+    """
     global preferred_encoding
     global fallback_encoding
 
-    default = kwds.get('restval', '')  # Used for default column value.
-
     if encoding:
         # When an encoding is specified, use it to load *csvfile* or
         # fail if there are errors (no fallback recovery):
-        with savepoint(cursor):
-            reader = get_reader.from_csv(csvfile, encoding, **kwds)
-            load_data(cursor, table, reader, default=default)
-
-        return  # <- EXIT!
+        return func(encoding)  # <- EXIT!
 
     # When the encoding is unspecified, try to load *csvfile* using the
     # preferred encoding and failing that, try the fallback encodings:
@@ -37,11 +51,7 @@ def load_csv(cursor, table, csvfile, encoding=None, **kwds):
         position = None            # supports random access.
 
     try:
-        with savepoint(cursor):
-            reader = get_reader.from_csv(csvfile, preferred_encoding, **kwds)
-            load_data(cursor, table, reader, default=default)
-
-        return  # <- EXIT!
+        return func(preferred_encoding)  # <- EXIT!
 
     except UnicodeDecodeError as orig_error:
         if exhaustible(csvfile) and position is None:
@@ -62,9 +72,7 @@ def load_csv(cursor, table, csvfile, encoding=None, **kwds):
                 csvfile.seek(position)
 
             try:
-                with savepoint(cursor):
-                    reader = get_reader.from_csv(csvfile, fallback, **kwds)
-                    load_data(cursor, table, reader, default=default)
+                result = func(fallback)
 
                 msg = (
                     '{0}: loaded {1!r} using fallback {2!r}: specify an '
@@ -72,7 +80,7 @@ def load_csv(cursor, table, csvfile, encoding=None, **kwds):
                 ).format(orig_error, csvfile, fallback)
                 warnings.warn(msg)
 
-                return  # <- EXIT!
+                return result  # <- EXIT!
 
             except UnicodeDecodeError:
                 pass
@@ -84,3 +92,142 @@ def load_csv(cursor, table, csvfile, encoding=None, **kwds):
             'must specify an appropriate text encoding'
         ).format(reason, csvfile)
         raise UnicodeDecodeError(encoding, object_, start, end, reason)
+
+
+def load_csv(cursor, table, csvfile, encoding=None, **kwds):
+    """Load *csvfile* and insert data into *table*. The optional
+    *types* keyword is passed to load_data() to declare or infer
+    column types.
+    """
+    default = kwds.get('restval', '')  # Used for default column value.
+    types = kwds.pop('types', None)
+
+    def load(encoding):
+        with savepoint(cursor):
+            reader = get_reader.from_csv(csvfile, encoding, **kwds)
+            load_data(cursor, table, reader, default=default, types=types)
+
+    _call_with_encoding(load, csvfile, encoding)
+
+
+def _spool_csv(path, spool, args, kwds):
+    """Parse the CSV file at *path* and write its rows to the open
+    binary file *spool* as pickled batches of READ_BATCH_SIZE rows.
+    The encoding is chosen while parsing--if the preferred encoding
+    fails, *spool* is emptied and the fallback encodings are tried.
+    """
+    encoding = args[0] if args else kwds.get('encoding')
+    reader_kwds = dict((k, v) for k, v in kwds.items() if k != 'encoding')
+
+    def spool_rows(encoding):
+        spool.seek(0)
+        spool.truncate()
+        reader = get_reader.from_csv(path, encoding, **reader_kwds)
+        while True:
+            batch = list(islice(reader, READ_BATCH_SIZE))
+            if not batch:
+                break
+            pickle.dump(batch, spool, pickle.HIGHEST_PROTOCOL)
+
+    _call_with_encoding(spool_rows, path, encoding)
+
+
+def _read_csv_worker(tasks, results, spool_dir, args, kwds, preferred, fallback):
+    """Worker process for read_csv_files(), gets (index, path) tasks
+    from *tasks* until it gets None. Each file is parsed into a spool
+    file in *spool_dir* and (index, spool_path, warnings, error) is
+    put on *results* when it is finished (*spool_path* is None if an
+    error occurred).
+    """
+    global preferred_encoding
+    global fallback_encoding
+    preferred_encoding = preferred
+    fallback_encoding = fallback
+
+    for index, path in iter(tasks.get, None):
+        spool_path = os.path.join(spool_dir, '{0}.pickle'.format(index))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            try:
+                with open(spool_path, 'wb') as spool:
+                    _spool_csv(path, spool, args, kwds)
+                error = None
+            except Exception as exc:
+                try:
+                    pickle.dumps(exc)
+                    error = exc
+                except Exception:  # Send an error that can be pickled.
+                    error = RuntimeError('{0}: {1}'.format(exc.__class__.__name__, exc))
+                spool_path = None
+        messages = [str(warning.message) for warning in caught]
+        results.put((index, spool_path, messages, error))
+
+
+def _read_spool(spool):
+    """Generate rows from an open spool file written by _spool_csv()."""
+    while True:
+        try:
+            batch = pickle.load(spool)
+        except EOFError:
+            return
+        for row in batch:
+            yield row
+
+
+def read_csv_files(paths, workers, *args, **kwds):
+    """Parse the CSV files at *paths* in *workers* processes and
+    generate an iterator of rows for each file (in the order given).
+    Each worker takes the next unparsed file, parses it into a
+    temporary spool file, and moves on without waiting for the caller
+    so memory use does not grow with the size of the files. Warnings
+    issued by the worker processes are re-issued in the current
+    process.
+    """
+    workers = min(workers, len(paths))
+    global_settings = (preferred_encoding, fallback_encoding)
+    spool_dir = tempfile.mkdtemp(prefix='datatest-')
+
+    tasks = multiprocessing.Queue()
+    for task in enumerate(paths):
+        tasks.put(task)
+    for _ in range(workers):
+        tasks.put(None)  # <- Tells a worker to stop.
+
+    results = multiprocessing.Queue()
+    processes = []
+    for _ in range(workers):
+        process = multiprocessing.Process(
+            target=_read_csv_worker,
+            args=(tasks, results, spool_dir, args, kwds) + global_settings,
+        )
+        process.daemon = True
+        process.start()
+        processes.append(process)
+
+    try:
+        finished = dict()
+        for index in range(len(paths)):
+            while index not in finished:
+                try:
+                    result = results.get(timeout=1.0)
+                except Empty:
+                    if not any(p.is_alive() for p in processes) and results.empty():
+                        msg = 'worker process exited with code {0}'
+                        exitcodes = [p.exitcode for p in processes]
+                        raise RuntimeError(msg.format(max(exitcodes)))
+                    continue
+                finished[result[0]] = result[1:]
+
+            spool_path, messages, error = finished.pop(index)
+            for message in messages:
+                warnings.warn(message)
+            if error is not None:
+                raise error
+            with open(spool_path, 'rb') as spool:
+                yield _read_spool(spool)
+            os.remove(spool_path)  # <- Removed when the next file is needed.
+    finally:
+        for process in processes:
+            process.terminate()
+            process.join()
+        shutil.rmtree(spool_dir, ignore_errors=True)
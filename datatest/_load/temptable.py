@@ -1,9 +1,27 @@
 # -*- coding: utf-8 -*-
+import re
 import sqlite3
+from numbers import Integral
+from numbers import Real
+from operator import itemgetter
 from .._compatibility.collections.abc import Iterable
 from .._compatibility.collections.abc import Mapping
 from .._compatibility.itertools import chain
 from .._compatibility.itertools import count
+from .._compatibility.itertools import islice
+from .._utils import _timer
+
+
+# Number of records passed to each executemany() call when inserting.
+INSERT_BATCH_SIZE = 10000
+
+# Page cache size (in KiB) used while bulk loading records.
+LOAD_CACHE_SIZE = 65536
+
+# Number of records held in memory when inferring column types--larger
+# loads are first written to an untyped staging table so the types can
+# be inferred from every record before the typed columns are created.
+INFER_SAMPLE_SIZE = 1000
 
 
 try:
@@ -27,6 +45,14 @@ def table_exists(cursor, table):
     return bool(cursor.fetchall())
 
 
+def table_exists_in_temp(cursor, table):
+    cursor.execute(
+        "SELECT name FROM sqlite_temp_master WHERE type='table' AND name=?",
+        (table,),
+    )
+    return bool(cursor.fetchall())
+
+
 _table_names = ('tbl{0}'.format(x) for x in count())
 def new_table_name(cursor):
     global _table_names
@@ -60,10 +86,115 @@ def normalize_default(value):
     return repr(value)
 
 
-def create_table(cursor, table, columns, default=''):
-    """Creates a temporary table using *table* and *columns* names."""
-    columns = normalize_names(columns)
-    if columns.count('""') > 1:
+def normalize_type(value):
+    """Return the declared SQLite column type for *value*--a Python
+    type (str, int, or float) or the name of an SQLite type.
+    """
+    if isinstance(value, type):
+        if issubclass(value, string_types):
+            return 'TEXT'
+        if issubclass(value, Integral):
+            return 'INTEGER'
+        if issubclass(value, Real):
+            return 'REAL'
+        msg = 'unsupported column type: {0!r}'
+        raise TypeError(msg.format(value))
+    return str(value).upper()
+
+
+# Patterns for text values that can be stored as numbers without
+# changing their meaning. Integers with leading zeros (like ZIP codes
+# or ID numbers) and integers that could overflow a 64-bit column
+# are not matched so they remain text.
+_integer_pattern = re.compile(r'[+-]?(?:0|[1-9][0-9]{0,17})\Z')
+_real_pattern = re.compile(
+    r'[+-]?(?:(?:0|[1-9][0-9]*)(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?\Z')
+
+
+def _infer_value_type(value):
+    """Return the SQLite type suitable for storing *value* or None if
+    the value does not constrain the column type.
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, Integral):
+        return 'INTEGER'
+    if isinstance(value, Real):
+        return 'REAL'
+    if isinstance(value, string_types):
+        if _integer_pattern.match(value):
+            return 'INTEGER'
+        if _real_pattern.match(value) and ('.' in value or 'e' in value.lower()):
+            return 'REAL'
+    return 'TEXT'
+
+
+def collect_types(records, found):
+    """Generate *records* unchanged while adding the inferred type of
+    each value to the matching set in *found* (a list of sets ordered
+    like the record values).
+    """
+    for record in records:
+        for value, types in zip(record, found):
+            if 'TEXT' not in types:
+                types.add(_infer_value_type(value))
+        yield record
+
+
+def resolve_types(columns, found):
+    """Return a dictionary of column types from the sets of value
+    types in *found*. Columns containing only empty values are
+    omitted.
+    """
+    inferred = {}
+    for column, types in zip(columns, found):
+        if 'TEXT' in types:
+            inferred[column] = 'TEXT'
+        elif 'REAL' in types:
+            inferred[column] = 'REAL'
+        elif 'INTEGER' in types:
+            inferred[column] = 'INTEGER'
+    return inferred
+
+
+def infer_types(columns, records):
+    """Return a dictionary of column types inferred from *records*
+    (sequences of values ordered by *columns*). Columns containing
+    only empty values are omitted.
+    """
+    found = [set() for _ in columns]
+    for _ in collect_types(records, found):
+        pass
+    return resolve_types(columns, found)
+
+
+def get_column_defs(columns, default='', types=None):
+    """Return a list of column definitions for *columns*. The optional
+    *types* dictionary maps column names to declared types.
+    """
+    default = normalize_default(default)
+    types = types or {}
+    column_defs = []
+    for column, name in zip(columns, normalize_names(columns)):
+        declared = types.get(column)
+        if declared:
+            column_def = '{0} {1} DEFAULT {2}'.format(name, declared, default)
+        else:
+            column_def = '{0} DEFAULT {1}'.format(name, default)
+        column_defs.append(column_def)
+    return column_defs
+
+
+def create_table(cursor, table, columns, default='', types=None):
+    """Creates a temporary table using *table* and *columns* names.
+    The optional *types* dictionary maps column names to declared
+    types (columns without a declared type store values as-is).
+
+    If the cursor's connection has a false *temporary_tables*
+    attribute, a regular table is created instead (so the table
+    can be shared with other connections to the same database).
+    """
+    if normalize_names(columns).count('""') > 1:
         custom_message = ('duplicate column name: contains multiple '
                           'columns where names are empty strings or '
                           'whitespace')
@@ -73,11 +204,13 @@ def create_table(cursor, table, columns, default=''):
         # before execution is simpler than parsing the inevitable
         # OperationalError and re-raising it with a modified message.
 
-    default = normalize_default(default)
-    column_defs = ['{0} DEFAULT {1}'.format(x, default) for x in columns]
-    column_defs = ', '.join(column_defs)
+    column_defs = ', '.join(get_column_defs(columns, default, types))
 
-    statement = 'CREATE TEMPORARY TABLE {0} ({1})'.format(table, column_defs)
+    if getattr(cursor.connection, 'temporary_tables', True):
+        statement = 'CREATE TEMPORARY TABLE {0} ({1})'
+    else:
+        statement = 'CREATE TABLE {0} ({1})'
+    statement = statement.format(table, column_defs)
     cursor.execute(statement)
 
 
@@ -90,7 +223,40 @@ def get_columns(cursor, table):
     return columns
 
 
-def insert_records(cursor, table, columns, records):
+class LoadCounter(object):
+    """Keeps a running count of inserted rows and the time spent
+    inserting them.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.rows = 0
+        self.seconds = 0.0
+
+    def add(self, rows, seconds):
+        self.rows += rows
+        self.seconds += seconds
+
+    @property
+    def rows_per_second(self):
+        """Average number of rows inserted per second."""
+        if not self.seconds:
+            return 0.0
+        return self.rows / float(self.seconds)
+
+    def __repr__(self):
+        return '<{0} rows={1} seconds={2:.3f} rows_per_second={3:.1f}>'.format(
+            self.__class__.__name__, self.rows, self.seconds, self.rows_per_second)
+
+
+load_counter = LoadCounter()  # <- Counts rows inserted by insert_records().
+
+
+def insert_records(cursor, table, columns, records, batch_size=INSERT_BATCH_SIZE):
+    """Insert *records* into *table* in batches of *batch_size*
+    records. Returns the number of records inserted.
+    """
     table = normalize_names(table)
     columns = normalize_names(columns)
     sql = 'INSERT INTO {0} ({1}) VALUES ({2})'.format(
@@ -98,8 +264,16 @@ def insert_records(cursor, table, columns, records):
         ', '.join(columns),
         ', '.join(['?'] * len(columns)),
     )
+    start_time = _timer()
+    total = 0
+    iterator = iter(records)
     try:
-        cursor.executemany(sql, records)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            cursor.executemany(sql, batch)
+            total += len(batch)
     except sqlite3.ProgrammingError as error:
         if 'incorrect number of bindings' in str(error).lower():
             msg = (
@@ -111,23 +285,117 @@ def insert_records(cursor, table, columns, records):
             error = sqlite3.ProgrammingError(msg)
             error.__cause__ = None
         raise error
+    finally:
+        load_counter.add(total, _timer() - start_time)
+    return total
 
 
-def alter_table(cursor, table, columns, default=''):
+def alter_table(cursor, table, columns, default='', types=None):
     existing_columns = set(normalize_names(get_columns(cursor, table)))
-    default = normalize_default(default)
+    column_defs = get_column_defs(columns, default, types)
 
-    for column in normalize_names(columns):
+    for column, column_def in zip(normalize_names(columns), column_defs):
         if column in existing_columns:
             continue
 
-        sql = 'ALTER TABLE {0} ADD COLUMN {1} DEFAULT {2}'
-        sql = sql.format(table, column, default)
+        sql = 'ALTER TABLE {0} ADD COLUMN {1}'
+        sql = sql.format(table, column_def)
 
         cursor.execute(sql)
         existing_columns.add(column)
 
 
+def get_index_statements(cursor, table):
+    """Returns list of SQL statements that create the indexes
+    defined for *table* (automatic indexes are not included).
+    """
+    cursor.execute('''
+        SELECT sql
+        FROM sqlite_master
+        WHERE type='index' AND tbl_name=? AND sql IS NOT NULL
+
+        UNION ALL
+
+        SELECT sql
+        FROM sqlite_temp_master
+        WHERE type='index' AND tbl_name=? AND sql IS NOT NULL
+    ''', (table, table))
+    return [x[0] for x in cursor.fetchall()]
+
+
+def get_index_names(cursor, table):
+    """Returns list of names of the indexes defined for *table*
+    (automatic indexes are not included).
+    """
+    cursor.execute('''
+        SELECT name
+        FROM sqlite_master
+        WHERE type='index' AND tbl_name=? AND sql IS NOT NULL
+
+        UNION ALL
+
+        SELECT name
+        FROM sqlite_temp_master
+        WHERE type='index' AND tbl_name=? AND sql IS NOT NULL
+    ''', (table, table))
+    return [x[0] for x in cursor.fetchall()]
+
+
+class deferred_indexes(object):
+    """Context manager that drops the indexes of an existing *table*
+    on entry and recreates them on exit. Building an index once after
+    inserting many records is faster than updating it row-by-row.
+    """
+    def __init__(self, cursor, table):
+        self.cursor = cursor
+        self.table = table
+        self.statements = []
+
+    def __enter__(self):
+        if table_exists(self.cursor, self.table):
+            self.statements = get_index_statements(self.cursor, self.table)
+            for name in get_index_names(self.cursor, self.table):
+                self.cursor.execute('DROP INDEX {0}'.format(normalize_names(name)))
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            for statement in self.statements:
+                self.cursor.execute(statement)
+
+
+class load_settings(object):
+    """Context manager to tune connection settings while loading
+    records (restores the original settings on exit).
+
+    Settings that can only be changed outside of a transaction
+    (like the journal mode) should be set when a connection is
+    created.
+    """
+    def __init__(self, cursor, cache_size=LOAD_CACHE_SIZE):
+        self.cursor = cursor
+        self.cache_size = cache_size
+        self.original = None
+
+    def _get_cache_sizes(self):
+        self.cursor.execute('PRAGMA main.cache_size')
+        main_size = self.cursor.fetchone()[0]
+        self.cursor.execute('PRAGMA temp.cache_size')
+        temp_size = self.cursor.fetchone()[0]
+        return main_size, temp_size
+
+    def _set_cache_sizes(self, main_size, temp_size):
+        self.cursor.execute('PRAGMA main.cache_size={0:d}'.format(main_size))
+        self.cursor.execute('PRAGMA temp.cache_size={0:d}'.format(temp_size))
+
+    def __enter__(self):
+        self.original = self._get_cache_sizes()
+        size = -abs(self.cache_size)  # <- Negative values are in KiB.
+        self._set_cache_sizes(size, size)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._set_cache_sizes(*self.original)
+
+
 def drop_table(cursor, table):
     table = normalize_names(table)
     cursor.execute('DROP TABLE IF EXISTS {0}'.format(table))
@@ -161,8 +429,14 @@ class savepoint(object):
 
 def load_data(cursor, table, *args, **kwds):
     """
-    load_data(cursor, table, columns, records, default='')
-    load_data(cursor, table, records, default='')
+    load_data(cursor, table, columns, records, default='', types=None)
+    load_data(cursor, table, records, default='', types=None)
+
+    If *types* is True, column types are inferred from the values of
+    all records (existing INTEGER and REAL columns are widened when
+    new values need a wider type). If *types* is a dictionary, it
+    maps column names to types (str, int, float, or SQLite type
+    names) and the types of any remaining columns are inferred.
     """
     try:
         records, = args
@@ -171,6 +445,7 @@ def load_data(cursor, table, *args, **kwds):
         columns, records = args
 
     default = kwds.pop('default', '')
+    types = kwds.pop('types', None)
     if kwds:
         msg = 'load_data() got unexpected keyword argument {0!r}'
         raise TypeError(msg.format(next(iter(kwds.keys()))))
@@ -199,11 +474,129 @@ def load_data(cursor, table, *args, **kwds):
     columns = list(columns)  # Make sure columns is a sequence.
 
     if isinstance(first_record, Mapping):
-        records = ([rec.get(c, '') for c in columns] for rec in records)
-
-    with savepoint(cursor):
-        if table_exists(cursor, table):
-            alter_table(cursor, table, columns, default=default)
+        if hasattr(first_record, '__missing__'):  # E.g., defaultdict.
+            records = ([rec.get(c, '') for c in columns] for rec in records)
         else:
-            create_table(cursor, table, columns, default=default)
-        insert_records(cursor, table, columns, records)
+            records = map_records(records, columns)
+
+    if not types:
+        with load_settings(cursor):
+            with savepoint(cursor):
+                if table_exists(cursor, table):
+                    alter_table(cursor, table, columns, default)
+                else:
+                    create_table(cursor, table, columns, default)
+                with deferred_indexes(cursor, table):
+                    insert_records(cursor, table, columns, records)
+        return  # <- EXIT!
+
+    # Types are inferred from every record so that a later value
+    # (like '007' after many integers) is never converted by the
+    # column's type affinity. Small loads are inferred in memory,
+    # larger loads are written to an untyped staging table first.
+    sample = list(islice(records, INFER_SAMPLE_SIZE))
+    found = [set() for _ in columns]
+    sample = list(collect_types(sample, found))
+    staged = len(sample) == INFER_SAMPLE_SIZE
+
+    with load_settings(cursor):
+        with savepoint(cursor):
+            if staged:
+                staging = new_table_name(cursor)
+                cursor.execute('CREATE TEMPORARY TABLE {0} ({1})'.format(
+                    staging, ', '.join(normalize_names(columns))))
+                records = collect_types(chain(sample, records), found)
+                insert_records(cursor, staging, columns, records)
+            else:
+                records = sample
+
+            declared = resolve_types(columns, found)
+            if isinstance(types, Mapping):
+                for column, value in types.items():
+                    declared[column] = normalize_type(value)
+
+            if table_exists(cursor, table):
+                alter_table(cursor, table, columns, default, declared)
+            else:
+                create_table(cursor, table, columns, default, declared)
+            with deferred_indexes(cursor, table):
+                widen_column_types(cursor, table, declared)
+                if staged:
+                    names = ', '.join(normalize_names(columns))
+                    cursor.execute('INSERT INTO {0} ({1}) SELECT {1} FROM {2}'.format(
+                        normalize_names(table), names, staging))
+                    drop_table(cursor, staging)
+                else:
+                    insert_records(cursor, table, columns, records)
+
+
+# Rank of column types that can be widened to hold other values.
+_widening_ranks = {'INTEGER': 0, 'REAL': 1, 'TEXT': 2}
+
+
+def widen_column_types(cursor, table, types):
+    """Rebuild *table* so that existing INTEGER or REAL columns use
+    the wider type given in the *types* dictionary (INTEGER columns
+    can be widened to REAL or TEXT and REAL columns to TEXT). This
+    keeps values loaded into an existing table from being converted
+    by a column affinity inferred from earlier loads.
+    """
+    cursor.execute('PRAGMA table_info({0})'.format(table))
+    table_info = cursor.fetchall()
+
+    column_defs = []
+    widened = False
+    for _, name, declared, _, default, _ in table_info:
+        current = (declared or '').upper()
+        wanted = types.get(name)
+        if (current in _widening_ranks and wanted in _widening_ranks
+                and _widening_ranks[wanted] > _widening_ranks[current]):
+            declared = wanted
+            widened = True
+        column_def = normalize_names(name)
+        if declared:
+            column_def += ' ' + declared
+        if default is not None:
+            column_def += ' DEFAULT ' + default
+        column_defs.append(column_def)
+
+    if not widened:
+        return  # <- EXIT!
+
+    temporary = table_exists_in_temp(cursor, table)
+    rebuilt = new_table_name(cursor)
+    if temporary:
+        statement = 'CREATE TEMPORARY TABLE {0} ({1})'
+    else:
+        statement = 'CREATE TABLE {0} ({1})'
+    cursor.execute(statement.format(rebuilt, ', '.join(column_defs)))
+    cursor.execute('INSERT INTO {0} SELECT * FROM {1}'.format(
+        rebuilt, normalize_names(table)))
+    drop_table(cursor, table)
+    cursor.execute('ALTER TABLE {0} RENAME TO {1}'.format(
+        rebuilt, normalize_names(table)))
+
+
+def map_records(records, columns):
+    """Convert an iterable of mapping *records* into sequences of
+    values ordered by *columns* (missing values default to '').
+    Records are converted with an itemgetter and only fall back to
+    per-column lookups when a record is missing some columns.
+    """
+    if not columns:
+        return ([] for rec in records)
+
+    getter = itemgetter(*columns)
+    if len(columns) == 1:
+        def convert(rec):
+            try:
+                return (getter(rec),)
+            except KeyError:
+                return [rec.get(c, '') for c in columns]
+    else:
+        def convert(rec):
+            try:
+                return getter(rec)
+            except KeyError:
+                return [rec.get(c, '') for c in columns]
+    return (convert(rec) for rec in records)
@@ -31,7 +31,9 @@ def _normalize_lazy(obj):
                               'be unique').format(cls_name))
 
         if is_series:
-            return IterItems(obj.iteritems())  # <- EXIT!
+            # The iteritems() method was removed in pandas 2.0.
+            items = getattr(obj, 'items', None) or obj.iteritems
+            return IterItems(items())  # <- EXIT!
 
         if is_dataframe:
             gen = ((x[0], x[1:]) for x in obj.itertuples())
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Apply requirements using a pool of worker processes.
+
+Element-wise requirements (predicate and set-membership requirements)
+are applied to chunks of elements and mapping data is partitioned by
+key. Results are merged in the order the chunks were read so that
+parallel validation produces the same differences and descriptions
+as serial validation.
+
+Where available, worker processes are started with the "fork" method
+so that requirements using lambdas or locally defined functions do
+not need to be pickled.
+"""
+import copy
+import multiprocessing
+from ._compatibility.collections import deque
+from ._compatibility.collections.abc import Mapping
+from ._compatibility.collections.abc import Sized
+from ._compatibility.itertools import islice
+from .difference import BaseDifference
+from ._deephash import KeyedSet
+from ._deephash import make_set
+from ._differencestore import dumps
+from ._differencestore import loads
+from ._normalize import normalize
+from ._query.query import BaseElement
+from ._utils import IterItems
+from ._utils import exhaustible
+from .requirements import GroupRequirement
+from .requirements import RequiredMapping
+from .requirements import RequiredPredicate
+from .requirements import RequiredSet
+from .requirements import RequiredSubset
+from .requirements import RequiredSuperset
+
+
+PARALLEL_CHUNK_SIZE = 1000  # Number of elements sent to a worker at a time.
+
+_SET_TYPES = (RequiredSet, RequiredSubset, RequiredSuperset)
+
+_worker_requirement = None  # Set in each worker process.
+
+
+def _init_worker(requirement):
+    global _worker_requirement
+    _worker_requirement = requirement
+
+
+def _check_elements(chunk):
+    """Worker function to check a chunk of elements, returns the
+    pickled list of differences.
+    """
+    differences, _ = _worker_requirement.check_group(chunk)
+    return dumps(list(differences))
+
+
+def _distinct_elements(chunk):
+    """Worker function to reduce a chunk of elements to its distinct
+    values (set requirements depend only on distinct values).
+    """
+    return make_set(chunk)
+
+
+def _check_items(items):
+    """Worker function to check a batch of key/value items, returns
+    a pickled 2-tuple of evaluated differences and a description.
+    """
+    requirement = _worker_requirement
+    if isinstance(requirement, RequiredMapping):
+        required = requirement.mapping
+        requirement = copy.copy(requirement)
+        requirement.mapping = dict(
+            (k, required[k]) for k, _ in items if k in required)
+
+    result = requirement.check_data(IterItems(items))
+    differences, description = result if result else ([], '')
+    evaluated = []
+    for key, diff in differences:
+        if not isinstance(diff, BaseDifference):
+            diff = list(diff)
+        evaluated.append((key, diff))
+    return dumps((evaluated, description))
+
+
+def _get_pool(workers, requirement):
+    try:
+        context = multiprocessing.get_context('fork')
+    except (AttributeError, ValueError):
+        context = multiprocessing  # <- Python 2 or fork is unavailable.
+    return context.Pool(workers, _init_worker, (requirement,))
+
+
+def _imap_ordered(pool, func, tasks, workers):
+    """Apply *func* to *tasks* and yield the results in task order.
+    No more than twice as many tasks as there are *workers* are
+    submitted at one time so that data is read as it is needed.
+    """
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.apply_async(func, (task,)))
+        if len(pending) > workers * 2:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _item_batches(items, size, keys_seen):
+    """Yield lists of key/value *items* containing approximately
+    *size* elements each (lazy values are evaluated so they can be
+    sent to worker processes). Keys are added to *keys_seen*.
+    """
+    batch = []
+    batch_size = 0
+    for key, value in items:
+        keys_seen.add(key)
+        if isinstance(value, BaseElement):
+            batch_size += 1
+        else:
+            if exhaustible(value):
+                value = list(value)
+            batch_size += len(value) if isinstance(value, Sized) else 1
+        batch.append((key, value))
+        if batch_size >= size:
+            yield batch
+            batch = []
+            batch_size = 0
+    if batch:
+        yield batch
+
+
+def _merge_descriptions(descriptions, inconsistent):
+    descriptions = set(descriptions)
+    if len(descriptions) == 1:
+        return descriptions.pop()
+    return inconsistent
+
+
+def _check_items_parallel(requirement, items, workers):
+    keys_seen = set()
+    tasks = _item_batches(items, PARALLEL_CHUNK_SIZE, keys_seen)
+
+    differences = []
+    descriptions = []
+    pool = _get_pool(workers, requirement)
+    try:
+        for result in _imap_ordered(pool, _check_items, tasks, workers):
+            diffs, desc = loads(result)
+            if diffs:
+                differences.extend(diffs)
+                descriptions.append(desc)
+    finally:
+        pool.terminate()
+        pool.join()
+
+    if isinstance(requirement, RequiredMapping):
+        # Check for expected keys that are missing from items.
+        missing = dict((k, v) for k, v in IterItems(requirement.mapping)
+                       if k not in keys_seen)
+        if missing:
+            requirement = copy.copy(requirement)
+            requirement.mapping = missing
+            diffs, desc = requirement.check_items([])
+            differences.extend(diffs)
+            descriptions.append(desc)
+        inconsistent = 'does not satisfy mapping requirements'
+    else:
+        inconsistent = ''
+
+    return differences, _merge_descriptions(descriptions, inconsistent)
+
+
+def _check_group_parallel(requirement, group, workers):
+    tasks = _chunks(group, PARALLEL_CHUNK_SIZE)
+    pool = _get_pool(workers, requirement)
+    try:
+        if isinstance(requirement, _SET_TYPES):
+            distinct = set()
+            results = _imap_ordered(pool, _distinct_elements, tasks, workers)
+            for result in results:
+                if isinstance(result, KeyedSet) and \
+                        not isinstance(distinct, KeyedSet):
+                    distinct = KeyedSet(distinct)
+                distinct.update(result)
+            return requirement.check_group(distinct)  # <- EXIT!
+
+        differences = []
+        for result in _imap_ordered(pool, _check_elements, tasks, workers):
+            differences.extend(loads(result))
+    finally:
+        pool.terminate()
+        pool.join()
+
+    _, description = requirement.check_group([])
+    return differences, description
+
+
+def apply_requirement(requirement, data, workers):
+    """Apply *requirement* to *data* using a pool of *workers*
+    processes and return a normalized result (as returned when
+    calling the requirement directly). Requirements that can not
+    be partitioned are applied in the current process.
+    """
+    data = normalize(data, lazy_evaluation=True)
+    if isinstance(data, Mapping):
+        data = IterItems(data)
+
+    if isinstance(data, IterItems):
+        if isinstance(requirement, (GroupRequirement, RequiredMapping)):
+            result = _check_items_parallel(requirement, data, workers)
+            return requirement._normalize(result)  # <- EXIT!
+    elif not isinstance(data, BaseElement):
+        if isinstance(requirement, (RequiredPredicate,) + _SET_TYPES):
+            result = _check_group_parallel(requirement, data, workers)
+            return requirement._normalize(result)  # <- EXIT!
+
+    return requirement(data)
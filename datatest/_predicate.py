@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
+import operator
 import re
+import threading
 from ._compatibility.builtins import *
 from ._compatibility import abc
+from ._compatibility.functools import partial
+from ._utils import CacheInfo
+from ._utils import LRUCache
 from ._utils import regex_types
 from .difference import BaseDifference
 
@@ -36,20 +41,6 @@ class MatcherTuple(MatcherBase, tuple):
     pass
 
 
-def _check_type(type_, value):
-    """Return true if *value* is an instance of the specified type
-    or if *value* is the specified type.
-    """
-    return value is type_ or isinstance(value, type_)
-
-
-def _check_callable(func, value):
-    """Return true if func(value) returns is true or if *func* is
-    *value*.
-    """
-    return value is func or func(value)
-
-
 def _check_wildcard(value):
     """Always returns true."""
     return True
@@ -98,11 +89,13 @@ def _get_matcher_parts(obj):
     value). Return None if *obj* can be matched with the "==" operator
     and requires no other special handling.
     """
+    # Handlers for types, callables, and regular expressions inline
+    # their checks to avoid an extra function call for every value.
     if isinstance(obj, type):
-        pred_handler = lambda x: _check_type(obj, x)
+        pred_handler = lambda x: x is obj or isinstance(x, obj)
         repr_string = getattr(obj, '__name__', repr(obj))
     elif callable(obj):
-        pred_handler = lambda x: _check_callable(obj, x)
+        pred_handler = lambda x: x is obj or obj(x)
         repr_string = getattr(obj, '__name__', repr(obj))
     elif obj is Ellipsis:
         pred_handler = _check_wildcard  # <- Matches everything.
@@ -114,7 +107,12 @@ def _get_matcher_parts(obj):
         pred_handler = _check_falsy
         repr_string = 'False'
     elif isinstance(obj, regex_types):
-        pred_handler = lambda x: _check_regex(obj, x)
+        search = obj.search
+        def pred_handler(x):
+            try:
+                return search(x) is not None
+            except TypeError:
+                return _check_regex(obj, x)  # <- Raises formatted error.
         repr_string = 're.compile({0!r})'.format(obj.pattern)
     elif isinstance(obj, set):
         pred_handler = lambda x: _check_set(obj, x)
@@ -156,6 +154,107 @@ def get_matcher(obj):
     return _get_matcher_or_original(obj)
 
 
+def _compile_tuple(matcher):
+    """Return a function that compares values with the MatcherTuple
+    *matcher* using a single flat loop--handler functions are called
+    directly, other elements are compared the same way tuple elements
+    are compared (identity, then equality), and wildcard positions
+    are skipped.
+    """
+    size = len(matcher)
+    checks = []
+    for index, item in enumerate(matcher):
+        if item.__class__ is MatcherObject:
+            if item._func is _check_wildcard:
+                continue  # <- Wildcards match any value.
+            checks.append((index, item._func, None))
+        else:
+            checks.append((index, None, item))
+
+    def match_tuple(value):
+        if value.__class__ is not tuple:
+            if not isinstance(value, tuple) or isinstance(value, MatcherBase):
+                return matcher == value  # <- EXIT! (Use normal comparison.)
+
+        if len(value) != size:
+            return False
+
+        for index, check, item in checks:
+            if check is None:
+                element = value[index]
+                if not (element is item or item == element):
+                    return False
+            elif not check(value[index]):
+                return False
+        return True
+
+    return match_tuple
+
+
+def get_match_function(obj):
+    """Return a function of one argument that returns the same result
+    as comparing the matcher for *obj* with the "==" operator. The
+    matcher is compiled once into a specialized function so that
+    values can be checked without dispatching through the matcher's
+    __eq__() method.
+    """
+    matcher = get_matcher(obj)
+    if matcher.__class__ is MatcherObject:
+        return matcher._func
+    if matcher.__class__ is MatcherTuple:
+        return _compile_tuple(matcher)
+    return partial(operator.eq, matcher)
+
+
+def _cache_key(value):
+    """Return a key for *value* that includes its type (so that 1,
+    1.0, and True make different keys). Tuples are keyed using the
+    types of their elements. If *value* is unhashable, the returned
+    key will also be unhashable.
+    """
+    if isinstance(value, tuple):
+        return (value.__class__, tuple(_cache_key(x) for x in value))
+    return (value.__class__, value)
+
+
+_NOT_FOUND = object()
+
+
+class _PredicateCache(object):
+    """A least-recently-used cache of up to *maxsize* match results
+    that can be shared between threads (see LRUCache).
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._cache = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def __call__(self, function, value):
+        """Return function(value), using a cached result when *value*
+        has already been checked. Unhashable values are not cached.
+        """
+        key = _cache_key(value)
+        with self._lock:
+            try:
+                result = self._cache.get(key, _NOT_FOUND)
+            except TypeError:
+                self._cache.misses += 1
+                key = None  # <- Unhashable, not cached.
+                result = _NOT_FOUND
+        if result is not _NOT_FOUND:
+            return result  # <- EXIT!
+
+        result = function(value)
+        if key is not None:
+            with self._lock:
+                self._cache.put(key, result)
+        return result
+
+    def info(self):
+        with self._lock:
+            return self._cache.info()
+
+
 class Predicate(object):
     """A Predicate is used like a function of one argument that
     returns ``True`` when applied to a matching value and ``False``
@@ -274,26 +373,73 @@ class Predicate(object):
           File "<input>", line 1, in <module>
             pred.__name__
         AttributeError: 'Predicate' object has no attribute '__name__'
+
+    If a *cache_size* is given, the results for up to that many
+    distinct values are kept in a least-recently-used cache so that
+    values which repeat are only checked once. This is useful when
+    matching is expensive (like parsing dates or fuzzy matching) and
+    data contains many repeated values. Values are cached by type
+    and value (so ``1`` and ``1.0`` are checked separately) and
+    unhashable values are not cached. Only use a cache when the
+    result depends on the value alone::
+
+        >>> def is_date(x):
+        ...     try:
+        ...         datetime.datetime.strptime(x, '%Y-%m-%d')
+        ...     except ValueError:
+        ...         return False
+        ...     return True
+        ...
+        >>> pred = Predicate(is_date, cache_size=1024)
+
+    Predicates created from another predicate share its cache unless
+    a new *cache_size* is given.
     """
-    def __init__(self, obj, name=None):
+    def __init__(self, obj, name=None, cache_size=None):
         if isinstance(obj, Predicate):
             self.obj = obj.obj
             self.matcher = obj.matcher
+            self._match = obj._match
             self._inverted = obj._inverted
+            self._cache = obj._cache
             if hasattr(obj, '__name__'):
                 self.__name__ = obj.__name__
         else:
             self.obj = obj
             self.matcher = get_matcher(obj)
+            self._match = get_match_function(self.matcher)
             self._inverted = False
+            self._cache = None
 
         if name is not None:
             self.__name__ = name
 
+        if cache_size:
+            self._cache = _PredicateCache(cache_size)
+
     def __call__(self, other):
+        if self._cache is None:
+            result = self._match(other)
+        else:
+            result = self._cache(self._match, other)
+
         if self._inverted:
-            return not self.matcher == other  # <- Do not change to "!=".
-        return self.matcher == other
+            return not result
+        return result
+
+    def cache_info(self):
+        """Return a named tuple of *hits*, *misses*, *maxsize*, and
+        *currsize* for the result cache (see the *cache_size*
+        argument). When caching is disabled, all values are zero::
+
+            >>> pred = Predicate(is_date, cache_size=1024)
+            >>> ...  # Run tests.
+            >>> pred.cache_info()
+            CacheInfo(hits=9990, misses=10, maxsize=1024, currsize=10)
+        """
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._cache.info()
 
     def __invert__(self):
         new_pred = self.__class__(self)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Connection pools that provide SQLite connections for Select."""
+import os
+import sqlite3
+import threading
+
+
+class PersistentTableConnection(sqlite3.Connection):
+    """SQLite connection for databases that are shared by several
+    connections. Tables loaded through this connection are created
+    as regular tables (rather than temporary tables) so they are
+    visible to other connections.
+    """
+    temporary_tables = False
+
+
+class BaseConnectionPool(object):
+    """Base class for objects that provide SQLite connections and
+    keep track of user-defined functions registered with them.
+    """
+    def __init__(self):
+        self._functions = {}  # Maps function names to (narg, func).
+        self._lock = threading.Lock()
+
+    def get_connection(self):
+        """Return a connection appropriate for the current thread."""
+        raise NotImplementedError
+
+    def create_function(self, name, num_params, func):
+        """Register a user-defined function with all connections
+        provided by this pool.
+        """
+        with self._lock:
+            self._functions[name] = (num_params, func)
+        self.get_connection().create_function(name, num_params, func)
+
+    def get_functions(self):
+        """Return a dictionary that maps the names of registered
+        functions to ``(num_params, func)`` tuples.
+        """
+        with self._lock:
+            return dict(self._functions)
+
+
+class SingleConnectionPool(BaseConnectionPool):
+    """Pool that provides a single *connection* for all requests."""
+    def __init__(self, connection):
+        super(SingleConnectionPool, self).__init__()
+        self._connection = connection
+
+    def get_connection(self):
+        return self._connection
+
+
+class FileConnectionPool(BaseConnectionPool):
+    """Pool that provides one connection per thread to the database
+    file at *path*. The database is opened in WAL (write-ahead log)
+    mode so that readers in different threads can run concurrently.
+    """
+    def __init__(self, path, timeout=30.0):
+        super(FileConnectionPool, self).__init__()
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            factory=PersistentTableConnection,
+        )
+        connection.isolation_level = None  # <- Run in 'autocommit' mode.
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=OFF')
+        return connection
+
+    def get_connection(self):
+        local = self._local
+        connection = getattr(local, 'connection', None)
+        if connection is None:
+            connection = self._connect()
+            local.connection = connection
+            local.registered = set()
+
+        if len(local.registered) != len(self._functions):
+            with self._lock:
+                functions = list(self._functions.items())
+            for name, (num_params, func) in functions:
+                if name not in local.registered:
+                    connection.create_function(name, num_params, func)
+                    local.registered.add(name)
+        return connection
+
+    def create_function(self, name, num_params, func):
+        with self._lock:
+            self._functions[name] = (num_params, func)
+        self.get_connection()  # <- Registers function for current thread.
+
+
+_file_pools = {}
+_file_pools_lock = threading.Lock()
+
+
+def get_file_pool(path):
+    """Return the shared FileConnectionPool for the database at
+    *path* (creating it if necessary).
+    """
+    path = os.path.abspath(path)
+    with _file_pools_lock:
+        try:
+            return _file_pools[path]
+        except KeyError:
+            pool = FileConnectionPool(path)
+            _file_pools[path] = pool
+            return pool
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Index recommendations for Select based on observed queries."""
+import threading
+from .._compatibility.collections import Counter
+
+
+# Minimum number of rows a table must contain before indexes are
+# created automatically (indexes don't help small tables).
+AUTO_INDEX_MIN_ROWS = 1000
+
+
+def get_indexed_columns(cursor, table):
+    """Return a list of column-name tuples for the indexes that
+    exist on *table*.
+    """
+    cursor.execute('PRAGMA index_list({0})'.format(table))
+    index_names = [row[1] for row in cursor.fetchall()]
+
+    indexed = []
+    for name in index_names:
+        cursor.execute('PRAGMA index_info({0})'.format(name))
+        rows = sorted(cursor.fetchall())  # Sorted by position in index.
+        indexed.append(tuple(row[2] for row in rows))
+    return indexed
+
+
+def is_covered(columns, indexed_columns):
+    """Return True if *columns* are the leading columns of one of
+    the *indexed_columns* tuples.
+    """
+    length = len(columns)
+    return any(tuple(x[:length]) == columns for x in indexed_columns)
+
+
+class IndexAdvisor(object):
+    """Record the columns used to filter (WHERE), sort (ORDER BY),
+    and group (GROUP BY) a Select's queries.
+
+    When *threshold* is given, :meth:`record` returns True once a
+    set of columns has been used *threshold* times--the Select then
+    creates an index for these columns if its table has at least
+    *min_rows* rows.
+    """
+    def __init__(self, threshold=None, min_rows=AUTO_INDEX_MIN_ROWS):
+        self.threshold = threshold
+        self.min_rows = min_rows
+        self.usage = Counter()
+        self.indexed = set()  # Columns indexed automatically.
+        self._lock = threading.Lock()
+
+    def record(self, columns):
+        """Record a use of *columns* (a tuple of column names) and
+        return True if an index should be created for them.
+        """
+        with self._lock:
+            self.usage[columns] += 1
+            count = self.usage[columns]
+
+        if not self.threshold or columns in self.indexed:
+            return False
+        return count >= self.threshold
+
+    def recommendations(self, indexed_columns=()):
+        """Return a list of ``(columns, count)`` tuples ordered from
+        most to least used. Columns already covered by one of the
+        *indexed_columns* are omitted.
+        """
+        with self._lock:
+            items = list(self.usage.items())
+        items = [x for x in items if not is_covered(x[0], indexed_columns)]
+        return sorted(items, key=lambda x: (-x[1], x[0]))
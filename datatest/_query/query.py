@@ -7,6 +7,7 @@ try:
 except ImportError:
     sqlite3 = None  # Missing from Jython and Micropython.
 import sys
+import threading
 from glob import glob
 from numbers import Number
 
@@ -32,10 +33,18 @@ from .._utils import sortable
 from .._utils import exhaustible
 from .._utils import _make_sentinel
 from .._utils import _unique_everseen
+from .._utils import _timer
+from .._utils import CacheInfo
 from .._utils import file_types
 from .._utils import string_types
 from .._load.get_reader import get_reader
+from .._load.lazy_load import LazySource
+from .._load.lazy_load import add_columns
+from .._load.lazy_load import insert_source
+from .._load.lazy_load import load_columns
+from .._load.load_cache import load_cached
 from .._load.load_csv import load_csv
+from .._load.load_csv import read_csv_files
 from .._load.temptable import drop_table
 from .._load.temptable import load_data
 from .._load.temptable import new_table_name
@@ -44,6 +53,13 @@ from .._load.temptable import table_exists
 from .._predicate import MatcherObject
 from .._predicate import MatcherTuple
 from .._predicate import get_matcher
+from .._predicate import get_match_function
+from .._predicate import Predicate
+from .connections import SingleConnectionPool
+from .connections import get_file_pool
+from .index_advisor import IndexAdvisor
+from .index_advisor import get_indexed_columns
+from .result_cache import ResultCache
 
 try:
     FileNotFoundError  # New in Python 3.3.
@@ -56,10 +72,24 @@ except NameError:
 # is temporary, long-term integrity should not be a concern--in the
 # unlikely event of data corruption, it should be entirely acceptable
 # to simply rebuild the temporary tables.
+#
+# The rollback journals are kept in memory (rather than turned off
+# completely) because loading relies on rolling back savepoints when
+# a file must be reloaded using a fallback encoding.
 DEFAULT_CONNECTION = sqlite3.connect('')  # <- Using '' makes a temp file.
 DEFAULT_CONNECTION.execute('PRAGMA synchronous=OFF')
+DEFAULT_CONNECTION.execute('PRAGMA main.journal_mode=MEMORY')
+DEFAULT_CONNECTION.execute('PRAGMA temp.journal_mode=MEMORY')
 DEFAULT_CONNECTION.isolation_level = None  # <- Run in 'autocommit' mode.
+DEFAULT_POOL = SingleConnectionPool(DEFAULT_CONNECTION)
 _user_function_name_gen = ('FUNC{0}'.format(x) for x in itertools.count())
+_user_function_lock = threading.RLock()
+
+_lazy_load_lock = threading.Lock()
+
+# Maximum number of distinct column values for which where-clause
+# predicates are evaluated in advance (rather than once per row).
+DISTINCT_EVALUATION_LIMIT = 10000
 
 
 PY2 = sys.version_info[0] == 2
@@ -314,27 +344,150 @@ def _reduce_data(function, iterable, initializer_factory=None):
     return _apply_to_data(wrapper, iterable)
 
 
-def _filter_data(predicate, iterable):
+def _get_filter_function(predicate):
+    """Return a function of one argument that implements the given
+    filter *predicate*.
+    """
     if callable(predicate) and not isinstance(predicate, type):
-        function = predicate
-    else:
-        predicate = get_matcher(predicate)
-        if hasattr(predicate, '_func'):
-            function = predicate._func
-        else:
-            def function(x):
-                return predicate == x
+        return predicate
+
+    return get_match_function(predicate)
+
+
+def _filter_element_error(element):
+    return TypeError(('filter expects a collection of data elements, '
+                      'got 1 data element: {0}').format(element))
+
+
+def _filter_data(predicate, iterable):
+    function = _get_filter_function(predicate)
 
     def wrapper(iterable):
         if isinstance(iterable, BaseElement):
-            raise TypeError(('filter expects a collection of data elements, '
-                             'got 1 data element: {0}').format(iterable))
+            raise _filter_element_error(iterable)
         filtered_data = filter(function, iterable)
         return Result(filtered_data, _get_evaluation_type(iterable))
 
     return _apply_to_data(wrapper, iterable)
 
 
+_FILTERED_OUT = _make_sentinel(
+    'FilteredOutType',
+    '<filtered out>',
+    'Token returned by fused element functions for rejected elements.',
+)
+
+
+def _compile_element_steps(steps):
+    """Compile a sequence of element-wise ``(name, obj)`` *steps*
+    (where *name* is 'map', 'starmap', or 'filter') into a single
+    function of one argument. The returned function gives the final
+    value for an element or _FILTERED_OUT if the element was rejected
+    by a filter step.
+    """
+    function = None  # <- Identity (nothing left to apply).
+    for name, obj in reversed(steps):
+        function = _compile_element_step(name, obj, function)
+    return function or (lambda x: x)
+
+
+def _compile_element_step(name, obj, next_function):
+    """Return a function that applies a single step and then passes
+    its result to *next_function* (if given).
+    """
+    if name == 'map':
+        if next_function is None:
+            return obj
+        return lambda x: next_function(obj(x))
+
+    if name == 'starmap':
+        def starmap_function(x):
+            if isinstance(x, Iterable):
+                return obj(*x)
+            return obj(x)
+        if next_function is None:
+            return starmap_function
+        return lambda x: next_function(starmap_function(x))
+
+    if name == 'filter':
+        predicate = _get_filter_function(obj)
+        if next_function is None:
+            return lambda x: x if predicate(x) else _FILTERED_OUT
+        return lambda x: next_function(x) if predicate(x) else _FILTERED_OUT
+
+    raise ValueError('unrecognized element-wise step {0!r}'.format(name))
+
+
+class _FusedSteps(object):
+    """Consecutive element-wise query steps (map, starmap, and filter)
+    fused into a single per-element function so that each group of
+    data is processed with a single generator.
+    """
+    def __init__(self, steps):
+        self.steps = tuple(steps)
+        self._compiled = {}  # Compiled functions keyed by start position.
+
+    def _get_function(self, start):
+        try:
+            return self._compiled[start]
+        except KeyError:
+            function = _compile_element_steps(self.steps[start:])
+            self._compiled[start] = function
+            return function
+
+    def _apply_to_element(self, name, obj, element):
+        """Apply a single step to a group that is a data element."""
+        if name == 'map':
+            return obj(element)
+        if name == 'starmap':
+            if not isinstance(element, Iterable):
+                element = (element,)
+            return obj(*element)
+        raise _filter_element_error(element)
+
+    def __call__(self, group):
+        """Apply all steps to a single *group* of data."""
+        for position, (name, obj) in enumerate(self.steps):
+            if not isinstance(group, BaseElement):
+                break
+            group = self._apply_to_element(name, obj, group)
+        else:
+            return group  # <- EXIT! (Every step was applied.)
+
+        remaining = self.steps[position:]
+        evaluation_type = _get_evaluation_type(group)
+        if issubclass(evaluation_type, Set) \
+                and any(name != 'filter' for name, _ in remaining):
+            evaluation_type = list
+
+        function = self._get_function(position)
+        if any(name == 'filter' for name, _ in remaining):
+            iterable = (x for x in map(function, group) if x is not _FILTERED_OUT)
+        else:
+            iterable = map(function, group)
+        return Result(iterable, evaluation_type)
+
+    def __eq__(self, other):
+        if not isinstance(other, _FusedSteps):
+            return NotImplemented
+        return self.steps == other.steps
+
+    def __ne__(self, other):  # <- For Python 2.x compatibility.
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        func = lambda x: getattr(x, '__name__', repr(x))
+        steps = ('{0}({1})'.format(name, func(obj)) for name, obj in self.steps)
+        return 'fused[{0}]'.format(', '.join(steps))
+
+
+def _fused_data(fused_steps, iterable):
+    """Apply fused element-wise steps to the given *iterable*."""
+    return _apply_to_data(fused_steps, iterable)
+
+
 def _apply_data(function, data):
     """Group-wise function application."""
     return _apply_to_data(function, data)
@@ -561,6 +714,144 @@ def _parse_columns(columns):
     return key, value
 
 
+def _key_names(key):
+    """Return a tuple of column names for a *key* returned by
+    _parse_columns().
+    """
+    return (key,) if isinstance(key, string_types) else tuple(key)
+
+
+##########################################################
+# Functions to translate filter predicates into SQL terms.
+##########################################################
+
+def _is_sql_literal(value):
+    """Return True if *value* compares the same way in SQLite as it
+    does in Python (strings and numbers that SQLite can bind without
+    loss). Booleans are excluded because they are handled as special
+    predicates (truthy and falsy matching).
+    """
+    if isinstance(value, string_types):
+        return True
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return -2 ** 63 <= value < 2 ** 63  # <- 64-bit signed range.
+    if isinstance(value, float):
+        return value == value  # <- False for NaN values.
+    return False
+
+
+# Type checks added to pushed-down comparisons. Columns with a declared
+# type apply affinity conversions when comparing values (e.g., the
+# text '1' equals the integer 1 in an INTEGER column) so the storage
+# class is checked to keep the same behavior as Python's "==".
+_TEXT_TYPEOF = "typeof({0})='text'"
+_NUMBER_TYPEOF = "typeof({0}) IN ('integer', 'real')"
+
+
+def _get_sql_filter(column, obj):
+    """Return a 2-tuple containing an SQL expression and a list of
+    parameters that implement the predicate *obj* for the given
+    (escaped) *column* name. Returns None if *obj* cannot be
+    expressed in SQL with the same behavior as its Python
+    predicate.
+    """
+    if obj is True:
+        clause = ("CASE WHEN {0} IS NULL THEN 0 "
+                  "WHEN typeof({0}) IN ('integer', 'real') THEN +{0} != 0 "
+                  "ELSE length({0}) > 0 END")
+        return clause.format(column), []
+
+    if obj is False:
+        clause = ("CASE WHEN {0} IS NULL THEN 1 "
+                  "WHEN typeof({0}) IN ('integer', 'real') THEN +{0} = 0 "
+                  "ELSE length({0}) = 0 END")
+        return clause.format(column), []
+
+    if isinstance(obj, set):
+        if not all(_is_sql_literal(x) for x in obj):
+            return None
+        strings = [x for x in obj if isinstance(x, string_types)]
+        numbers = [x for x in obj if not isinstance(x, string_types)]
+        clauses = []
+        for values, typeof in [(strings, _TEXT_TYPEOF), (numbers, _NUMBER_TYPEOF)]:
+            if values:
+                qmarks = ', '.join('?' * len(values))
+                typeof = typeof.format(column)
+                clauses.append('({0} IN ({1}) AND {2})'.format(column, qmarks, typeof))
+        if not clauses:
+            return '0', []  # <- An empty set matches no values.
+        if len(clauses) > 1:
+            return '({0})'.format(' OR '.join(clauses)), strings + numbers
+        return clauses[0], strings + numbers
+
+    if _is_sql_literal(obj):
+        if isinstance(obj, string_types):
+            typeof = _TEXT_TYPEOF
+        else:
+            typeof = _NUMBER_TYPEOF
+        typeof = typeof.format(column)
+        return '({0}=? AND {1})'.format(column, typeof), [obj]
+
+    return None
+
+
+def _split_filter(columns, predicate):
+    """Split a filter *predicate* for the given normalized *columns*
+    selection into a part that can be handled by SQL and a residual
+    part that must still be handled in Python.
+
+    Returns a 2-tuple containing a tuple of ``(column, predicate)``
+    pairs (for use in an SQL WHERE clause) and a tuple of residual
+    predicates (empty if the predicate was fully translated).
+    """
+    if isinstance(columns, Mapping):
+        # Mappings are not handled because SQL would drop groups
+        # that Python filtering would keep as empty containers.
+        return (), (predicate,)
+
+    if isinstance(predicate, Predicate) and not predicate._inverted:
+        original = predicate
+        predicate = predicate.obj
+    else:
+        original = predicate
+
+    if callable(predicate) and not isinstance(predicate, type):
+        return (), (original,)  # <- EXIT!
+
+    if predicate is Ellipsis:
+        return (), ()  # <- EXIT! (Wildcard matches all elements.)
+
+    inner = next(iter(columns))
+    if isinstance(inner, string_types):
+        if _get_sql_filter(inner, predicate) is None:
+            return (), (original,)
+        return ((inner, predicate),), ()
+
+    if not isinstance(inner, tuple) \
+            or not isinstance(predicate, tuple) \
+            or len(predicate) != len(inner):
+        return (), (original,)
+
+    pushed = []
+    residual = []
+    for column, obj in zip(inner, predicate):
+        if obj is Ellipsis:
+            residual.append(obj)
+        elif _get_sql_filter(column, obj) is None:
+            residual.append(obj)
+        else:
+            pushed.append((column, obj))
+            residual.append(Ellipsis)
+
+    if all(x is Ellipsis for x in residual):
+        return tuple(pushed), ()
+    if not pushed:
+        return (), (original,)
+    return tuple(pushed), (tuple(residual),)
+
+
 ##################
 # Helper Functions
 ##################
@@ -588,6 +879,117 @@ def _get_step_repr(step):
     return '{0}, ({1}), {{{2}}}'.format(func_repr, args_repr, kwds_repr)
 
 
+def _count_rows(obj):
+    """Return the number of data elements in an evaluated result or
+    None if *obj* is not data (e.g., a method returned by a step).
+    """
+    if callable(obj):
+        return None
+    if isinstance(obj, Mapping):
+        count_group = lambda x: 1 if isinstance(x, BaseElement) else len(x)
+        return sum(count_group(x) for x in obj.values())
+    if isinstance(obj, BaseElement) or not isinstance(obj, Sized):
+        return 1
+    return len(obj)
+
+
+def _make_cache_key(obj):
+    """Return a hashable key that identifies *obj* for the result
+    cache. Lists, tuples, sets, and mappings are converted into
+    equivalent hashable forms and all values are paired with their
+    types (so 1 and 1.0 make different keys). Raises a TypeError
+    if *obj* contains other unhashable values.
+    """
+    if isinstance(obj, Mapping):
+        items = ((_make_cache_key(k), _make_cache_key(v)) for k, v in obj.items())
+        return (type(obj), frozenset(items))
+    if isinstance(obj, (list, tuple)):
+        return (type(obj), tuple(_make_cache_key(x) for x in obj))
+    if isinstance(obj, (set, frozenset)):
+        return (type(obj), frozenset(_make_cache_key(x) for x in obj))
+    hash(obj)  # <- Raises TypeError if obj is unhashable.
+    return (type(obj), obj)
+
+
+def _copy_cached_result(cached):
+    """Return a new result from a *cached* 2-tuple containing an
+    evaluation type and evaluated data. New containers are created
+    so that changes made by the caller do not alter the cache.
+    """
+    evaluation_type, data = cached
+    if evaluation_type is None:
+        return data  # <- EXIT! (Cached value is a single element.)
+
+    if issubclass(evaluation_type, Mapping):
+        def copy_group(value):
+            if isinstance(value, BaseElement):
+                return value
+            return Result(value, value.__class__)
+        items = DictItems((k, copy_group(v)) for k, v in data.items())
+        return Result(items, evaluation_type)
+    return Result(data, evaluation_type)
+
+
+class _CallCounter(object):
+    """Wrapper for a user-defined function that counts the number
+    of times the function is called.
+    """
+    def __init__(self, func, num_params):
+        self.func = func
+        self.num_params = num_params
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+        return self.func(*args)
+
+
+class _QueryAnalysis(object):
+    """Records the SQL statements executed by a Select and the number
+    of user-defined function calls made while a query is analyzed.
+    Functions are wrapped only for the given *connection* and only
+    until restore() is called.
+    """
+    def __init__(self, connection):
+        self.connection = connection
+        self.statements = []  # List of (statement, params) tuples.
+        self.counters = {}
+
+    def count_calls(self, name, num_params, func):
+        counter = _CallCounter(func, num_params)
+        self.connection.create_function(name, num_params, counter)
+        self.counters[name] = counter
+
+    def function_calls(self):
+        return sum(x.count for x in self.counters.values())
+
+    def restore(self):
+        for name, counter in self.counters.items():
+            self.connection.create_function(name, counter.num_params, counter.func)
+
+
+def _get_query_plan(cursor, statement, params, table):
+    """Return a list of ``(detail, is_table_scan)`` tuples describing
+    the query plan for *statement*. The *is_table_scan* value is True
+    when the plan reads every row of *table* while filtering, sorting,
+    or grouping in a way that an index could help with (conditions
+    that call user-defined functions can not use an index).
+    """
+    cursor.execute('EXPLAIN QUERY PLAN {0}'.format(statement), params)
+    details = [row[-1] for row in cursor.fetchall()]
+
+    uses_columns = any(x in statement for x in ('=?', ' IN (', 'ORDER BY', 'GROUP BY'))
+    plan = []
+    for detail in details:
+        words = detail.split()
+        is_table_scan = (uses_columns
+                         and words[:1] == ['SCAN']
+                         and table in words
+                         and 'INDEX' not in words)
+        plan.append((detail, is_table_scan))
+    return plan
+
+
 _query_step = namedtuple(
     typename='query_step',
     field_names=('name', 'args', 'kwds')
@@ -838,18 +1240,97 @@ class Query(object):
 
     @staticmethod
     def _optimize(execution_plan):
+        """Return an optimized execution plan or None if no
+        optimizations can be applied to the given *execution_plan*.
+        """
+        select_plan = Query._optimize_select(execution_plan)
+        fused_plan = Query._optimize_fusion(select_plan or execution_plan)
+        return fused_plan or select_plan
+
+    @staticmethod
+    def _optimize_fusion(execution_plan):
+        """Fuse consecutive element-wise steps (map, starmap, and
+        filter) anywhere in the *execution_plan* into single steps.
+        Returns None if the plan contains no steps to fuse.
+        """
+        step_names = {
+            _map_data: 'map',
+            _starmap_data: 'starmap',
+            _filter_data: 'filter',
+        }
+
+        def element_step(step):
+            function, args, kwds = step
+            name = step_names.get(function, None)
+            if name and args[1:] == (RESULT_TOKEN,) and not kwds:
+                return (name, args[0])
+            return None
+
+        optimized_plan = []
+        pending = []  # Element-wise steps waiting to be fused.
+
+        def flush():
+            if len(pending) > 1:
+                fused = _FusedSteps(element_step(x) for x in pending)
+                optimized_plan.append(
+                    _execution_step(_fused_data, (fused, RESULT_TOKEN), {}))
+            else:
+                optimized_plan.extend(pending)
+            del pending[:]
+
+        is_fused = False
+        for step in execution_plan:
+            if element_step(step):
+                pending.append(step)
+                continue
+            is_fused = is_fused or len(pending) > 1
+            flush()
+            optimized_plan.append(step)
+        is_fused = is_fused or len(pending) > 1
+        flush()
+
+        if is_fused:
+            return tuple(optimized_plan)
+        return None
+
+    @staticmethod
+    def _optimize_select(execution_plan):
         try:
             step_0 = execution_plan[0]
             step_1 = execution_plan[1]
-            step_2 = execution_plan[2]
-            remaining_steps = execution_plan[3:]
         except IndexError:
             return None  # <- EXIT!
 
         if step_0 != (getattr, (RESULT_TOKEN, '_select'), {}):
             return None  # <- EXIT!
 
-        if step_2[0] == _apply_to_data:
+        func_1, args_1, kwds_1 = step_1
+        remaining_steps = tuple(execution_plan[2:])
+
+        # Push leading filter steps down into the SQL WHERE clause. Any
+        # part of a predicate that cannot be expressed in SQL is kept as
+        # a residual filter step (to be applied in Python).
+        filters = []
+        residual_steps = []
+        while remaining_steps and remaining_steps[0][0] == _filter_data:
+            predicate = remaining_steps[0][1][0]
+            remaining_steps = remaining_steps[1:]
+            pushed, residual = _split_filter(args_1[0], predicate)
+            filters.extend(pushed)
+            for x in residual:
+                residual_step = _execution_step(_filter_data, (x, RESULT_TOKEN), {})
+                residual_steps.append(residual_step)
+        args_1 = args_1 + tuple(filters)  # <- Filters follow columns arg.
+        remaining_steps = tuple(residual_steps) + remaining_steps
+
+        try:
+            step_2 = remaining_steps[0]
+        except IndexError:
+            step_2 = None
+
+        if residual_steps:
+            optimized_steps = ()
+        elif step_2 and step_2[0] == _apply_to_data:
             func_dict = {
                 _sqlite_sum: 'SUM',
                 _sqlite_count: 'COUNT',
@@ -860,22 +1341,26 @@ class Query(object):
             py_function = step_2[1][0]
             sqlite_function = func_dict.get(py_function, None)
             if sqlite_function:
-                func_1, args_1, kwds_1 = step_1
                 args_1 = (sqlite_function,) + args_1  # <- Add SQL function
                 optimized_steps = (                   #    as 1st arg.
                     (getattr, (RESULT_TOKEN, '_select_aggregate'), {}),
                     (func_1, args_1, kwds_1),
                 )
+                remaining_steps = remaining_steps[1:]
             else:
                 optimized_steps = ()
         elif step_2 == (_sqlite_distinct, (RESULT_TOKEN,), {}):
             optimized_steps = (
                 (getattr, (RESULT_TOKEN, '_select_distinct'), {}),
-                step_1,
+                (func_1, args_1, kwds_1),
             )
+            remaining_steps = remaining_steps[1:]
         else:
             optimized_steps = ()
 
+        if not optimized_steps and filters:
+            optimized_steps = (step_0, (func_1, args_1, kwds_1))
+
         if optimized_steps:
             return optimized_steps + remaining_steps
         return None
@@ -888,6 +1373,10 @@ class Query(object):
             result = query.execute()  # <- Returns Result (iterator)
 
         Setting *optimize* to False turns-off query optimization.
+
+        If the source is a :class:`Select` created with a *cache_size*,
+        results are fully evaluated and saved so that running the same
+        query again returns the saved results.
         """
         if source:
             if self.source:
@@ -902,6 +1391,18 @@ class Query(object):
                 raise ValueError("missing 'source' argument, none found")
             result = self.source
 
+        cache = getattr(result, '_result_cache', None)
+        if cache is not None:
+            try:
+                cache_key = _make_cache_key(
+                    (self.args, self.kwds, self._query_steps))
+            except TypeError:
+                cache = None  # <- Query contains unhashable objects.
+            else:
+                is_cached, cached = cache.get(cache_key)
+                if is_cached:
+                    return _copy_cached_result(cached)  # <- EXIT!
+
         execution_plan = self._get_execution_plan(result, self._query_steps)
         if optimize:
             execution_plan = self._optimize(execution_plan) or execution_plan
@@ -914,6 +1415,16 @@ class Query(object):
             keywords = dict((k, replace_token(v)) for k, v in keywords.items())
             result = function(*args, **keywords)
 
+        if cache is not None:
+            if isinstance(result, Result):
+                cached = (result.evaluation_type, result.fetch())
+            elif isinstance(result, BaseElement) and not isinstance(result, Mapping):
+                cached = (None, result)
+            else:
+                return result  # <- EXIT! (Mutable result is not cached.)
+            cache.put(cache_key, cached)
+            return _copy_cached_result(cached)
+
         return result
 
     def fetch(self):
@@ -923,7 +1434,70 @@ class Query(object):
             return result.fetch()
         return result
 
-    def _explain(self, optimize=True, file=sys.stdout):
+    def _analyze(self, source, execution_plan):
+        """Execute *execution_plan* one step at a time and return a
+        list of dictionaries containing statistics for each step. The
+        result of each step is fully evaluated so that the time spent
+        by lazy iterators is counted towards the step that created
+        them.
+        """
+        if isinstance(source, Select):
+            analysis = source._begin_analysis()
+        else:
+            analysis = None
+
+        step_stats = []
+        result = source
+        rows_in = None
+        replace_token = lambda x: result if x is RESULT_TOKEN else x
+        try:
+            for step in execution_plan:
+                function, args, keywords = step  # Unpack 3-tuple.
+                function = replace_token(function)
+                args = tuple(replace_token(x) for x in args)
+                keywords = dict((k, replace_token(v)) for k, v in keywords.items())
+
+                if analysis:
+                    calls_before = analysis.function_calls()
+                    del analysis.statements[:]
+
+                start = _timer()
+                result = function(*args, **keywords)
+                if isinstance(result, Result):
+                    evaluation_type = result.evaluation_type
+                    evaluated = result.fetch()
+                    result = Result(evaluated, evaluation_type)
+                else:
+                    evaluated = result
+                seconds = _timer() - start
+
+                rows_out = _count_rows(evaluated)
+                stats = {
+                    'step': step,
+                    'seconds': seconds,
+                    'rows_in': rows_in,
+                    'rows_out': rows_out,
+                    'function_calls': 0,
+                    'statements': [],
+                }
+                if analysis:
+                    stats['function_calls'] = analysis.function_calls() - calls_before
+                    cursor = source._connection.cursor()
+                    for statement, params in analysis.statements:
+                        query_plan = _get_query_plan(
+                            cursor, statement, params, source._table)
+                        stats['statements'].append((statement, query_plan))
+                step_stats.append(stats)
+
+                if rows_out is not None:
+                    rows_in = rows_out
+        finally:
+            if analysis:
+                source._end_analysis()
+
+        return step_stats
+
+    def _explain(self, optimize=True, file=sys.stdout, analyze=False):
         """A convenience method primarily intended to help when
         debugging and developing execution plan optimizations.
 
@@ -931,6 +1505,13 @@ class Query(object):
         to stdout). If *optimize* is True, an optimized plan will
         be printed if one can be constructed.
 
+        If *analyze* is True, the query is executed and each step
+        is followed by its run time, the number of data elements it
+        received and returned, the number of calls made to Python
+        functions from SQLite, and the SQL statements it executed
+        along with their SQLite query plans (full table scans that
+        an index could help with are flagged).
+
         If *file* is set to None, returns execution plan as a string.
         """
         source = self.source
@@ -938,6 +1519,8 @@ class Query(object):
             source_repr = repr(source)
             if len(source_repr) > 70:
                 source_repr = source_repr[:67] + '...'
+        elif analyze:
+            raise ValueError("cannot analyze query, no data source found")
         else:
             source = Select([], fieldnames=['dummy_source'])
             source_repr = '<none given> (assuming Select object)'
@@ -949,13 +1532,36 @@ class Query(object):
             optimized_plan = self._optimize(execution_plan)
             if optimized_plan:
                 execution_plan = optimized_plan
-                optimized_text = ' (optimized)'
-
-        steps = [_get_step_repr(step) for step in execution_plan]
+                optimized_text = 'optimized'
+
+        if analyze:
+            steps = []
+            total_seconds = 0.0
+            for stats in self._analyze(source, execution_plan):
+                total_seconds += stats['seconds']
+                steps.append(_get_step_repr(stats['step']))
+                steps.append('  time: {0:.3f} ms, rows in: {1}, rows out: {2}, '
+                             'function calls: {3}'.format(
+                    stats['seconds'] * 1000,
+                    '-' if stats['rows_in'] is None else stats['rows_in'],
+                    '-' if stats['rows_out'] is None else stats['rows_out'],
+                    stats['function_calls'],
+                ))
+                for statement, query_plan in stats['statements']:
+                    steps.append('  sql: {0}'.format(' '.join(statement.split())))
+                    for detail, is_table_scan in query_plan:
+                        if is_table_scan:
+                            detail += '  <- full table scan (consider an index)'
+                        steps.append('    {0}'.format(detail))
+            steps.append('total time: {0:.3f} ms'.format(total_seconds * 1000))
+        else:
+            steps = [_get_step_repr(step) for step in execution_plan]
         steps = '\n'.join('  {0}'.format(step) for step in steps)
 
+        labels = [x for x in (optimized_text, analyze and 'analyzed') if x]
+        plan_text = ' ({0})'.format(', '.join(labels)) if labels else ''
         formatted = 'Data Source:\n  {0}\nExecution Plan{1}:\n{2}'
-        formatted = formatted.format(source_repr, optimized_text, steps)
+        formatted = formatted.format(source_repr, plan_text, steps)
 
         if file:
             file.write(formatted)
@@ -1079,11 +1685,54 @@ class Select(object):
     Load multple files using a shell-style wildcard::
 
         select = datatest.Select('*.csv')
+
+    By default, data is loaded into a temporary database that can
+    only be queried from the thread where it was created. If a
+    *database* keyword is given, data is loaded into the SQLite file
+    at the given path instead. This database is opened in WAL mode
+    with one connection per thread so that queries can be run
+    concurrently from multiple threads (Selects using the same path
+    share their connections)::
+
+        select = datatest.Select('*.csv', database='mydata.sqlite3')
+
+    The columns used to filter, sort, and group queries are recorded
+    and can be reviewed with :meth:`recommend_indexes`. If an
+    *auto_index* keyword is given, an index is created automatically
+    for columns once they have been used *auto_index* times (only
+    for tables with at least 1000 rows)::
+
+        select = datatest.Select('*.csv', auto_index=10)
+
+    If a *cache_size* keyword is given, the results of up to that many
+    queries are kept in memory and repeated queries return the saved
+    results instead of being executed again. Queries are matched by
+    their columns, where-keywords, and query steps--functions are
+    matched by identity so they should not depend on outside state.
+    The cache is cleared when new data is loaded (see
+    :meth:`cache_info`)::
+
+        select = datatest.Select('*.csv', cache_size=128)
     """
+    _analysis = None  # Set to a _QueryAnalysis while analyzing a query.
+    _result_cache = None  # Set to a ResultCache when caching is enabled.
+    _lazy_sources = None  # Set to a list of LazySource objects when lazy.
+    _row_count = None  # Number of rows in the table (cached by _record_usage).
+
     def __init__(self, objs=None, *args, **kwds):
         """Initialize self."""
-        self._connection = DEFAULT_CONNECTION
+        database = kwds.pop('database', None)
+        if database:
+            self._pool = get_file_pool(database)
+        else:
+            self._pool = DEFAULT_POOL
+        self._index_advisor = IndexAdvisor(threshold=kwds.pop('auto_index', None))
+        cache_size = kwds.pop('cache_size', None)
+        if cache_size:
+            self._result_cache = ResultCache(cache_size)
         self._user_function_dict = dict()  # User-defined SQLite functions.
+        self._match_clause_dict = dict()  # Pre-evaluated predicates.
+        self._match_tables = []  # Tables of pre-evaluated matches.
         self._table = None  # Table name.
         self._obj_strings = []  # Strings for repr().
         if objs:
@@ -1112,7 +1761,47 @@ class Select(object):
 
             select = datatest.Select('myfile1.csv')
             select.load_data(['myfile2.csv', 'myfile3.csv'])
+
+        If a *cache_dir* keyword is given, files loaded by path are
+        saved as SQLite cache files in the given directory and later
+        loads of unchanged files (same path, size, modification time,
+        and loading arguments) are read from the cache instead of
+        being re-parsed::
+
+            select = datatest.Select('*.csv', cache_dir='.datatest_cache')
+
+        If a *workers* keyword greater than 1 is given, CSV files loaded
+        by path are parsed in parallel using a pool of worker processes
+        (rows are still inserted into the database by the current
+        process and in the order the files are given)::
+
+            select = datatest.Select('*.csv', workers=8)
+
+        If a *types* keyword is given, columns are stored with declared
+        types so that numeric values are returned as numbers rather
+        than strings. When *types* is True, types are inferred from the
+        values of each loaded object (values like ``'007'`` that would
+        change when converted are left as text). A dictionary of column
+        names and types (str, int, or float) can be given to override
+        the inferred type of individual columns::
+
+            select = datatest.Select('myfile.csv', types={'zipcode': str})
+
+        If a *lazy* keyword is True, only the field names are read when
+        data is loaded. Rows are loaded when the Select is first queried
+        and only the columns used by the query are loaded--other columns
+        are added when they are first used. Lazy loading is supported for
+        file paths and lists of records (which are read again when new
+        columns are needed). Once a Select is lazy, all of its later loads
+        are lazy too::
+
+            select = datatest.Select('wide_file.csv', lazy=True)
         """
+        cache_dir = kwds.pop('cache_dir', None)
+        workers = kwds.pop('workers', None)
+        types = kwds.pop('types', None)
+        lazy = kwds.pop('lazy', False)
+
         if isinstance(objs, string_types):
             obj_list = glob(objs)  # Get shell-style wildcard matches.
             if not obj_list:
@@ -1124,27 +1813,119 @@ class Select(object):
         else:
             obj_list = objs
 
-        cursor = self._connection.cursor()
-        with savepoint(cursor):
-            table = self._table or new_table_name(cursor)
-            for obj in obj_list:
-                if ((
-                        isinstance(obj, string_types)
-                        and obj.lower().endswith('.csv')
-                    ) or (
-                        isinstance(obj, file_types)
-                        and getattr(obj, 'name', '').lower().endswith('.csv')
-                    )
-                ):
-                    load_csv(cursor, table, obj, *args, **kwds)
-                else:
-                    reader = get_reader(obj, *args, **kwds)
-                    load_data(cursor, table, reader)
+        if lazy or self._lazy_sources is not None:
+            if cache_dir or workers or types:
+                msg = 'lazy loading does not support cache_dir, workers, or types'
+                raise ValueError(msg)
+            self._load_lazy(obj_list, *args, **kwds)
+            return  # <- EXIT!
+
+        # When using workers, get parsed rows for CSV paths.
+        parallel_paths = []
+        if workers and workers > 1 and not cache_dir:
+            parallel_paths = [obj for obj in obj_list
+                              if isinstance(obj, string_types)
+                              and obj.lower().endswith('.csv')]
+            if len(parallel_paths) < 2:
+                parallel_paths = []
+        if parallel_paths:
+            parsed_files = read_csv_files(parallel_paths, workers, *args, **kwds)
+        else:
+            parsed_files = iter([])
 
-                self._append_obj_string(obj)
+        cursor = self._connection.cursor()
+        try:
+            with savepoint(cursor):
+                table = self._table or new_table_name(cursor)
+                for obj in obj_list:
+                    if cache_dir and isinstance(obj, string_types):
+                        load_cached(cursor, table, cache_dir, obj, *args,
+                                    types=types, **kwds)
+                    elif parallel_paths and obj in parallel_paths:
+                        rows = next(parsed_files)
+                        default = kwds.get('restval', '')
+                        load_data(cursor, table, rows, default=default,
+                                  types=types)
+                    elif ((
+                            isinstance(obj, string_types)
+                            and obj.lower().endswith('.csv')
+                        ) or (
+                            isinstance(obj, file_types)
+                            and getattr(obj, 'name', '').lower().endswith('.csv')
+                        )
+                    ):
+                        load_csv(cursor, table, obj, *args, types=types, **kwds)
+                    else:
+                        reader = get_reader(obj, *args, **kwds)
+                        load_data(cursor, table, reader, types=types)
+
+                    self._append_obj_string(obj)
+        finally:
+            if parallel_paths:
+                parsed_files.close()  # <- Shuts down worker processes.
 
         if not self._table and table_exists(cursor, table):
             self._table = table
+        self._clear_match_clauses()
+        self._row_count = None
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def _load_lazy(self, obj_list, *args, **kwds):
+        """Add the objects in *obj_list* as lazily loaded sources. If
+        rows have already been loaded, rows from the new sources are
+        loaded immediately (using only the columns loaded so far).
+        """
+        sources = [LazySource(obj, *args, **kwds) for obj in obj_list]
+        with _lazy_load_lock:
+            if self._lazy_sources is None:
+                self._lazy_sources = []
+                self._lazy_columns = []
+
+            if self._table:
+                cursor = self._connection.cursor()
+                with savepoint(cursor):
+                    for source in sources:
+                        source.row_count = insert_source(
+                            cursor, self._table, source, self._lazy_columns)
+            self._lazy_sources.extend(sources)
+
+        for obj in obj_list:
+            self._append_obj_string(obj)
+        self._clear_match_clauses()
+        self._row_count = None
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def _require_columns(self, columns):
+        """Make sure the given *columns* are loaded into the table
+        (only needed when the Select is lazy).
+        """
+        if self._lazy_sources is None:
+            return  # <- EXIT!
+
+        fieldnames = self.fieldnames
+        with _lazy_load_lock:
+            missing = [x for x in _unique_everseen(columns)
+                       if x in fieldnames and x not in self._lazy_columns]
+            if not missing:
+                return  # <- EXIT!
+
+            cursor = self._connection.cursor()
+            with savepoint(cursor):
+                if self._table:
+                    add_columns(cursor, self._table, self._lazy_sources, missing)
+                else:
+                    table = new_table_name(cursor)
+                    load_columns(cursor, table, self._lazy_sources, missing)
+                    self._table = table
+                    self._row_count = None
+            self._lazy_columns.extend(missing)
+
+    @property
+    def _connection(self):
+        """The SQLite connection to use in the current thread."""
+        return self._pool.get_connection()
 
     def _append_obj_string(self, obj):
         """Get string for *obj*, limit to one line, and append to list."""
@@ -1175,6 +1956,10 @@ class Select(object):
     @property
     def fieldnames(self):
         """A list of field names used by the data source."""
+        if self._lazy_sources is not None:
+            fieldnames = (x.fieldnames for x in self._lazy_sources)
+            return list(_unique_everseen(itertools.chain(*fieldnames)))
+
         cursor = self._connection.cursor()
         cursor.execute('PRAGMA table_info({0})'.format(self._table))
         return [x[1] for x in cursor]
@@ -1226,12 +2011,12 @@ class Select(object):
             __tracebackhide__ = True
             raise
 
-    def _execute_query(self, select_clause, trailing_clause=None, **kwds_filter):
+    def _execute_query(self, select_clause, trailing_clause=None, *filters, **kwds_filter):
         """Execute query and return cursor object."""
         try:
             # Build select-query.
             stmnt = 'SELECT {0} FROM {1}'.format(select_clause, self._table)
-            where_clause, params = self._build_where_clause(kwds_filter)
+            where_clause, params = self._build_where_clause(kwds_filter, filters)
             if where_clause:
                 stmnt = '{0} WHERE {1}'.format(stmnt, where_clause)
             if trailing_clause:
@@ -1240,6 +2025,8 @@ class Select(object):
             # Execute query.
             cursor = self._connection.cursor()
             cursor.execute(stmnt, params)
+            if self._analysis is not None:
+                self._analysis.statements.append((stmnt, params))
 
         except Exception as e:
             exc_cls = e.__class__
@@ -1248,15 +2035,21 @@ class Select(object):
 
         return cursor
 
-    def _build_where_clause(self, where_dict):
+    def _build_where_clause(self, where_dict, filters=()):
         """Return SQL 'WHERE' clause that implements *where* keyword
-        constraints.
+        constraints. The optional *filters* should be an iterable of
+        ``(column, predicate)`` pairs whose predicates can be expressed
+        directly in SQL (as determined by :func:`_split_filter`).
         """
+        filters = list(filters)
+        self._require_columns(list(where_dict.keys()) + [x[0] for x in filters])
+
         clause = []
         params = []
         items = where_dict.items()
         items = sorted(items, key=lambda x: x[0])  # Ordered by key.
         for key, val in items:
+            self._record_usage((key,))
             if isinstance(val, Set):
                 clause.append('{key} IN ({qmarks})'.format(
                     key=key,
@@ -1264,25 +2057,132 @@ class Select(object):
                 ))
                 params.extend(val)
             elif callable(val) and not isinstance(val, type):
-                func_name = self._get_user_function(val)
-                clause.append('{0}({1})'.format(func_name, key))
+                clause.append(self._get_predicate_clause(key, val))
             else:
                 pred = get_matcher(val)
                 if isinstance(pred, MatcherObject):
-                    func_name = self._get_user_function(pred._func, keyref=val)
-                    clause.append('{0}({1})'.format(func_name, key))
+                    clause.append(self._get_predicate_clause(key, pred._func, val))
                 elif isinstance(pred, MatcherTuple):
-                    def func(x):
-                        return pred == x
-                    func_name = self._get_user_function(func, keyref=val)
-                    clause.append('{0}({1})'.format(func_name, key))
+                    func = get_match_function(pred)
+                    clause.append(self._get_predicate_clause(key, func, val))
                 else:
                     clause.append(key + '=?')
                     params.append(val)
 
+        for column, obj in filters:
+            self._record_usage((column,))
+            column = self._escape_field_name(column)
+            filter_clause, filter_params = _get_sql_filter(column, obj)
+            clause.append(filter_clause)
+            params.extend(filter_params)
+
         clause = ' AND '.join(clause) if clause else ''
         return clause, params
 
+    def _get_predicate_clause(self, column, func, keyref=None):
+        """Return an SQL expression that selects rows where *func*
+        returns True for the value in *column*.
+
+        When the column has no more than DISTINCT_EVALUATION_LIMIT
+        distinct values, *func* is called once per distinct value and
+        the matching values are saved in a table so the expression
+        can use an indexed "IN (SELECT ...)" subquery. Otherwise, the
+        expression calls *func* for every row as a user-defined
+        function.
+        """
+        if not keyref:
+            keyref = func
+
+        try:
+            cache_key = (column, keyref)
+            hash(cache_key)
+        except TypeError:
+            cache_key = (column, id(keyref))
+
+        with _user_function_lock:
+            try:
+                _, match_clause = self._match_clause_dict[cache_key]
+            except KeyError:
+                match_clause = self._build_match_clause(column, func)
+                # Keep *keyref* with its clause so that its id (or
+                # hash) can not be reused by a different predicate.
+                self._match_clause_dict[cache_key] = (keyref, match_clause)
+
+        if match_clause:
+            return match_clause
+        func_name = self._get_user_function(func, keyref=keyref)
+        return '{0}({1})'.format(func_name, column)
+
+    def _build_match_clause(self, column, func):
+        """Evaluate *func* for each distinct value in *column* and
+        return an "IN (SELECT ...)" expression for the matching
+        values. Returns None if there are too many distinct values or
+        if the values can not be evaluated independently of the rows
+        that contain them.
+        """
+        if not self._table:
+            return None
+
+        cursor = self._connection.cursor()
+        cursor.execute('SELECT DISTINCT {0}, typeof({0}) FROM {1} LIMIT ?'.format(
+            column, self._table), (DISTINCT_EVALUATION_LIMIT + 1,))
+        values = [row[0] for row in cursor.fetchall()]
+        if len(values) > DISTINCT_EVALUATION_LIMIT:
+            return None  # <- EXIT!
+
+        results = dict()
+        for value in values:
+            try:
+                result = bool(func(value))
+            except Exception:
+                return None  # <- EXIT! (Let SQLite report error for row.)
+
+            # Values that SQLite treats as equal (like 1 and 1.0)
+            # can not be told apart by the subquery.
+            if results.get(value, result) != result:
+                return None  # <- EXIT!
+            results[value] = result
+
+        match_table = new_table_name(cursor)
+        if getattr(cursor.connection, 'temporary_tables', True):
+            statement = 'CREATE TEMPORARY TABLE {0} (value PRIMARY KEY)'
+        else:
+            statement = 'CREATE TABLE {0} (value PRIMARY KEY)'
+        cursor.execute(statement.format(match_table))
+
+        matches = [(k,) for k, v in results.items() if v and k is not None]
+        statement = 'INSERT OR IGNORE INTO {0} VALUES (?)'.format(match_table)
+        cursor.executemany(statement, matches)
+        self._match_tables.append(match_table)
+
+        match_clause = '{0} IN (SELECT value FROM {1})'.format(column, match_table)
+        if results.get(None):
+            match_clause = '({0} OR {1} IS NULL)'.format(match_clause, column)
+        return match_clause
+
+    def _clear_match_clauses(self):
+        """Remove saved predicate matches (must be called when new
+        data is loaded).
+        """
+        with _user_function_lock:
+            self._match_clause_dict.clear()
+            match_tables = self._match_tables
+            self._match_tables = []
+
+        cursor = self._connection.cursor()
+        locked_tables = []
+        for match_table in match_tables:
+            try:
+                drop_table(cursor, match_table)
+            except sqlite3.OperationalError:
+                # Table is locked by an unfinished query, try
+                # again the next time matches are cleared.
+                locked_tables.append(match_table)
+
+        if locked_tables:
+            with _user_function_lock:
+                self._match_tables.extend(locked_tables)
+
     def _get_user_function(self, func, keyref=None):
         """Returns SQLite user-defined function name. If *keyref* is
         provided, it is used to generate the lookup-key for fetching
@@ -1297,11 +2197,12 @@ class Select(object):
         except TypeError:
             func_key = id(keyref)
 
-        try:
-            return self._user_function_dict[func_key]
-        except KeyError:
-            self._create_user_function(func, func_key)
-            return self._user_function_dict[func_key]
+        with _user_function_lock:
+            try:
+                return self._user_function_dict[func_key]
+            except KeyError:
+                self._create_user_function(func, func_key)
+                return self._user_function_dict[func_key]
 
     def _create_user_function(self, func, func_key=None):
         """Register *func* with the SQLite connection using an
@@ -1324,8 +2225,27 @@ class Select(object):
                 return _func(x)
 
         func_name = next(_user_function_name_gen)
-        self._connection.create_function(func_name, 1, func)  # <- Register!
+        self._pool.create_function(func_name, 1, func)  # <- Register!
         self._user_function_dict[func_key] = func_name
+        if self._analysis is not None:
+            self._analysis.count_calls(func_name, 1, func)
+
+    def _begin_analysis(self):
+        """Start recording SQL statements and counting calls to
+        user-defined functions (used by Query._explain()).
+        """
+        analysis = _QueryAnalysis(self._connection)
+        for name, (num_params, func) in self._pool.get_functions().items():
+            analysis.count_calls(name, num_params, func)
+        self._analysis = analysis
+        return analysis
+
+    def _end_analysis(self):
+        """Stop recording and restore the original user-defined
+        functions.
+        """
+        self._analysis.restore()
+        self._analysis = None
 
     def _format_result_group(self, columns, cursor):
         outer_type = type(columns)
@@ -1393,12 +2313,13 @@ class Select(object):
         value_columns = (value,) if isinstance(value, str) else  tuple(value)
         self._assert_fields_exist(key_columns)
         self._assert_fields_exist(value_columns)
+        self._require_columns(key_columns + value_columns)
         key_columns = tuple(self._escape_field_name(x) for x in key_columns)
         value_columns = tuple(self._escape_field_name(x) for x in value_columns)
 
         return key_columns, value_columns
 
-    def _select(self, columns, **where):
+    def _select(self, columns, *filters, **where):
         key, value = _parse_columns(columns)
         key_columns, value_columns = self._parse_key_value(key, value)
 
@@ -1407,26 +2328,28 @@ class Select(object):
             select_clause = 'DISTINCT ' + select_clause
 
         if key:
+            self._record_usage(_key_names(key))
             order_by = 'ORDER BY {0}'.format(', '.join(key_columns))
         else:
             order_by = None
-        cursor = self._execute_query(select_clause, order_by, **where)
+        cursor = self._execute_query(select_clause, order_by, *filters, **where)
         return self._format_results(columns, cursor)
 
-    def _select_distinct(self, columns, **where):
+    def _select_distinct(self, columns, *filters, **where):
         key, value = _parse_columns(columns)
         key_columns, value_columns = self._parse_key_value(key, value)
 
         all_columns = ', '.join(key_columns + value_columns)
         select_clause = 'DISTINCT {0}'.format(all_columns)
         if key:
+            self._record_usage(_key_names(key))
             order_by = 'ORDER BY {0}'.format(', '.join(key_columns))
         else:
             order_by = None
-        cursor = self._execute_query(select_clause, order_by, **where)
+        cursor = self._execute_query(select_clause, order_by, *filters, **where)
         return self._format_results(columns, cursor)
 
-    def _select_aggregate(self, sqlfunc, columns, **where):
+    def _select_aggregate(self, sqlfunc, columns, *filters, **where):
         key, value = _parse_columns(columns)
         key_columns, value_columns = self._parse_key_value(key, value)
 
@@ -1438,10 +2361,11 @@ class Select(object):
         value_columns = tuple('{0}({1})'.format(sqlfunc, x) for x in value_columns)
         select_clause = ', '.join(key_columns + value_columns)
         if key:
+            self._record_usage(_key_names(key))
             group_by = 'GROUP BY {0}'.format(', '.join(key_columns))
         else:
             group_by = None
-        cursor = self._execute_query(select_clause, group_by, **where)
+        cursor = self._execute_query(select_clause, group_by, *filters, **where)
         results =  self._format_results(columns, cursor)
 
         if isinstance(columns, Mapping):
@@ -1449,6 +2373,62 @@ class Select(object):
             return Result(results, evaluation_type=dict)
         return next(results)
 
+    def _record_usage(self, columns):
+        """Record that *columns* were used to filter, sort, or group
+        a query and create an index for them if the *auto_index*
+        threshold has been reached.
+        """
+        advisor = self._index_advisor
+        if not advisor.record(columns):
+            return  # <- EXIT!
+
+        if self._row_count is None:
+            cursor = self._connection.cursor()
+            cursor.execute('SELECT COUNT(*) FROM {0}'.format(self._table))
+            self._row_count = cursor.fetchone()[0]
+        if self._row_count < advisor.min_rows:
+            return  # <- EXIT! (Wait until more data is loaded.)
+
+        try:
+            self.create_index(*columns)
+        except LookupError:
+            pass  # Column does not exist (query will raise error).
+        advisor.indexed.add(columns)
+
+    def cache_info(self):
+        """Return a named tuple of *hits*, *misses*, *maxsize*, and
+        *currsize* for the result cache (see the *cache_size*
+        argument). When caching is disabled, all values are zero::
+
+            >>> select = datatest.Select('example.csv', cache_size=128)
+            >>> ...  # Run tests.
+            >>> select.cache_info()
+            CacheInfo(hits=25, misses=10, maxsize=128, currsize=10)
+        """
+        if self._result_cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._result_cache.info()
+
+    def recommend_indexes(self):
+        """Return a list of recommended indexes. Each item is a
+        2-tuple containing a tuple of column names and the number
+        of times these columns were used to filter, sort, or group
+        a query. Items are ordered from most to least used and
+        columns that already have an index are omitted::
+
+            >>> select = datatest.Select('example.csv')
+            >>> ...  # Run tests.
+            >>> select.recommend_indexes()
+            [(('A',), 12), (('A', 'B'), 3)]
+
+        The columns can be passed directly to :meth:`create_index`.
+        """
+        if not self._table:
+            return []
+        cursor = self._connection.cursor()
+        indexed_columns = get_indexed_columns(cursor, self._table)
+        return self._index_advisor.recommendations(indexed_columns)
+
     def create_index(self, *columns):
         """Create an index for specified columns---can speed up
         testing in many cases.
@@ -1473,8 +2453,11 @@ class Select(object):
                   a test suite's over-all performance.  Creating
                   several indexes before testing even begins could
                   lead to longer run times so use indexes with care.
+                  Use :meth:`recommend_indexes` to see which columns
+                  are used most often by your tests.
         """
         self._assert_fields_exist(columns)
+        self._require_columns(columns)
 
         # Build index name.
         whitelist = lambda col: ''.join(x for x in col if x.isalnum())
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Bounded cache of evaluated query results for Select."""
+import threading
+from .._utils import LRUCache
+
+
+_NOT_FOUND = object()
+
+
+class ResultCache(object):
+    """A least-recently-used cache holding up to *maxsize* results
+    that can be shared between threads (see LRUCache). The number of
+    cache hits and misses are counted so that the cache size can be
+    tuned (see :meth:`info`).
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._cache = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return a 2-tuple containing a boolean (True if *key* was
+        found) and the cached value (None if *key* was not found).
+        """
+        with self._lock:
+            value = self._cache.get(key, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            return False, None
+        return True, value
+
+    def put(self, key, value):
+        """Save *value* for *key*, evicting the least recently used
+        value if the cache is full.
+        """
+        with self._lock:
+            self._cache.put(key, value)
+
+    def clear(self):
+        """Remove all cached values (hit and miss counts are kept)."""
+        with self._lock:
+            self._cache.clear()
+
+    def info(self):
+        """Return a CacheInfo tuple of hits, misses, maxsize, and
+        currsize.
+        """
+        with self._lock:
+            return self._cache.info()
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""Compare sequences using Myers' O((N+M)D) difference algorithm.
+
+Unlike difflib.SequenceMatcher, no "junk" heuristics are used. Memory
+use is linear--the divide-and-conquer variant of the algorithm is used
+(each step finds the "middle snake" of an optimal path and then the
+parts before and after it are compared separately).
+
+Elements are compared by hash and equality (like SequenceMatcher) so
+elements must be hashable. Elements found in only one of the sequences
+can never match so they are removed before searching (as in GNU diff).
+
+The algorithm runs in O((N+M)D) time where D is the number of edits.
+To keep very different sequences from taking quadratic time, the
+search for each part is limited to _COST_LIMIT edits from each end.
+When a search reaches this limit, the part is split at the point
+furthest along any of the diagonals searched and each side is compared
+separately (like the "too expensive" heuristic used by GNU diff). This
+bounds the time to O((N+M) * min(D, _COST_LIMIT)). The edit script is
+the shortest possible when each part needs no more than twice
+_COST_LIMIT edits--otherwise it is valid but may be longer.
+"""
+
+
+_CHUNK_SIZE = 32  # Elements compared at a time when following a snake.
+
+_COST_LIMIT = 32  # Edits searched from each end before splitting a part.
+
+
+def _encode(a, b):
+    """Return lists of integer codes for the elements of *a* and *b*
+    (equal elements receive equal codes). Raises a TypeError if an
+    element is unhashable.
+    """
+    codes = {}
+    get_code = codes.setdefault
+    a = [get_code(x, len(codes)) for x in a]
+    b = [get_code(x, len(codes)) for x in b]
+    return a, b
+
+
+def _forward_snake(a, b, x, y, xstop, ystop):
+    """Return the furthest x reached by following equal elements
+    diagonally from (x, y). Chunks are compared first so that long
+    runs of equal elements are followed using list comparisons.
+    """
+    size = _CHUNK_SIZE
+    while x + size <= xstop and y + size <= ystop and \
+            a[x:x + size] == b[y:y + size]:
+        x += size
+        y += size
+    while x < xstop and y < ystop and a[x] == b[y]:
+        x += 1
+        y += 1
+    return x
+
+
+def _backward_snake(a, b, x, y, xstart, ystart):
+    """Return the smallest x reached by following equal elements
+    diagonally backward from (x, y).
+    """
+    size = _CHUNK_SIZE
+    while x - size >= xstart and y - size >= ystart and \
+            a[x - size:x] == b[y - size:y]:
+        x -= size
+        y -= size
+    while x > xstart and y > ystart and a[x - 1] == b[y - 1]:
+        x -= 1
+        y -= 1
+    return x
+
+
+def _middle_snake(a, alo, ahi, b, blo, bhi, max_cost):
+    """Return the start and end points (x0, y0, x1, y1) of the middle
+    snake of a shortest edit path between a[alo:ahi] and b[blo:bhi].
+
+    If the snake is not found within *max_cost* edits from each end,
+    the furthest point (x, y) reached by the forward or backward search
+    is returned as an empty snake (x, y, x, y).
+    """
+    n = ahi - alo
+    m = bhi - blo
+    delta = n - m
+    odd = delta % 2 == 1
+    max_cost = min(max_cost, (n + m + 1) // 2)
+
+    # Forward diagonals range over -d to d and backward diagonals over
+    # delta - d to delta + d (plus one on each side for lookups).
+    offset = max_cost + 1 + max(0, -delta)
+    size = 2 * max_cost + abs(delta) + 3
+    forward = [0] * size   # Furthest x on diagonal k (x - y).
+    backward = [0] * size  # Smallest x on diagonal k.
+    forward[offset + 1] = alo
+    backward[offset + delta - 1] = ahi
+
+    for d in range(max_cost + 1):
+        # Extend forward paths.
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]  # <- Move down (insertion).
+            else:
+                x = forward[offset + k - 1] + 1  # <- Move right (deletion).
+            y = x - alo - k + blo
+            x0, y0 = x, y
+            x = _forward_snake(a, b, x, y, ahi, bhi)
+            forward[offset + k] = x
+            if odd and delta - (d - 1) <= k <= delta + (d - 1):
+                if x >= backward[offset + k]:
+                    return x0, y0, x, x - alo - k + blo  # <- EXIT!
+
+        # Extend backward paths.
+        for k in range(delta - d, delta + d + 1, 2):
+            if k == delta + d or (k != delta - d and
+                                  backward[offset + k - 1] < backward[offset + k + 1]):
+                x = backward[offset + k - 1]  # <- Move up (insertion).
+            else:
+                x = backward[offset + k + 1] - 1  # <- Move left (deletion).
+            y = x - alo - k + blo
+            x1, y1 = x, y
+            x = _backward_snake(a, b, x, y, alo, blo)
+            backward[offset + k] = x
+            if not odd and -d <= k <= d:
+                if forward[offset + k] >= x:
+                    return x, x - alo - k + blo, x1, y1  # <- EXIT!
+
+    # Find the points furthest from the start (on forward diagonals)
+    # and from the end (on backward diagonals) that are in bounds.
+    d = max_cost
+    best_forward = None
+    for k in range(max(-d, -m), min(d, n) + 1, 2):
+        x = min(forward[offset + k], ahi)
+        y = x - alo - k + blo
+        if y <= bhi and (best_forward is None or x + y > sum(best_forward)):
+            best_forward = (x, y)
+
+    best_backward = None
+    for k in range(max(delta - d, -m), min(delta + d, n) + 1, 2):
+        x = max(backward[offset + k], alo)
+        y = x - alo - k + blo
+        if y >= blo and (best_backward is None or x + y < sum(best_backward)):
+            best_backward = (x, y)
+
+    if best_backward is None or (best_forward is not None and
+            sum(best_forward) - (alo + blo) > (ahi + bhi) - sum(best_backward)):
+        x, y = best_forward
+    else:
+        x, y = best_backward
+    return x, y, x, y
+
+
+def _matching_blocks(a, b):
+    """Return a list of (i, j, size) triples for the runs of elements
+    where a[i:i+size] == b[j:j+size] along an edit path (a shortest
+    path unless a part needed too many edits).
+    """
+    blocks = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+
+        # Match common prefix.
+        x = _forward_snake(a, b, alo, blo, ahi, bhi)
+        if x > alo:
+            blocks.append((alo, blo, x - alo))
+            blo += x - alo
+            alo = x
+
+        # Match common suffix.
+        x = _backward_snake(a, b, ahi, bhi, alo, blo)
+        if x < ahi:
+            blocks.append((x, bhi - (ahi - x), ahi - x))
+            bhi -= ahi - x
+            ahi = x
+
+        if alo == ahi or blo == bhi:
+            continue  # <- Remaining elements are all inserted or deleted.
+
+        x0, y0, x1, y1 = _middle_snake(a, alo, ahi, b, blo, bhi, _COST_LIMIT)
+        if (x0, y0) == (alo, blo) and (x1, y1) == (ahi, bhi):
+            continue  # <- Guard against dividing without progress.
+
+        if x1 > x0:
+            blocks.append((x0, y0, x1 - x0))
+        stack.append((alo, x0, blo, y0))
+        stack.append((x1, ahi, y1, bhi))
+
+    blocks.sort()
+
+    # Merge adjacent blocks.
+    merged = []
+    for i, j, size in blocks:
+        if merged:
+            i0, j0, size0 = merged[-1]
+            if i0 + size0 == i and j0 + size0 == j:
+                merged[-1] = (i0, j0, size0 + size)
+                continue
+        merged.append((i, j, size))
+    return merged
+
+
+def _discard_unmatched(a, b):
+    """Return the matching blocks of *a* and *b* after removing the
+    elements that appear in only one of the sequences (like GNU diff,
+    these can never match so they are removed before searching).
+    """
+    in_a = set(a)
+    in_b = set(b)
+    a_index = [i for i, x in enumerate(a) if x in in_b]
+    b_index = [j for j, x in enumerate(b) if x in in_a]
+    if len(a_index) == len(a) and len(b_index) == len(b):
+        return _matching_blocks(a, b)  # <- EXIT!
+
+    blocks = []
+    a_kept = [a[i] for i in a_index]
+    b_kept = [b[j] for j in b_index]
+    for i, j, size in _matching_blocks(a_kept, b_kept):
+        # Split blocks where discarded elements were removed.
+        start = 0
+        while start < size:
+            stop = size
+            if (a_index[i + stop - 1] - a_index[i + start] != stop - 1 - start
+                    or b_index[j + stop - 1] - b_index[j + start] != stop - 1 - start):
+                stop = start + 1
+                while (stop < size
+                       and a_index[i + stop] == a_index[i + stop - 1] + 1
+                       and b_index[j + stop] == b_index[j + stop - 1] + 1):
+                    stop += 1
+            blocks.append((a_index[i + start], b_index[j + start], stop - start))
+            start = stop
+    return blocks
+
+
+def get_opcodes(a, b):
+    """Return a list of 5-tuples describing how to turn sequence *a*
+    into sequence *b*. The tuples have the same form as those returned
+    by difflib.SequenceMatcher.get_opcodes(): (tag, i1, i2, j1, j2)
+    where tag is 'replace', 'delete', 'insert', or 'equal'. Raises a
+    TypeError if any element is unhashable.
+    """
+    a, b = _encode(a, b)
+    blocks = _discard_unmatched(a, b)
+    blocks.append((len(a), len(b), 0))
+
+    opcodes = []
+    i = j = 0
+    for ai, bj, size in blocks:
+        if i < ai and j < bj:
+            opcodes.append(('replace', i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(('delete', i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(('insert', i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            opcodes.append(('equal', ai, i, bj, j))
+    return opcodes
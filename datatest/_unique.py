@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Uniqueness checks for data that may not fit in memory.
+
+Two methods are provided--both yield the elements that repeat an
+earlier element in the same order as an in-memory check would:
+
+* partitioned_duplicates() writes elements to temporary files
+  (partitioned by hash) and checks one partition at a time.
+* bloom_duplicates() uses a Bloom filter to find candidate duplicates
+  and then reads the data again to confirm them exactly. Only the
+  candidates (true duplicates and a small fraction of false positives)
+  are held in memory.
+
+When elements are written to temporary files, they must be picklable
+and must compare equal to their unpickled copies.
+"""
+from __future__ import division
+
+import math
+import tempfile
+from operator import itemgetter
+from ._compatibility.collections.abc import Sized
+from ._deephash import deep_key
+from ._differencestore import DifferenceStore
+from ._differencestore import RecordWriter
+from ._differencestore import read_records
+from ._utils import exhaustible
+
+
+INITIAL_CAPACITY = 100000  # Bloom filter capacity when data is not sized.
+
+
+def _read_records(file):
+    """Yield the objects written to *file* by a RecordWriter."""
+    file.seek(0)
+    return read_records(file)
+
+
+def _partition_duplicates(file):
+    """Yield (position, element) records from one partition *file*
+    whose elements repeat an earlier element in the partition.
+    """
+    seen = set()
+    for position, element in _read_records(file):
+        key = deep_key(element)
+        if key in seen:
+            yield position, element
+        else:
+            seen.add(key)
+
+
+def partitioned_duplicates(iterable, partitions):
+    """Yield the elements of *iterable* that repeat an earlier element.
+    Elements are written to *partitions* temporary files (by hash) so
+    that only the distinct elements of one partition are held in memory
+    at a time.
+    """
+    files = [tempfile.TemporaryFile() for _ in range(partitions)]
+    results = DifferenceStore()
+    try:
+        writers = [RecordWriter(file) for file in files]
+        for position, element in enumerate(iterable):
+            index = hash(deep_key(element)) % partitions
+            writers[index].write((position, element))
+
+        # Store each partition's duplicates (one partition at a time).
+        for file in files:
+            results.extend(_partition_duplicates(file))
+            file.close()
+
+        for _, element in results.sorted(key=itemgetter(0)):
+            yield element
+    finally:
+        for file in files:
+            file.close()
+        results.close()
+
+
+class BloomFilter(object):
+    """A Bloom filter for up to *capacity* keys with a false positive
+    rate of approximately *error_rate*. Keys must be hashable.
+    """
+    def __init__(self, capacity, error_rate):
+        ln2 = math.log(2)
+        size = -capacity * math.log(error_rate) / (ln2 * ln2)
+        self.size = max(int(math.ceil(size)), 8)
+        self.hash_count = max(int(round(self.size / capacity * ln2)), 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _indexes(self, key):
+        # Use double hashing to derive hash_count indexes.
+        hash1 = hash(key)
+        hash2 = hash((key, 'datatest')) | 1
+        size = self.size
+        return [(hash1 + i * hash2) % size for i in range(self.hash_count)]
+
+    def __contains__(self, key):
+        bits = self._bits
+        for index in self._indexes(key):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def add(self, key):
+        """Add *key* to the filter. Returns True if the key may have
+        been added before or False if it was definitely not.
+        """
+        bits = self._bits
+        present = True
+        for index in self._indexes(key):
+            byte, bit = index >> 3, 1 << (index & 7)
+            if not bits[byte] & bit:
+                bits[byte] |= bit
+                present = False
+        if not present:
+            self.count += 1
+        return present
+
+
+class ScalableBloomFilter(object):
+    """A Bloom filter that grows as keys are added. When the current
+    filter reaches its capacity, a new filter with twice the capacity
+    and half the error rate is added--keeping the overall false
+    positive rate below *error_rate*.
+    """
+    def __init__(self, error_rate, initial_capacity=INITIAL_CAPACITY):
+        self.error_rate = error_rate
+        self.filters = [BloomFilter(initial_capacity, error_rate / 2.0)]
+
+    def add(self, key):
+        """Add *key* to the filter. Returns True if the key may have
+        been added before or False if it was definitely not.
+        """
+        filters = self.filters
+        for bloom in filters[:-1]:
+            if key in bloom:
+                return True  # <- EXIT!
+
+        current = filters[-1]
+        if current.count >= current.capacity:
+            if key in current:  # <- Check full filter before growing.
+                return True  # <- EXIT!
+            current = BloomFilter(current.capacity * 2, current.error_rate / 2.0)
+            filters.append(current)
+        return current.add(key)
+
+
+def bloom_duplicates(iterable, error_rate):
+    """Yield the elements of *iterable* that repeat an earlier element.
+    A Bloom filter with the given *error_rate* is used to find candidate
+    duplicates which are confirmed by reading the data again (exhaustible
+    iterables are written to a temporary file so they can be re-read).
+    """
+    if isinstance(iterable, Sized):
+        capacity = max(len(iterable), 1)
+    else:
+        capacity = INITIAL_CAPACITY
+
+    spool = tempfile.TemporaryFile() if exhaustible(iterable) else None
+    writer = RecordWriter(spool) if spool is not None else None
+    try:
+        bloom = ScalableBloomFilter(error_rate, capacity)
+        candidates = set()
+        for element in iterable:
+            key = deep_key(element)
+            if bloom.add(key):
+                candidates.add(key)
+            if writer is not None:
+                writer.write(element)
+
+        if not candidates:
+            return  # <- EXIT!
+
+        if spool is not None:
+            iterable = _read_records(spool)
+
+        seen = set()
+        for element in iterable:
+            key = deep_key(element)
+            if key in candidates:
+                if key in seen:
+                    yield element
+                else:
+                    seen.add(key)
+    finally:
+        if spool is not None:
+            spool.close()
@@ -3,12 +3,14 @@
 from __future__ import absolute_import
 import inspect
 import re
+import time
 from io import IOBase
 from numbers import Number
 from sys import version_info as _version_info
 
 from ._compatibility.abc import ABC
 from ._compatibility.builtins import callable
+from ._compatibility.collections import namedtuple
 from ._compatibility.collections.abc import ItemsView
 from ._compatibility.collections.abc import Iterable
 from ._compatibility.collections.abc import Mapping
@@ -18,6 +20,11 @@ from ._compatibility.itertools import filterfalse
 from ._compatibility.itertools import islice
 
 
+try:
+    _timer = time.perf_counter  # New in Python 3.3.
+except AttributeError:
+    _timer = time.time
+
 try:
     string_types = (basestring,)  # Removed in Python 3.0
 except NameError:
@@ -32,6 +39,102 @@ try:
 except (ImportError, NameError):
     file_types = (IOBase,)
 
+
+# Statistics returned by the cache_info() methods of cached objects.
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+_PREV, _NEXT, _KEY, _VALUE = 0, 1, 2, 3  # Names for LRUCache link fields.
+
+
+class LRUCache(object):
+    """A least-recently-used cache holding up to *maxsize* values.
+
+    Values are kept in a dictionary of links that also form a circular
+    doubly linked list (ordered from least to most recently used) so
+    that lookups and evictions take constant time. The number of hits
+    and misses are counted for :meth:`info`. The cache is not
+    thread-safe--objects that share a cache between threads must use
+    their own lock. Unhashable keys raise a TypeError.
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._links = {}
+        self._root = root = []  # <- Sentinel link of the circular list.
+        root[:] = [root, root, None, None]
+
+    def _move_to_end(self, link):
+        """Move *link* to the most recently used position."""
+        link_prev, link_next = link[_PREV], link[_NEXT]
+        link_prev[_NEXT] = link_next
+        link_next[_PREV] = link_prev
+        root = self._root
+        last = root[_PREV]
+        last[_NEXT] = root[_PREV] = link
+        link[_PREV] = last
+        link[_NEXT] = root
+
+    def get(self, key, default=None):
+        """Return the value for *key* (making it the most recently
+        used) or *default* if *key* is not in the cache.
+        """
+        link = self._links.get(key)
+        if link is None:
+            self.misses += 1
+            return default
+        self._move_to_end(link)
+        self.hits += 1
+        return link[_VALUE]
+
+    def put(self, key, value):
+        """Save *value* for *key*, evicting the least recently used
+        value if the cache is full.
+        """
+        if self.maxsize <= 0:
+            return  # <- EXIT!
+
+        link = self._links.get(key)
+        if link is not None:
+            link[_VALUE] = value
+            self._move_to_end(link)
+            return  # <- EXIT!
+
+        root = self._root
+        if len(self._links) >= self.maxsize:
+            # Reuse the root as the new link and make the least
+            # recently used link the new root.
+            oldroot = root
+            oldroot[_KEY] = key
+            oldroot[_VALUE] = value
+            self._root = root = oldroot[_NEXT]
+            del self._links[root[_KEY]]
+            root[_KEY] = root[_VALUE] = None
+            self._links[key] = oldroot
+        else:
+            last = root[_PREV]
+            link = [last, root, key, value]
+            last[_NEXT] = root[_PREV] = self._links[key] = link
+
+    def clear(self):
+        """Remove all cached values (hit and miss counts are kept)."""
+        self._links.clear()
+        root = self._root
+        root[:] = [root, root, None, None]
+
+    def __contains__(self, key):
+        return key in self._links
+
+    def __len__(self):
+        return len(self._links)
+
+    def info(self):
+        """Return a CacheInfo tuple of hits, misses, maxsize, and
+        currsize.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._links))
+
 regex_types = type(re.compile(''))
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import division
-import difflib
 import inspect
+import threading
 from math import isnan
 from numbers import Number
 from ._compatibility.builtins import *
@@ -12,28 +12,41 @@ from ._compatibility import contextlib
 from ._compatibility import functools
 from ._compatibility import itertools
 
+from ._utils import IterItems
 from ._utils import exhaustible
+from ._utils import iterpeek
 from ._utils import nonstringiter
+from ._fuzzy import fuzzy_match
 from ._predicate import MatcherBase
 from ._predicate import get_matcher
+from ._predicate import get_match_function
+from ._predicate import Predicate
 from ._utils import _get_arg_lengths
 from ._utils import _expects_multiple_params
 from ._utils import _make_decimal
+from ._utils import CacheInfo
 from ._utils import string_types
 from ._query.query import BaseElement
 
 from .validation import ValidationError
+from ._differencestore import DifferenceStore
+from ._differencestore import MappedDifferenceStore
 from .difference import BaseDifference
 from .difference import Missing
 from .difference import Extra
 from .difference import Invalid
 from .difference import Deviation
+from .difference import NOVALUE
+from .difference import _nan_to_token
 
 
 __datatest = True  # Used to detect in-module stack frames (which are
                    # omitted from output).
 
 
+_active = threading.local()  # Counts the acceptances entered in each thread.
+
+
 __all__ = [
     'accepted',
     'AcceptedDifferences',
@@ -184,31 +197,65 @@ class BaseAcceptance(abc.ABC):
 
         return dict((key, make_value(group)) for key, group in grouped)
 
+    @staticmethod
+    def _stored_items(iterable, store):
+        """Write items to a new store of the same type as *store*."""
+        if isinstance(store, Mapping):
+            new_store = MappedDifferenceStore(store.chunk_size)
+            new_store.extend_items(iterable)
+        else:
+            new_store = DifferenceStore(store.chunk_size)
+            new_store.extend(item[1] for item in iterable)
+        return new_store
+
+    @classmethod
+    def _built_differences(cls, stream, is_not_mapping):
+        """Return a container of differences from a *stream* of
+        serialized items.
+        """
+        differences = cls._deserialized_items(stream)
+        if is_not_mapping:
+            assert len(differences) == 1
+            differences = differences.popitem()[1]
+            if isinstance(differences, BaseDifference):
+                differences = [differences]
+        return differences
+
     def __enter__(self):
+        _active.depth = getattr(_active, 'depth', 0) + 1
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
+        _active.depth = max(getattr(_active, 'depth', 0) - 1, 0)
         if exc_type and not issubclass(exc_type, ValidationError):
             raise exc_value
 
-        differences = getattr(exc_value, 'differences', [])
-        is_not_mapping = not isinstance(differences, Mapping)
+        # When the error was raised by a nested acceptance, continue
+        # filtering its stream of items rather than its differences.
+        accepted_stream = getattr(exc_value, '_accepted_stream', None)
+        if accepted_stream and exc_value._deferred is not None:
+            stream, is_not_mapping = accepted_stream
+            exc_value._deferred = None  # <- Stream is consumed here.
+            exc_value._differences = []
+            is_stored = False
+        else:
+            differences = getattr(exc_value, 'differences', [])
+            is_not_mapping = not isinstance(differences, Mapping)
+            is_stored = isinstance(differences, DifferenceStore)
+            stream = self._serialized_items(differences)
 
-        stream = self._serialized_items(differences)
         stream = self._filterfalse(stream)
-        differences = self._deserialized_items(stream)
-
-        if not differences:
-            return True  # <- EXIT!
+        if is_stored:
+            differences = self._stored_items(stream, differences)
+            if not differences:
+                return True  # <- EXIT!
+        else:
+            first_item, stream = iterpeek(stream, NOVALUE)
+            if first_item is NOVALUE:
+                return True  # <- EXIT!
 
         __tracebackhide__ = True  # Set pytest flag to hide traceback.
 
-        if is_not_mapping:
-            assert len(differences) == 1
-            differences = differences.popitem()[1]
-            if isinstance(differences, BaseDifference):
-                differences = [differences]
-
         # Extend description with acceptance message.
         if self.msg:
             if exc_value.description:
@@ -218,8 +265,22 @@ class BaseAcceptance(abc.ABC):
         else:
             message = exc_value.description
 
-        # Build new ValidationError with remaining differences.
-        exc = ValidationError(differences, message)
+        # Build new ValidationError with remaining differences (any
+        # differences omitted from the original are still counted).
+        # Inside another acceptance, the differences are not built
+        # until needed so that the outer acceptance can continue
+        # filtering the same stream.
+        max_differences = exc_value._max_differences
+        if is_stored:
+            exc = ValidationError(differences, message, max_differences)
+        elif _active.depth > 0:
+            build = functools.partial(self._built_differences, stream, is_not_mapping)
+            exc = ValidationError._from_deferred(build, message, max_differences)
+            exc._accepted_stream = (stream, is_not_mapping)
+        else:
+            differences = self._built_differences(stream, is_not_mapping)
+            exc = ValidationError(differences, message, max_differences)
+        exc._omitted += exc_value._omitted
 
         # Re-raised error inherits truncation behavior of original.
         exc._should_truncate = exc_value._should_truncate
@@ -336,8 +397,9 @@ class AcceptedKeys(BaseAcceptance):
         super(AcceptedKeys, self).__init__(msg)
 
         matcher = get_matcher(predicate)
+        match = get_match_function(matcher)
         def function(x):
-            return matcher == x
+            return match(x)
         function.__name__ = repr(matcher)
 
         self.function = function
@@ -361,8 +423,9 @@ class AcceptedArgs(BaseAcceptance):
         super(AcceptedArgs, self).__init__(msg)
 
         matcher = get_matcher(predicate)
+        match = get_match_function(matcher)
         def function(x):
-            return matcher == x
+            return match(x)
         function.__name__ = repr(matcher)
 
         self.function = function
@@ -612,32 +675,159 @@ class AcceptedFuzzy(BaseAcceptance):
     Similarity measures are determined using the ratio() method
     of the difflib.SequenceMatcher class. The values range from
     1.0 (exactly the same) to 0.0 (completely different).
+
+    If a *cache_size* is given, results for up to that many distinct
+    pairs of invalid and expected values are cached.
     """
-    def __init__(self, cutoff=0.6, msg=None):
+    def __init__(self, cutoff=0.6, msg=None, cache_size=None):
         self.cutoff = cutoff
+        self.cache_size = cache_size
         super(AcceptedFuzzy, self).__init__(msg)
 
+        if cache_size:
+            self._cached_check = Predicate(self._check_similarity,
+                                           cache_size=cache_size)
+        else:
+            self._cached_check = None
+
     def __repr__(self):
         cls_name = self.__class__.__name__
         msg_part = ', msg={0!r}'.format(self.msg) if self.msg else ''
+        if self.cache_size:
+            msg_part = ', cache_size={0!r}{1}'.format(self.cache_size, msg_part)
         return '{0}(cutoff={1!r}{2})'.format(cls_name, self.cutoff, msg_part)
 
+    def _check_similarity(self, pair):
+        a, b = pair
+        return fuzzy_match(a, b, self.cutoff)
+
     def call_predicate(self, item):
         diff = item[1]
 
         try:
-            a = diff.invalid
-            b = diff.expected
+            pair = (diff.invalid, diff.expected)
         except AttributeError:
             return False  # <- EXIT!
 
-        try:
-            matcher = difflib.SequenceMatcher(a=a, b=b)
-            similarity = matcher.ratio()
-        except TypeError:
-            return False  # <- EXIT!
+        if self._cached_check is not None:
+            return self._cached_check(pair)
+        return self._check_similarity(pair)
+
+    def cache_info(self):
+        """Return a named tuple of *hits*, *misses*, *maxsize*, and
+        *currsize* for the result cache (see :meth:`Predicate.cache_info`).
+        """
+        if self._cached_check is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._cached_check.cache_info()
+
+
+def _difference_key(diff):
+    """Return a hashable key for *diff* that is equal for differences
+    that compare as equal (NaN values are replaced with a token the
+    same way BaseDifference.__eq__() does) or None if no key can be
+    made.
+    """
+    if not isinstance(diff, BaseDifference):
+        return None
+    key = (diff.__class__, tuple(_nan_to_token(x) for x in diff.args))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _DifferenceCounter(object):
+    """A multiset of differences that supports constant-time membership
+    tests and removals. Differences are counted by _difference_key()
+    and objects that can not be keyed are kept in a list and compared
+    by equality (like list.remove()).
+
+    Copies share their counts with the original and only track the
+    differences removed from them, so making a copy takes constant
+    time and each copy costs only as much as its removals.
+    """
+    def __init__(self, iterable=()):
+        self._counts = {}   # Maps keys to [count, difference] pairs.
+        self._removed = {}  # Maps keys to the number of removed differences.
+        self._others = []
+        self._counts_shared = False  # True when shared with a copy.
+        self._others_shared = False
+        for diff in iterable:
+            self.add(diff)
+
+    def copy(self):
+        new = self.__class__()
+        new._counts = self._counts
+        new._removed = dict(self._removed)
+        new._others = self._others
+        new._counts_shared = self._counts_shared = True
+        new._others_shared = self._others_shared = True
+        return new
+
+    def _unshare_others(self):
+        if self._others_shared:
+            self._others = list(self._others)
+            self._others_shared = False
+
+    def add(self, diff):
+        key = _difference_key(diff)
+        if key is None:
+            self._unshare_others()
+            self._others.append(diff)
+            return  # <- EXIT!
+
+        if self._counts_shared:
+            self._counts = dict((k, list(v)) for k, v in IterItems(self._counts))
+            self._counts_shared = False
+        if key in self._counts:
+            self._counts[key][0] += 1
+        else:
+            self._counts[key] = [1, diff]
 
-        return similarity >= self.cutoff
+    def _remaining(self, key):
+        return self._counts[key][0] - self._removed.get(key, 0)
+
+    def _find_key(self, diff):
+        """Return the key for an equal counted difference, NOVALUE if
+        an equal object is in the uncounted list, or None if there is
+        no equal object.
+        """
+        key = _difference_key(diff)
+        if key is not None and key in self._counts and self._remaining(key):
+            return key  # <- EXIT!
+
+        if diff in self._others:
+            return NOVALUE  # <- EXIT!
+
+        if key is None:
+            # Unkeyable objects may still equal a counted difference.
+            for other_key, (_, other) in IterItems(self._counts):
+                if other == diff and self._remaining(other_key):
+                    return other_key
+        return None
+
+    def __contains__(self, diff):
+        return self._find_key(diff) is not None
+
+    def remove(self, diff):
+        """Remove one difference equal to *diff*. Raises a ValueError
+        if there is no such difference.
+        """
+        key = self._find_key(diff)
+        if key is None:
+            raise ValueError('{0!r} not in allowance'.format(diff))
+
+        if key is NOVALUE:
+            self._unshare_others()
+            self._others.remove(diff)
+        else:
+            self._removed[key] = self._removed.get(key, 0) + 1
+
+    def __len__(self):
+        total = sum(count for count, _ in self._counts.values())
+        return total - sum(self._removed.values()) + len(self._others)
 
 
 class AcceptedDifferences(BaseAcceptance):
@@ -674,6 +864,7 @@ class AcceptedDifferences(BaseAcceptance):
                 and not hasattr(obj, 'remove')):
             obj = list(obj)
         self._obj = obj
+        self._allowance = None  # Counter of *obj* elements (built on first use).
 
     @property
     def priority(self):
@@ -696,6 +887,10 @@ class AcceptedDifferences(BaseAcceptance):
 
         raise Exception('unhandled scope: {0!r}'.format(scope))
 
+    def start_collection(self):
+        """Called first before any group or predicate checking."""
+        self._allowance = None
+
     def start_group(self, key):
         """Called before processing each group."""
         # Get current allowance object.
@@ -703,10 +898,13 @@ class AcceptedDifferences(BaseAcceptance):
         if isinstance(obj, Mapping):
             current_allowance = obj.get(key, [])
         elif nonstringiter(obj):
+            if self._allowance is None:
+                self._allowance = _DifferenceCounter(obj)
+
             if self._scope == 'whole':
-                current_allowance = obj  # Use a single persistent object.
+                current_allowance = self._allowance  # Use a single persistent object.
             else:
-                current_allowance = list(obj)  # Make a copy for each group.
+                current_allowance = self._allowance.copy()  # Make a copy for each group.
         else:
             current_allowance = obj
 
@@ -717,14 +915,15 @@ class AcceptedDifferences(BaseAcceptance):
             current_check = \
                 lambda x: current_allowance and isinstance(x, current_allowance[0])
         else:
-            if nonstringiter(current_allowance):
+            if isinstance(current_allowance, _DifferenceCounter):
+                default_scope = 'group'
+            elif nonstringiter(current_allowance):
                 default_scope = 'group'
-                if not hasattr(current_allowance, 'remove'):
-                    current_allowance = list(current_allowance)
+                current_allowance = _DifferenceCounter(current_allowance)
             else:
                 default_scope = 'element'
-                current_allowance = [current_allowance]
-            current_check = lambda x: x in current_allowance
+                current_allowance = _DifferenceCounter([current_allowance])
+            current_check = current_allowance.__contains__
 
         self._current_scope = self._scope or default_scope
         self._current_allowance = current_allowance
@@ -791,9 +990,11 @@ class AcceptedSpecific(BaseAcceptance):
         # Normalize and copy mutable containers, assign to "_accepted".
         diffs = self.differences
         if isinstance(diffs, BaseDifference):
-            accepted = defaultdict(lambda: [diffs])
+            counter = _DifferenceCounter([diffs])
+            accepted = defaultdict(counter.copy)
         elif isinstance(diffs, (list, set)):
-            accepted = defaultdict(lambda: list(diffs))
+            counter = _DifferenceCounter(diffs)
+            accepted = defaultdict(counter.copy)
         elif isinstance(diffs, dict):
             accepted = dict()
             for key, value in diffs.items():
@@ -802,9 +1003,9 @@ class AcceptedSpecific(BaseAcceptance):
                     self._predicate_keys[key]= matcher
 
                 if isinstance(value, (list, set)):
-                    accepted[key] = list(value)  # Make a copy.
+                    accepted[key] = _DifferenceCounter(value)  # Make a copy.
                 else:
-                    accepted[key] = [value]
+                    accepted[key] = _DifferenceCounter([value])
         else:
             raise TypeError(
                 'differences must be a list, dict, or a single difference, '
@@ -1004,10 +1205,11 @@ class AcceptedFactoryType(object):
         """
         return AcceptedArgs(predicate, msg)
 
-    def fuzzy(self, cutoff=0.6, msg=None):
+    def fuzzy(self, cutoff=0.6, msg=None, cache_size=None):
         """Accepted invalid strings that match their expected value
         with a similarity greater than or equal to *cutoff* (default
-        0.6).
+        0.6). If a *cache_size* is given, results for up to that many
+        distinct pairs of values are cached.
 
         Similarity measures are determined using the ratio() method of
         the difflib.SequenceMatcher class. The values range from 1.0
@@ -1025,7 +1227,7 @@ class AcceptedFactoryType(object):
             with accepted.fuzzy():
                 validate(data, requirement)
         """
-        return AcceptedFuzzy(cutoff=cutoff, msg=msg)
+        return AcceptedFuzzy(cutoff=cutoff, msg=msg, cache_size=cache_size)
 
     def tolerance(self, lower, upper=None, msg=None, **kwds):
         """accepted.tolerance(tolerance, /, msg=None, *, percent=False)
@@ -38,6 +38,8 @@ class DataTestCase(TestCase):
     available.
     """
     maxDiff = getattr(TestCase, 'maxDiff', 80 * 8)  # Uses default in 3.1 and 2.6.
+    maxDifferences = None  # Passed to validate() as max_differences.
+    validationWorkers = None  # Passed to validate() as workers.
 
     def _apply_validation(self, function, *args, **kwds):
         """Wrapper to call *function* (with given *args and **kwds)
@@ -46,6 +48,12 @@ class DataTestCase(TestCase):
         The *function* must be a callable object and it should pass
         silently or raise a ValidationError.
         """
+        if self.maxDifferences is not None:
+            kwds['max_differences'] = self.maxDifferences
+
+        if self.validationWorkers is not None:
+            kwds['workers'] = self.validationWorkers
+
         try:
             function(*args, **kwds)
         except ValidationError as err:
@@ -187,6 +195,12 @@ class DataTestCase(TestCase):
         __tracebackhide__ = _pytest_tracebackhide
         self._apply_validation(validate.set, data, requirement, msg=msg)
 
+    def assertValidStream(self, data, requirement, msg=None, chunk_size=None):
+        """Wrapper for :meth:`validate.stream`."""
+        __tracebackhide__ = _pytest_tracebackhide
+        self._apply_validation(validate.stream, data, requirement,
+                               msg=msg, chunk_size=chunk_size)
+
     def assertValidSubset(self, data, requirement, msg=None):
         """Wrapper for :meth:`validate.subset`."""
         __tracebackhide__ = _pytest_tracebackhide
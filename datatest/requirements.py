@@ -2,12 +2,13 @@
 """This module defines requirement classes used internally by datatest."""
 from __future__ import division
 
-import difflib
+import copy
+import sys
+from numbers import Integral
 from numbers import Number
 from types import FunctionType
 from ._compatibility.builtins import *
 from ._compatibility import abc
-from ._compatibility.collections.abc import Hashable
 from ._compatibility.collections.abc import Iterable
 from ._compatibility.collections.abc import Mapping
 from ._compatibility.collections.abc import Sequence
@@ -24,10 +25,18 @@ from .difference import Invalid
 from .difference import Missing
 from .difference import _make_difference
 from .difference import NOVALUE
+from ._deephash import deep_key
+from ._deephash import key_items
+from ._deephash import make_set
+from ._fuzzy import fuzzy_match
 from ._normalize import normalize
 from ._predicate import Predicate
 from ._query.query import BaseElement
+from ._sequencediff import get_opcodes
+from ._unique import bloom_duplicates
+from ._unique import partitioned_duplicates
 from ._utils import IterItems
+from ._utils import exhaustible
 from ._utils import iterpeek
 from ._utils import nonstringiter
 from ._utils import string_types
@@ -177,43 +186,6 @@ def required_set(requirement):
     return _required_set
 
 
-def _deephash(obj):
-    """Return a "deep hash" value for the given object. If the
-    object can not be deep-hashed, a TypeError is raised.
-    """
-    # Adapted from "deephash" Copyright 2017 Shawn Brown, Apache License 2.0.
-    already_seen = {}
-
-    def _hashable_proxy(obj):
-        if isinstance(obj, Hashable) and not isinstance(obj, tuple):
-            return obj  # <- EXIT!
-
-        # Guard against recursive references in compound objects.
-        obj_id = id(obj)
-        if obj_id in already_seen:
-            return already_seen[obj_id]  # <- EXIT!
-        else:
-            already_seen[obj_id] = object()  # Token for duplicates.
-
-        # Recurse into compound object to make hashable proxies.
-        if isinstance(obj, Sequence):
-            proxy = tuple(_hashable_proxy(x) for x in obj)
-        elif isinstance(obj, Set):
-            proxy = frozenset(_hashable_proxy(x) for x in obj)
-        elif isinstance(obj, Mapping):
-            items = ((k, _hashable_proxy(v)) for k, v in IterItems(obj))
-            proxy = frozenset(items)
-        else:
-            message = 'unhashable type: {0!r}'.format(obj.__class__.__name__)
-            raise TypeError(message)
-        return obj.__class__, proxy
-
-    try:
-        return hash(obj)
-    except TypeError:
-        return hash(_hashable_proxy(obj))
-
-
 def required_sequence(requirement):
     if not isinstance(requirement, Sequence):
         cls_name = requirement.__class__.__name__
@@ -228,14 +200,14 @@ def required_sequence(requirement):
                 iterable = list(iterable)  # <- Needs to be subscriptable.
 
             try:
-                matcher = difflib.SequenceMatcher(a=iterable, b=requirement)
+                opcodes = get_opcodes(iterable, requirement)
             except TypeError:
                 # Fall-back to slower "deep hash" only if needed.
-                data_proxy = tuple(_deephash(x) for x in iterable)
-                required_proxy = tuple(_deephash(x) for x in requirement)
-                matcher = difflib.SequenceMatcher(a=data_proxy, b=required_proxy)
+                data_keys = [deep_key(x) for x in iterable]
+                required_keys = [deep_key(x) for x in requirement]
+                opcodes = get_opcodes(data_keys, required_keys)
 
-            for tag, istart, istop, jstart, jstop in matcher.get_opcodes():
+            for tag, istart, istop, jstart, jstop in opcodes:
                 if tag == 'insert':
                     jvalues = sequence[jstart:jstop]
                     for value in jvalues:
@@ -443,7 +415,13 @@ class BaseRequirement(abc.ABC):
     """A class to check that the data fulfills a specific need
     or expectation. All requirement classes must inherit from
     BaseRequirement.
+
+    The *max_differences* attribute sets the number of differences
+    kept when validation fails (None keeps all differences). It is
+    used when no *max_differences* argument is given to validate().
     """
+    max_differences = None
+
     @abc.abstractmethod
     def check_data(self, data):
         raise NotImplementedError()
@@ -532,6 +510,99 @@ class ItemsRequirement(BaseRequirement):
         return self.check_items(data)
 
 
+def _get_numpy(data):
+    """Return the numpy module if *data* is a one-dimensional array
+    of booleans, numbers, or strings (an array whose elements can be
+    checked with vectorized operations) or else return None.
+    """
+    numpy = sys.modules.get('numpy', None)
+    if (numpy
+            and isinstance(data, numpy.ndarray)
+            and data.ndim == 1
+            and data.dtype.kind in 'biufUS'):
+        return numpy
+    return None
+
+
+def _has_nan(array, numpy):
+    return array.dtype.kind == 'f' and bool(numpy.isnan(array).any())
+
+
+def _get_pandas(data):
+    """Return the pandas module if *data* is a Series or DataFrame
+    with a unique index or else return None.
+    """
+    pandas = sys.modules.get('pandas', None)
+    if (pandas
+            and isinstance(data, (pandas.Series, pandas.DataFrame))
+            and data.index.is_unique):
+        return pandas
+    return None
+
+
+def _infer_dtype(column, pandas):
+    try:
+        infer_dtype = pandas.api.types.infer_dtype
+    except AttributeError:
+        return None  # <- EXIT! (Older versions of pandas.)
+    return infer_dtype(column, skipna=False)
+
+
+def _row_codes(frame, pandas):
+    """Return an array of integer codes for the rows of *frame* (a
+    Series or DataFrame)--rows with equal values share the same code.
+    Returns None if a column contains values that can not be reliably
+    grouped by value (e.g., containers, categories, or mixed types).
+    """
+    if isinstance(frame, pandas.Series):
+        columns = [frame]
+    else:
+        columns = [frame.iloc[:, i] for i in range(len(frame.columns))]
+
+    codes = None
+    for column in columns:
+        if (column.dtype.kind not in 'biufcmM'
+                and _infer_dtype(column, pandas) not in ('string', 'empty')):
+            return None
+
+        column_codes, uniques = pandas.factorize(column)
+        column_codes = column_codes + 1  # Shift missing-value code (-1) to 0.
+        if codes is None:
+            codes = column_codes
+        else:
+            combined = codes * (len(uniques) + 1) + column_codes
+            codes, _ = pandas.factorize(combined)
+    return codes
+
+
+def _failing_rows(requirement, frame, pandas):
+    """Return the rows of *frame* that do not satisfy *requirement*
+    (a group requirement whose result for each row depends only on
+    the row's values). The requirement is checked once for each
+    distinct row and the results are mapped back to the rows with
+    matching values. Returns None if the rows can not be grouped
+    by value or if most rows are distinct.
+    """
+    codes = _row_codes(frame, pandas)
+    if codes is None:
+        return None
+
+    numpy = sys.modules['numpy']
+    _, first_positions, inverse = numpy.unique(
+        codes, return_index=True, return_inverse=True)
+    if len(first_positions) * 2 > len(codes):
+        return None  # <- EXIT! (Too few repeated rows to benefit.)
+
+    distinct = normalize(frame.iloc[first_positions], lazy_evaluation=True)
+    items = ((i, value) for i, (_, value) in enumerate(distinct))
+    differences, _ = requirement.check_items(items)
+
+    failing = numpy.zeros(len(first_positions), dtype=bool)
+    for position, _ in differences:
+        failing[position] = True
+    return frame.iloc[failing[inverse]]
+
+
 _INCONSISTENT = object()  # Marker for inconsistent descriptions.
 
 class GroupRequirement(BaseRequirement):
@@ -576,7 +647,33 @@ class GroupRequirement(BaseRequirement):
             description = ''
         return differences, description
 
+    def _reduce_array(self, array, numpy):
+        """Return a smaller array for which check_group() gives the
+        same result as it would for the full *array* or None if the
+        array can not be reduced using vectorized operations.
+        """
+        return None
+
+    def _reduce_frame(self, frame, pandas):
+        """Return the rows of *frame* (a Series or DataFrame) for which
+        check_items() gives the same result as it would for the full
+        *frame* or None if the rows can not be reduced.
+        """
+        return None
+
     def check_data(self, data):
+        numpy = _get_numpy(data)
+        if numpy:
+            reduced = self._reduce_array(data, numpy)
+            if reduced is not None:
+                return self.check_group(reduced)  # <- EXIT!
+
+        pandas = _get_pandas(data)
+        if pandas:
+            reduced = self._reduce_frame(data, pandas)
+            if reduced is not None:
+                data = reduced
+
         data = normalize(data, lazy_evaluation=True)
 
         if isinstance(data, Mapping):
@@ -595,16 +692,23 @@ class GroupRequirement(BaseRequirement):
 ##############################
 
 class RequiredPredicate(GroupRequirement):
-    """A requirement to test data for predicate matches."""
-    def __init__(self, obj, show_expected=False):
+    """A requirement to test data for predicate matches.
+
+    If a *cache_size* is given, predicate results for up to that many
+    distinct values are cached (see :class:`Predicate`). When *obj* is
+    already a Predicate, the requirement uses a copy of it with a new
+    cache of the given size.
+    """
+    def __init__(self, obj, show_expected=False, cache_size=None):
+        self.cache_size = cache_size
         self._pred = self.predicate_factory(obj)
         self._obj = obj
         self.show_expected = show_expected
 
     def predicate_factory(self, obj):
-        if isinstance(obj, Predicate):
+        if isinstance(obj, Predicate) and not self.cache_size:
             return obj
-        return Predicate(obj)
+        return Predicate(obj, cache_size=self.cache_size)
 
     def _get_differences(self, group):
         pred = self._pred
@@ -622,6 +726,20 @@ class RequiredPredicate(GroupRequirement):
         description = _build_description(self._obj)
         return differences, description
 
+    def _reduce_array(self, array, numpy):
+        if self.__class__ is not RequiredPredicate:
+            return None
+        if not isinstance(self._obj, type):
+            return None
+
+        # All elements share the array's scalar type.
+        if issubclass(array.dtype.type, self._obj):
+            return array[:0]
+        return array
+
+    def _reduce_frame(self, frame, pandas):
+        return _failing_rows(self, frame, pandas)
+
     def check_items(self, items):
         if self.__class__ is not RequiredPredicate:
             return super(RequiredPredicate, self).check_items(items)
@@ -709,6 +827,23 @@ class RequiredApprox(RequiredPredicate):
         differences, _ = super(RequiredApprox, self).check_group(group)
         return differences, self._get_description()
 
+    def _reduce_array(self, array, numpy):
+        obj = self._obj
+        if (array.dtype.kind != 'f'
+                or not isinstance(obj, (Integral, float))
+                or isinstance(obj, bool)):
+            return None
+
+        with numpy.errstate(invalid='ignore', over='ignore'):
+            distance = numpy.abs(array - obj)
+            if self.delta is not None:
+                within = distance <= self.delta
+            else:
+                # Use a margin so that elements near the rounding
+                # boundary are checked again using round().
+                within = distance < 0.49 * 10.0 ** -self.places
+        return array[~within]
+
 
 class RequiredFuzzy(RequiredPredicate):
     """Require that strings match with a similarity greater than
@@ -717,31 +852,33 @@ class RequiredFuzzy(RequiredPredicate):
     Similarity measures are determined using the ratio() method
     of the difflib.SequenceMatcher class. The values range from
     1.0 (exactly the same) to 0.0 (completely different).
+
+    If a *cache_size* is given, similarity results for up to that
+    many distinct values are cached.
     """
-    def __init__(self, obj, cutoff=0.6, show_expected=False):
+    def __init__(self, obj, cutoff=0.6, show_expected=False, cache_size=None):
         self.cutoff = cutoff
-        super(RequiredFuzzy, self).__init__(obj, show_expected=show_expected)
+        super(RequiredFuzzy, self).__init__(
+            obj, show_expected=show_expected, cache_size=cache_size)
 
     def predicate_factory(self, obj):
         """Return Predicate object where string components have been
         replaced with fuzzy_match() function.
         """
         cutoff = self.cutoff
-        def fuzzy_match(cutoff, a, b):
-            try:
-                matcher = difflib.SequenceMatcher(a=a, b=b)
-                return matcher.ratio() >= cutoff
-            except TypeError:
-                return False
+        def match(cutoff, a, b):
+            return fuzzy_match(a, b, cutoff)
 
         def fuzzy_or_orig(a):
             if isinstance(a, string_types):
-                return partial(fuzzy_match, cutoff, a)
+                return partial(match, cutoff, a)
             return a
 
+        cache_size = self.cache_size
         if isinstance(obj, tuple):
-            return Predicate(tuple(fuzzy_or_orig(x) for x in obj))
-        return Predicate(fuzzy_or_orig(obj))
+            obj = tuple(fuzzy_or_orig(x) for x in obj)
+            return Predicate(obj, cache_size=cache_size)
+        return Predicate(fuzzy_or_orig(obj), cache_size=cache_size)
 
     def check_group(self, group):
         differences, description = super(RequiredFuzzy, self).check_group(group)
@@ -799,88 +936,187 @@ class RequiredInterval(RequiredPredicate):
             raise TypeError("must provide at least one: 'min' or 'max'")
 
         self._description = description
+        self._min = min
+        self._max = max
         super(RequiredInterval, self).__init__(interval, show_expected=show_expected)
 
     def check_group(self, group):
         differences, _ = super(RequiredInterval, self).check_group(group)
         return differences, self._description
 
+    def _reduce_array(self, array, numpy):
+        if array.dtype.kind == 'f':
+            bound_types = (Integral, float)
+        elif array.dtype.kind in 'iu':
+            bound_types = Integral
+        else:
+            return None
+
+        bounds = [x for x in (self._min, self._max) if x is not None]
+        if not all(isinstance(x, bound_types) for x in bounds):
+            return None
+
+        within = numpy.ones(len(array), dtype=bool)
+        try:
+            with numpy.errstate(invalid='ignore'):
+                if self._min is not None:
+                    within &= array >= self._min
+                if self._max is not None:
+                    within &= array <= self._max
+        except (OverflowError, TypeError):
+            return None
+        return array[~within]  # <- NaN values are checked again.
+
+
+def _distinct_values(array, numpy):
+    """Return the distinct values of *array* or None if the values
+    can not be reduced the same way a Python set would reduce them
+    (each NaN object is distinct in a set but NaNs are combined by
+    numpy.unique()).
+    """
+    if _has_nan(array, numpy):
+        return None
+    return numpy.unique(array)
+
 
 class RequiredSet(GroupRequirement):
     """A requirement to test data for set membership."""
     def __init__(self, requirement):
         if not isinstance(requirement, Set):
-            requirement = set(requirement)
+            requirement = make_set(requirement)
         self._set = requirement
 
     def check_group(self, group):
         requirement = self._set
 
         matches = set()
-        extras = set()
+        extras = {}  # <- Map keys to Extras so we do not return duplicates.
         for element in group:
-            if element in requirement:
-                matches.add(element)
-            else:
-                extras.add(element)  # <- Build set of Extras so we
-                                     #    do not return duplicates.
-        missing = (x for x in requirement if x not in matches)
+            try:
+                if element in requirement:
+                    matches.add(element)
+                elif element not in extras:
+                    extras[element] = element
+            except TypeError:
+                key = deep_key(element)  # <- Only for unhashable elements.
+                if key in requirement:
+                    matches.add(key)
+                elif key not in extras:
+                    extras[key] = element
+
+        missing = (x for k, x in key_items(requirement) if k not in matches)
 
         differences = chain(
             (Missing(x) for x in missing),
-            (Extra(x) for x in extras),
+            (Extra(x) for x in extras.values()),
         )
         return differences, 'does not satisfy set membership'
 
+    def _reduce_array(self, array, numpy):
+        return _distinct_values(array, numpy)
+
+    def _reduce_frame(self, frame, pandas):
+        return _failing_rows(self, frame, pandas)
+
 
 class RequiredSubset(GroupRequirement):
     """Require that data contains all elements of *subset*."""
     def __init__(self, subset):
         if not isinstance(subset, Set):
-            subset = set(subset)
+            subset = make_set(subset)
         self._subset = subset
 
     def check_group(self, group):
-        missing = self._subset.copy()
+        missing = dict(key_items(self._subset))
         for element in group:
             if not missing:
                 break
-            missing.discard(element)
+            try:
+                missing.pop(element, None)
+            except TypeError:
+                missing.pop(deep_key(element), None)
 
-        differences = (Missing(element) for element in missing)
+        differences = (Missing(element) for element in missing.values())
         description = 'must contain all elements of given subset'
         return differences, description
 
+    def _reduce_array(self, array, numpy):
+        return _distinct_values(array, numpy)
+
+    def _reduce_frame(self, frame, pandas):
+        return _failing_rows(self, frame, pandas)
+
 
 class RequiredSuperset(GroupRequirement):
     """Require that data contains only elements of *superset*."""
     def __init__(self, superset):
         if not isinstance(superset, Set):
-            superset = set(superset)
+            superset = make_set(superset)
         self._superset = superset
 
     def check_group(self, group):
         superset = self._superset
-        extras = set()
+        extras = {}
         for element in group:
-            if element not in superset:
-                extras.add(element)
+            try:
+                if element not in superset and element not in extras:
+                    extras[element] = element
+            except TypeError:
+                key = deep_key(element)
+                if key not in superset and key not in extras:
+                    extras[key] = element
 
-        differences = (Extra(element) for element in extras)
+        differences = (Extra(element) for element in extras.values())
         description = 'may contain only elements of given superset'
         return differences, description
 
+    def _reduce_array(self, array, numpy):
+        return _distinct_values(array, numpy)
+
+    def _reduce_frame(self, frame, pandas):
+        return _failing_rows(self, frame, pandas)
+
 
 class RequiredUnique(GroupRequirement):
-    """A requirement to test that elements are unique."""
+    """A requirement to test that elements are unique.
+
+    By default, elements are checked in memory. If *partitions* is
+    given, elements are written to that many temporary files (by hash)
+    and each partition is checked separately. If *error_rate* is given,
+    a Bloom filter with the given false positive rate is used to find
+    candidate duplicates that are then confirmed by reading the data
+    again. Both methods give the same differences as an in-memory check.
+    """
+    def __init__(self, partitions=None, error_rate=None):
+        if partitions is not None and error_rate is not None:
+            raise ValueError('cannot use both partitions and error_rate')
+        if partitions is not None and (not isinstance(partitions, Integral)
+                                       or isinstance(partitions, bool)
+                                       or partitions < 1):
+            msg = 'partitions must be a positive integer, got {0!r}'
+            raise ValueError(msg.format(partitions))
+        if error_rate is not None and not 0.0 < error_rate < 1.0:
+            msg = 'error_rate must be between 0 and 1, got {0!r}'
+            raise ValueError(msg.format(error_rate))
+        self.partitions = partitions
+        self.error_rate = error_rate
+
     @staticmethod
     def _generate_differences(group):
         seen = set()
         for element in group:
-            if element in seen:
+            try:
+                duplicate = element in seen
+                if not duplicate:
+                    seen.add(element)
+            except TypeError:
+                key = deep_key(element)
+                duplicate = key in seen
+                if not duplicate:
+                    seen.add(key)
+
+            if duplicate:
                 yield Extra(element)
-            else:
-                seen.add(element)
 
     def check_group(self, group):
         if isinstance(group, BaseElement):
@@ -888,10 +1124,37 @@ class RequiredUnique(GroupRequirement):
             msg = 'expected non-tuple, non-string sequence, got {0}: {1!r}'
             raise ValueError(msg.format(cls_name, group))
 
-        differences = self._generate_differences(group)
+        if self.partitions is not None:
+            duplicates = partitioned_duplicates(group, self.partitions)
+            differences = (Extra(element) for element in duplicates)
+        elif self.error_rate is not None:
+            duplicates = bloom_duplicates(group, self.error_rate)
+            differences = (Extra(element) for element in duplicates)
+        else:
+            differences = self._generate_differences(group)
         return differences, 'elements should be unique'
 
+    @staticmethod
+    def _array_duplicates(array, numpy):
+        """Return an array of the elements that repeat an earlier
+        element (in their original order) or None if NaN values
+        are present.
+        """
+        if _has_nan(array, numpy):
+            return None
+        _, first_indexes = numpy.unique(array, return_index=True)
+        repeated = numpy.ones(len(array), dtype=bool)
+        repeated[first_indexes] = False
+        return array[repeated]
+
     def check_data(self, data):
+        numpy = _get_numpy(data)
+        if numpy:
+            duplicates = self._array_duplicates(data, numpy)
+            if duplicates is not None:
+                differences = (Extra(element) for element in duplicates)
+                return differences, 'elements should be unique'  # <- EXIT!
+
         data = normalize(data, lazy_evaluation=True)
 
         if isinstance(data, Mapping):
@@ -909,6 +1172,15 @@ class RequiredOrder(GroupRequirement):
         if not isinstance(sequence, Sequence):
             sequence = list(sequence)
         self.sequence = sequence
+        self._sequence_keys = None
+
+    def _get_sequence_keys(self):
+        """Return a list of deep_key() values for the required sequence
+        (built on first use and reused by later checks).
+        """
+        if self._sequence_keys is None:
+            self._sequence_keys = [deep_key(x) for x in self.sequence]
+        return self._sequence_keys
 
     def _generate_differences(self, group):
         if not isinstance(group, Sequence):
@@ -918,14 +1190,13 @@ class RequiredOrder(GroupRequirement):
 
         try:
             # Try sequences directly.
-            matcher = difflib.SequenceMatcher(a=group, b=requirement)
+            opcodes = get_opcodes(group, requirement)
         except TypeError:
-            # Fall-back to slower proxy method when needed.
-            data_proxy = tuple(_deephash(x) for x in group)
-            required_proxy = tuple(_deephash(x) for x in requirement)
-            matcher = difflib.SequenceMatcher(a=data_proxy, b=required_proxy)
+            # Fall-back to slower "deep hash" keys when needed.
+            data_keys = [deep_key(x) for x in group]
+            opcodes = get_opcodes(data_keys, self._get_sequence_keys())
 
-        for tag, istart, istop, jstart, jstop in matcher.get_opcodes():
+        for tag, istart, istop, jstart, jstop in opcodes:
             if tag == 'insert':
                 jvalues = requirement[jstart:jstop]
                 for value in jvalues:
@@ -970,33 +1241,67 @@ class RequiredSequence(GroupRequirement):
         if not factory:
             factory = RequiredPredicate
         self.factory = factory
+        self._predicates = None
+        self._requirements = None
+
+    def _get_predicates(self):
+        """Return an iterable of (expected, predicate) pairs. When the
+        required iterable can be read more than once, the predicates
+        are built on first use and reused by later checks.
+        """
+        if exhaustible(self.iterable):
+            return ((x, Predicate(x)) for x in self.iterable)
+
+        if self._predicates is None:
+            self._predicates = [(x, Predicate(x)) for x in self.iterable]
+        return self._predicates
+
+    def _make_requirement(self, expected):
+        requirement = self.factory(expected)
+        if isinstance(requirement, RequiredPredicate):
+            requirement.show_expected = True
+        return requirement
+
+    def _get_requirements(self):
+        """Return an iterable of requirements made by calling *factory*
+        for each element of the required iterable (reused by later
+        checks like the predicates from _get_predicates()).
+        """
+        if exhaustible(self.iterable):
+            return (self._make_requirement(x) for x in self.iterable)
+
+        if self._requirements is None:
+            self._requirements = [self._make_requirement(x) for x in self.iterable]
+        return self._requirements
 
     def _generate_differences(self, group):
         factory = self.factory
 
-        zipped = zip_longest(group, self.iterable, fillvalue=NOVALUE)
-        for actual, expected in zipped:
-            if factory is RequiredPredicate:
-                pred = Predicate(expected)
+        if factory is RequiredPredicate:
+            no_value = (NOVALUE, Predicate(NOVALUE))
+            zipped = zip_longest(group, self._get_predicates(), fillvalue=NOVALUE)
+            for actual, pair in zipped:
+                expected, pred = no_value if pair is NOVALUE else pair
                 result = pred(actual)
                 if not result:
                     yield _make_difference(actual, expected, show_expected=True)
                 elif isinstance(result, BaseDifference):
                     yield result
-            else:
-                # Get requirement.
-                requirement = factory(expected)
-                if isinstance(requirement, RequiredPredicate):
-                    requirement.show_expected = True
-
-                # Check element as group and yield unwrapped result.
-                diff, desc = requirement.check_group([actual])
-                diff = list(diff)
-                if diff:
-                    if len(diff) > 1:
-                        msg = 'expected 0 or 1 differences, got {0}: {1!r}'
-                        raise ValueError(msg.format(len(diff), diff))
-                    yield diff[0]
+            return  # <- EXIT!
+
+        zipped = zip_longest(group, self._get_requirements(), fillvalue=NOVALUE)
+        for actual, requirement in zipped:
+            if requirement is NOVALUE:
+                requirement = self._make_requirement(NOVALUE)
+
+            # Check element as group and yield unwrapped result.
+            diff, desc = requirement.check_group([actual])
+            diff = list(diff)
+            if diff:
+                if len(diff) > 1:
+                    msg = 'expected 0 or 1 differences, got {0}: {1!r}'
+                    raise ValueError(msg.format(len(diff), diff))
+                yield diff[0]
 
     def check_group(self, group):
         differences = self._generate_differences(group)
@@ -1123,6 +1428,73 @@ class RequiredMapping(ItemsRequirement):
             description = 'does not satisfy mapping requirements'
         return differences, description
 
+    def _reduce_frame(self, frame, pandas):
+        """Return a 2-tuple containing the rows of *frame* (a Series or
+        DataFrame) whose values do not equal their required values and
+        a copy of the requirement that is limited to the keys of these
+        rows and any missing keys. Values are compared one column at a
+        time using vectorized operations (for a DataFrame with several
+        columns, the required values must be tuples with one value per
+        column). Returns None if the required values are not all numbers
+        or strings.
+        """
+        if self._factory:
+            return None
+
+        if isinstance(frame, pandas.Series):
+            columns = [frame]
+        else:
+            columns = [frame.iloc[:, i] for i in range(len(frame.columns))]
+        if any(column.dtype.kind not in 'biufO' for column in columns):
+            return None
+
+        mapping = self.mapping
+        plain_types = (Number,) + string_types
+        width = len(columns)
+        for _, value in IterItems(mapping):
+            if width == 1:
+                if not isinstance(value, plain_types):
+                    return None
+            elif not (isinstance(value, tuple)
+                      and len(value) == width
+                      and all(isinstance(x, plain_types) for x in value)):
+                return None
+
+        numpy = sys.modules['numpy']
+        expected_rows = [mapping.get(key, NOVALUE) for key in frame.index]
+        if width == 1:
+            expected_rows = [(x,) for x in expected_rows]
+        else:
+            expected_rows = [x if x is not NOVALUE else (NOVALUE,) * width
+                             for x in expected_rows]
+
+        equal = numpy.ones(len(frame), dtype=bool)
+        for position, column in enumerate(columns):
+            expected = numpy.empty(len(frame), dtype=object)
+            expected[:] = [row[position] for row in expected_rows]
+            try:
+                actual = numpy.asarray(column, dtype=object)
+                equal &= numpy.asarray(actual == expected, dtype=bool)
+            except (TypeError, ValueError):
+                return None
+
+        matched = set(frame.index[equal])
+        requirement = copy.copy(self)
+        requirement.mapping = dict(
+            (k, v) for k, v in IterItems(mapping) if k not in matched)
+        return frame.iloc[~equal], requirement
+
+    def check_data(self, data):
+        pandas = _get_pandas(data)
+        if pandas:
+            reduced = self._reduce_frame(data, pandas)
+            if reduced is not None:
+                frame, requirement = reduced
+                items = normalize(frame, lazy_evaluation=True)
+                return requirement.check_items(items)  # <- EXIT!
+
+        return super(RequiredMapping, self).check_data(data)
+
 
 def get_requirement(obj):
     """Return a requirement instance appropriate for the given *obj*."""
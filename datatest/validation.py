@@ -6,10 +6,14 @@ from ._compatibility.collections.abc import Iterator
 from ._compatibility.collections.abc import Mapping
 from ._compatibility.collections.abc import Set
 from ._compatibility.functools import partial
+from ._compatibility.itertools import islice
 from .difference import BaseDifference
+from ._differencestore import DifferenceStore
+from ._differencestore import store_differences
 from ._normalize import normalize
 from ._query.query import BaseElement
 from . import requirements
+from . import _parallel
 from ._utils import IterItems
 from ._utils import exhaustible
 from ._utils import iterpeek
@@ -25,20 +29,35 @@ __all__ = [
 __unittest = True  # Hides internal stack frames from unittest output.
 
 
+def _take(iterable, n):
+    """Return a list of the first *n* items from *iterable* and a
+    count of the remaining items (the remaining items are consumed
+    but not kept).
+    """
+    iterator = iter(iterable)
+    taken = list(islice(iterator, n))
+    return taken, sum(1 for _ in iterator)
+
+
 class ValidationError(AssertionError):
     """This exception is raised when data validation fails."""
 
     __module__ = 'datatest'
 
-    def __init__(self, differences, description=None):
+    def __init__(self, differences, description=None,
+                 max_differences=None, lazy=False):
         if isinstance(differences, BaseDifference):
             differences = [differences]
         elif not nonstringiter(differences):
             msg = 'expected an iterable or mapping of differences, got {0}'
             raise TypeError(msg.format(differences.__class__.__name__))
 
+        if max_differences is not None and max_differences < 1:
+            msg = 'max_differences must be a positive integer, got {0!r}'
+            raise ValueError(msg.format(max_differences))
+
         # Convert dictionary update sequences to dict.
-        if not isinstance(differences, Mapping):
+        if not isinstance(differences, (Mapping, DifferenceStore)):
             first_item, differences = iterpeek(differences)
             if not isinstance(first_item, BaseDifference):
                 try:
@@ -53,31 +72,105 @@ class ValidationError(AssertionError):
                     init_err.__cause__ = getattr(err, '__cause__', None)
                     raise init_err
 
-        # Eagerly evaluate lazy-iterables.
-        if isinstance(differences, Mapping):
-            for k, v in IterItems(differences):
-                if nonstringiter(v) and exhaustible(v):
-                    differences[k] = list(v)
-        elif exhaustible(differences):
-            differences = list(differences)
-
         if not differences:
             raise ValueError('differences container must not be empty')
 
-        # Initialize properties.
+        self._init_properties(differences, description, max_differences)
+
+        if not lazy:
+            self._evaluate()
+
+    def _init_properties(self, differences, description, max_differences):
         self._differences = differences
         self._description = description
+        self._max_differences = max_differences
+        self._omitted = 0
+        self._is_lazy = True
         self._should_truncate = None
         self._truncation_notice = None
         self._sorted_str = True
+        self._deferred = None
+
+    @classmethod
+    def _from_deferred(cls, build, description=None, max_differences=None):
+        """Return an error whose differences are made by calling *build*
+        when they are first needed. This is used by acceptances so that
+        nested acceptances can filter a single stream of differences.
+        The *build* function must return a non-empty container.
+        """
+        exc = cls.__new__(cls)
+        exc._init_properties(None, description, max_differences)
+        exc._deferred = build
+        return exc
+
+    def _build_deferred(self):
+        if self._deferred is not None:
+            build, self._deferred = self._deferred, None
+            self._differences = build()
+
+    def _evaluate(self):
+        """Evaluate lazy-iterables of differences (keeping no more
+        than *max_differences* items and counting the remainder).
+        """
+        if not self._is_lazy:
+            return  # <- EXIT!
+
+        self._build_deferred()
+
+        differences = self._differences
+        if isinstance(differences, DifferenceStore):
+            self._is_lazy = False
+            return  # <- EXIT! (Stored differences are already evaluated.)
+        limit = self._max_differences
+        if limit is None:
+            if isinstance(differences, Mapping):
+                for k, v in IterItems(differences):
+                    if nonstringiter(v) and exhaustible(v):
+                        differences[k] = list(v)
+            elif exhaustible(differences):
+                differences = list(differences)
+        elif isinstance(differences, Mapping):
+            limited = dict()
+            for k, v in IterItems(differences):
+                if nonstringiter(v):
+                    kept, omitted = _take(v, limit)
+                    if kept:
+                        limited[k] = kept
+                elif limit:
+                    kept, omitted = [v], 0
+                    limited[k] = v
+                else:
+                    kept, omitted = [], 1
+                limit -= len(kept)
+                self._omitted += omitted
+            differences = limited
+        else:
+            differences, omitted = _take(differences, limit)
+            self._omitted += omitted
+
+        self._differences = differences
+        self._is_lazy = False
 
     @property
     def differences(self):
         """A collection of "difference" objects to describe elements
         in the data under test that do not satisfy the requirement.
+
+        When the error was created with ``lazy=True``, differences
+        are returned as they were given (iterators are not evaluated
+        and can only be consumed once).
         """
+        self._build_deferred()
         return self._differences
 
+    @property
+    def omitted(self):
+        """The number of differences that were counted but not kept
+        because of the *max_differences* limit.
+        """
+        self._evaluate()
+        return self._omitted
+
     @property
     def description(self):
         """An optional description of the failed requirement."""
@@ -86,11 +179,14 @@ class ValidationError(AssertionError):
     @property
     def args(self):
         """The tuple of arguments given to the exception constructor."""
+        self._build_deferred()
         return (self._differences, self._description)
 
     def __str__(self):
+        self._evaluate()
+
         # Prepare a format-differences callable.
-        if isinstance(self._differences, dict):
+        if isinstance(self._differences, Mapping):
             begin, end = '{', '}'
             all_keys = sorted(self._differences.keys(), key=_safesort_key)
             def sorted_value(key):
@@ -106,7 +202,9 @@ class ValidationError(AssertionError):
         else:
             begin, end = '[', ']'
             sort_args = lambda diff: _safesort_key(diff.args)
-            if self._sorted_str:
+            if self._sorted_str and isinstance(self._differences, DifferenceStore):
+                iterator = self._differences.sorted(key=sort_args)
+            elif self._sorted_str:
                 iterator = iter(sorted(self._differences, key=sort_args))
             else:
                 iterator = iter(self._differences)
@@ -132,6 +230,13 @@ class ValidationError(AssertionError):
             list_of_strings = [format_diff(x) for x in iterator]
             line_count = len(list_of_strings)
 
+        # Account for differences omitted by max_differences.
+        if self._omitted:
+            line_count += self._omitted
+            if end in ('}', ']'):
+                end = '    ...\n\n{0} more not shown (max_differences={1})'
+                end = end.format(self._omitted, self._max_differences)
+
         # Prepare count-of-differences string.
         count_message = '{0} difference{1}'.format(
             line_count,
@@ -154,6 +259,7 @@ class ValidationError(AssertionError):
         return output
 
     def __repr__(self):
+        self._evaluate()
         cls_name = self.__class__.__name__
         if self.description:
             return '{0}({1!r}, {2!r})'.format(cls_name, self.differences, self.description)
@@ -274,17 +380,103 @@ class ValidateType(object):
         When *requirement* is a subclass of :class:`BaseRequirement`,
         then validation and difference generation are delegated to the
         *requirement* itself.
+
+    **Limiting Differences:**
+
+        When *max_differences* is given, no more than that number of
+        differences are kept in the raised error. Any remaining
+        differences are counted but not stored (see
+        :attr:`ValidationError.omitted`):
+
+        .. code-block:: python
+            :emphasize-lines: 3
+
+            from datatest import validate
+
+            validate(range(1000000), int, max_differences=100)
+
+        When *lazy* is True, differences are not evaluated until they
+        are needed---callers that only need the first few differences
+        can take them from :attr:`ValidationError.differences` without
+        generating the rest.
+
+    **Parallel Validation:**
+
+        When *workers* is greater than 1, predicate and set requirements
+        are applied to chunks of elements (and mapping data is divided
+        by key) in a pool of *workers* processes:
+
+        .. code-block:: python
+            :emphasize-lines: 7
+
+            from datatest import validate
+
+            def is_valid_date(x):
+                ...  # <- Some expensive check.
+
+            validate(data, is_valid_date, workers=4)
+
+        Differences are merged in the order data was read so results
+        are the same as when using a single process. Elements must
+        be picklable. Requirements that depend on element order (like
+        sequences and :meth:`unique`) are applied in the current
+        process.
     """
-    def __call__(self, data, requirement, msg=None):
+    def __call__(self, data, requirement, msg=None,
+                 max_differences=None, lazy=False, workers=None):
+        __tracebackhide__ = _pytest_tracebackhide
+        self._validate(data, requirement, msg, max_differences, lazy, workers)
+
+    def stream(self, data, requirement, msg=None, chunk_size=None,
+               max_differences=None, workers=None):
+        """Validate *data* using *requirement* (as :func:`validate`
+        does) but write any differences to a temporary on-disk store
+        rather than holding them in memory:
+
+        .. code-block:: python
+            :emphasize-lines: 5
+
+            from datatest import validate
+
+            with open('events.log') as fh:
+                validate.stream(fh, str.isprintable)
+
+        The raised error's :attr:`ValidationError.differences` are
+        backed by the store---they can be iterated over, counted with
+        :py:func:`len`, and are sorted on demand using no more than
+        *chunk_size* differences in memory at a time. Since *data*
+        is read one element at a time, streams that are too large to
+        fit in memory can be validated.
+
+        When *max_differences* is given, the kept differences are
+        held in memory (as :func:`validate` does) and no store is
+        used.
+        """
+        __tracebackhide__ = _pytest_tracebackhide
+        self._validate(data, requirement, msg, max_differences,
+                       workers=workers, store=True, chunk_size=chunk_size)
+
+    def _validate(self, data, requirement, msg=None, max_differences=None,
+                  lazy=False, workers=None, store=False, chunk_size=None):
+        """Apply *requirement* to *data* and raise a ValidationError
+        if it is not satisfied. When *store* is True and no explicit
+        *max_differences* is given, differences are written to an
+        on-disk store (see :meth:`stream`).
+        """
         __tracebackhide__ = _pytest_tracebackhide
 
         requirement_object = requirements.get_requirement(requirement)
-        result = requirement_object(data)  # <- Apply requirement.
+        result = self._apply(requirement_object, data, workers)
 
         if result:
             differences, description = result
             message = msg or description or 'does not satisfy requirement'
-            err = ValidationError(differences, message)
+            if max_differences is None:
+                if store:
+                    differences = store_differences(differences, chunk_size)
+                else:
+                    max_differences = requirement_object.max_differences
+            err = ValidationError(differences, message, max_differences, lazy)
 
             sequence_or_order_types = (requirements.RequiredSequence,
                                        requirements.RequiredOrder)
@@ -292,6 +484,15 @@ class ValidateType(object):
                 err._sorted_str = False
             raise err
 
+    @staticmethod
+    def _apply(requirement_object, data, workers):
+        """Apply requirement to *data*, using a pool of processes
+        when *workers* is greater than 1.
+        """
+        if workers and workers > 1:
+            return _parallel.apply_requirement(requirement_object, data, workers)
+        return requirement_object(data)
+
     @staticmethod
     def _get_predicate_requirement(requirement, factory):
         """Return appropriate requirement object for explicit predicate
@@ -312,7 +513,8 @@ class ValidateType(object):
             return requirements.RequiredMapping(requirement, wrapped_factory)
         return wrapped_factory(requirement)
 
-    def predicate(self, data, requirement, msg=None):
+    def predicate(self, data, requirement, msg=None, max_differences=None,
+                  workers=None):
         """Use *requirement* to construct a :class:`Predicate` and
         check elements in *data* for matches (see :ref:`predicate
         validation <predicate-validation>` for more details).
@@ -320,9 +522,11 @@ class ValidateType(object):
         __tracebackhide__ = _pytest_tracebackhide
         factory = requirements.RequiredPredicate
         requirement = self._get_predicate_requirement(requirement, factory)
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             workers=workers)
 
-    def approx(self, data, requirement, places=None, msg=None, delta=None):
+    def approx(self, data, requirement, places=None, msg=None, delta=None,
+               max_differences=None, workers=None):
         """Require that numeric values are approximately equal. The
         given *requirement* can be a single element or a mapping.
 
@@ -351,9 +555,11 @@ class ValidateType(object):
         __tracebackhide__ = _pytest_tracebackhide
         factory = partial(requirements.RequiredApprox, places=places, delta=delta)
         requirement = self._get_predicate_requirement(requirement, factory)
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             workers=workers)
 
-    def fuzzy(self, data, requirement, cutoff=0.6, msg=None):
+    def fuzzy(self, data, requirement, cutoff=0.6, msg=None, max_differences=None,
+              workers=None, cache_size=None):
         """Require that strings match with a similarity greater than
         or equal to *cutoff* (default ``0.6``).
 
@@ -381,13 +587,20 @@ class ValidateType(object):
             }
 
             validate.fuzzy(data, requirement, cutoff=0.8)
+
+        When data contains many repeated values, a *cache_size* can be
+        given to keep similarity results for up to that many distinct
+        values (see :class:`Predicate`).
         """
         __tracebackhide__ = _pytest_tracebackhide
-        factory = partial(requirements.RequiredFuzzy, cutoff=cutoff)
+        factory = partial(requirements.RequiredFuzzy, cutoff=cutoff,
+                          cache_size=cache_size)
         requirement = self._get_predicate_requirement(requirement, factory)
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             workers=workers)
 
-    def interval(self, data, min=None, max=None, msg=None):
+    def interval(self, data, min=None, max=None, msg=None, max_differences=None,
+                 workers=None):
         """Require that values are within the defined interval:
 
         .. code-block:: python
@@ -425,9 +638,11 @@ class ValidateType(object):
         """
         __tracebackhide__ = _pytest_tracebackhide
         requirement = requirements.RequiredInterval(min, max)
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             workers=workers)
 
-    def set(self, data, requirement, msg=None):
+    def set(self, data, requirement, msg=None, max_differences=None,
+            workers=None):
         """Check that the set of elements in *data* matches the set
         of elements in *requirement* (applies :ref:`set validation
         <set-validation>` using a *requirement* of any iterable type).
@@ -442,9 +657,11 @@ class ValidateType(object):
         else:
             requirement = requirements.RequiredSet(requirement)
 
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             workers=workers)
 
-    def subset(self, data, requirement, msg=None):
+    def subset(self, data, requirement, msg=None, max_differences=None,
+               workers=None):
         """Check that *requirement* is a subset of *data* (i.e., that
         all elements in *requirement* are also contained in *data*):
 
@@ -469,9 +686,11 @@ class ValidateType(object):
         else:
             requirement = requirements.RequiredSubset(requirement)
 
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             workers=workers)
 
-    def superset(self, data, requirement, msg=None):
+    def superset(self, data, requirement, msg=None, max_differences=None,
+                 workers=None):
         """Check that *requirement* is a superset of *data* (i.e., that
         all elements in *data* are also contained in *requirement*):
 
@@ -496,9 +715,11 @@ class ValidateType(object):
         else:
             requirement = requirements.RequiredSuperset(requirement)
 
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             workers=workers)
 
-    def unique(self, data, msg=None):
+    def unique(self, data, msg=None, max_differences=None, workers=None,
+               partitions=None, error_rate=None):
         """Require that elements in *data* are unique:
 
         .. code-block:: python
@@ -509,11 +730,27 @@ class ValidateType(object):
             data = [1, 2, 3, ...]
 
             validate.unique(data)
+
+        By default, elements are checked in memory. To check data that
+        may not fit in memory, one of the following can be given:
+
+        * *partitions*: Write elements to the given number of temporary
+          files (partitioned by hash) and check one partition at a time.
+        * *error_rate*: Use a Bloom filter with the given false positive
+          rate (e.g., ``0.001``) to find candidate duplicates which are
+          confirmed by reading the data again. Exhaustible iterators are
+          written to a temporary file so they can be read twice.
+
+        Both methods report the same differences as an in-memory check
+        but elements must be picklable when they are written to files.
         """
         __tracebackhide__ = _pytest_tracebackhide
-        self(data, requirements.RequiredUnique(), msg=msg)
+        requirement = requirements.RequiredUnique(partitions, error_rate)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             workers=workers)
 
-    def order(self, data, requirement, msg=None):
+    def order(self, data, requirement, msg=None, max_differences=None,
+              workers=None):
         r"""Check that elements in *data* match the relative order of
         elements in *requirement*:
 
@@ -582,7 +819,8 @@ class ValidateType(object):
         else:
             requirement = requirements.RequiredOrder(requirement)
 
-        self(data, requirement, msg=msg)
+        self(data, requirement, msg=msg, max_differences=max_differences,
+             workers=workers)
 
 
 validate = ValidateType()  # Use as instance.
@@ -595,7 +833,7 @@ def valid(data, requirement):
     and detailed validation behavior.
     """
     try:
-        validate(data, requirement)
+        validate(data, requirement, lazy=True)  # <- Stops at first difference.
     except ValidationError:
         return False
     return True
@@ -134,6 +134,21 @@ class TestBaseAcceptance(unittest.TestCase):
         description = cm.exception.description
         self.assertEqual(description, 'acceptance message')
 
+    def test_exit_context_omitted(self):
+        """Differences omitted from the original error should still
+        be counted by the re-raised error.
+        """
+        diffs = [Missing('A'), Extra('B'), Extra('C')]
+        try:
+            raise ValidationError(diffs, max_differences=2)
+        except ValidationError:
+            type, value, traceback = sys.exc_info()
+
+        with self.assertRaises(ValidationError) as cm:
+            acceptance = MinimalAcceptance()
+            acceptance.__exit__(type, value, traceback)
+        self.assertEqual(cm.exception.omitted, 1)
+
 
 class TestAcceptanceProtocol(unittest.TestCase):
     def setUp(self):
@@ -187,6 +202,69 @@ class TestAcceptanceProtocol(unittest.TestCase):
         self.assertEqual(accepted.log, expected)
 
 
+class TestNestedAcceptances(unittest.TestCase):
+    def test_mapping_of_differences(self):
+        differences = {
+            'a': [Missing('A'), Extra('B'), Invalid('C')],
+            'b': [Missing('D')],
+            'c': [Invalid('E'), Invalid('F')],
+        }
+        with self.assertRaises(ValidationError) as cm:
+            with AcceptedMissing():
+                with AcceptedExtra():
+                    with AcceptedCount(1):
+                        raise ValidationError(differences)
+
+        expected = {'a': Invalid('C'), 'c': [Invalid('E'), Invalid('F')]}
+        self.assertEqual(cm.exception.differences, expected)
+
+    def test_list_of_differences(self):
+        differences = [Missing('A'), Extra('B'), Invalid('C'), Extra('D')]
+        with self.assertRaises(ValidationError) as cm:
+            with AcceptedMissing():
+                with AcceptedDifferences([Extra('B')]):
+                    raise ValidationError(differences, 'some message')
+
+        self.assertEqual(cm.exception.differences, [Invalid('C'), Extra('D')])
+        self.assertEqual(cm.exception.description, 'some message')
+
+    def test_all_accepted(self):
+        with AcceptedMissing():
+            with AcceptedExtra():
+                raise ValidationError([Missing('A'), Extra('B')])
+
+    def test_inner_error_is_deferred(self):
+        """Errors raised inside another acceptance should not build
+        their differences until needed.
+        """
+        differences = [Missing('A'), Extra('B'), Invalid('C')]
+        with self.assertRaises(ValidationError) as cm:
+            with AcceptedMissing():
+                try:
+                    with AcceptedExtra():
+                        raise ValidationError(differences)
+                except ValidationError as err:
+                    self.assertIsNotNone(err._deferred)
+                    raise
+
+        self.assertEqual(cm.exception.differences, [Invalid('C')])
+        self.assertIsNone(cm.exception._deferred)
+
+    def test_inner_differences_accessed(self):
+        """Differences should be built when accessed directly."""
+        differences = [Missing('A'), Extra('B'), Invalid('C')]
+        with self.assertRaises(ValidationError) as cm:
+            with AcceptedMissing():
+                try:
+                    with AcceptedExtra():
+                        raise ValidationError(differences)
+                except ValidationError as err:
+                    self.assertEqual(err.differences, [Missing('A'), Invalid('C')])
+                    raise
+
+        self.assertEqual(cm.exception.differences, [Invalid('C')])
+
+
 class TestLogicalComposition(unittest.TestCase):
     def setUp(self):
         class accepted_missing(MinimalAcceptance):
@@ -438,6 +516,38 @@ class TestAcceptedDifferences(unittest.TestCase):
         expected = {'a': Missing('X'), 'b': Missing('X')}
         self.assertAcceptance(differences, acceptance, expected)
 
+    def test_repeated_and_unhashable_differences(self):
+        differences = [
+            Extra('xxx'), Extra('xxx'), Extra('xxx'),
+            Invalid(float('nan')), Missing(['yyy']), Missing(set(['zzz'])),
+        ]
+        acceptance = AcceptedDifferences([
+            Extra('xxx'), Extra('xxx'),
+            Invalid(float('nan')), Missing(['yyy']), Missing(frozenset(['zzz'])),
+        ])
+        expected = [Extra('xxx')]
+        self.assertAcceptance(differences, acceptance, expected)
+
+    def test_group_scope_allowance_per_group(self):
+        """Each group should get the full allowance (including
+        uncounted, unhashable differences).
+        """
+        acceptance = AcceptedDifferences(
+            [Missing('X'), Missing('X'), Missing(['Y'])], scope='group')
+        differences = {
+            'a': [Missing('X'), Missing(['Y']), Missing(['Y'])],
+            'b': [Missing('X'), Missing('X'), Missing('X'), Missing(['Y'])],
+        }
+        expected = {'a': Missing(['Y']), 'b': Missing('X')}
+        self.assertAcceptance(differences, acceptance, expected)
+
+    def test_whole_scope_reused(self):
+        """The whole-error allowance should be restored for each use."""
+        acceptance = AcceptedDifferences([Missing('X')], scope='whole')
+        differences = {'a': Missing('X'), 'b': Missing('X')}
+        self.assertAcceptance(differences, acceptance, {'b': Missing('X')})
+        self.assertAcceptance(differences, acceptance, {'b': Missing('X')})
+
     def test_priority(self):
         """Priority is determined by scope."""
         acceptance = AcceptedDifferences(Extra)
@@ -1123,6 +1233,19 @@ class TestAcceptedFuzzy(unittest.TestCase):
         remaining = cm.exception.differences
         self.assertEqual(remaining, incompatible_diffs)
 
+    def test_cache_size(self):
+        differences = self.differences * 3
+        acceptance = AcceptedFuzzy(cutoff=0.7, cache_size=8)
+        with self.assertRaises(ValidationError) as cm:
+            with acceptance:
+                raise ValidationError(differences)
+        remaining = cm.exception.differences
+        self.assertEqual(remaining, [Invalid('bbyy', 'bbbb')] * 3)
+
+        hits, misses, _, _ = acceptance.cache_info()
+        self.assertEqual((hits, misses), (4, 2))
+        self.assertEqual(repr(acceptance), 'AcceptedFuzzy(cutoff=0.7, cache_size=8)')
+
 
 class TestAcceptedSpecific(unittest.TestCase):
     def test_list_and_list(self):
@@ -1300,6 +1423,22 @@ class TestAcceptedSpecific(unittest.TestCase):
         actual = cm.exception.differences
         self.assertEqual(actual, {'baz': Extra('zzz')})
 
+    def test_repeated_and_unhashable_differences(self):
+        differences = [
+            Extra('xxx'), Extra('xxx'), Extra('xxx'),
+            Invalid(float('nan')), Missing(['yyy']), Missing(set(['zzz'])),
+        ]
+        accepted = [
+            Extra('xxx'), Extra('xxx'),
+            Invalid(float('nan')), Missing(['yyy']), Missing(frozenset(['zzz'])),
+        ]
+        with self.assertRaises(ValidationError) as cm:
+            with AcceptedSpecific(accepted):
+                raise ValidationError(differences)
+
+        actual = list(cm.exception.differences)
+        self.assertEqual(actual, [Extra('xxx')])
+
 
 class TestAcceptedCount(unittest.TestCase):
     def test_bad_arg(self):
@@ -156,6 +156,20 @@ class TestAssertValid(DataTestCase):
         message = str(cm.exception)
         self.assertTrue(message.endswith(']'), 'should show full diff when None')
 
+    def test_maxdifferences_propagation(self):
+        self.maxDifferences = 2
+        with self.assertRaises(ValidationError) as cm:
+            self.assertValid(set([1, 2, 3, 4, 5, 6]), set([1, 2]))
+
+        self.assertEqual(len(cm.exception.differences), 2)
+        self.assertEqual(cm.exception.omitted, 2)
+
+    def test_validationworkers_propagation(self):
+        self.validationWorkers = 2
+        with self.assertRaises(ValidationError) as cm:
+            self.assertValid([1, 2, 3, 4], lambda x: x % 2 == 0)
+        self.assertEqual(cm.exception.differences, [Invalid(1), Invalid(3)])
+
     def test_query_objects(self):
         source = Select([('A', 'B'), ('1', '2'), ('1', '2')])
         query_obj1 = source(['B'])
@@ -234,6 +248,7 @@ class TestValidationWrappers(unittest.TestCase):
             ('fuzzy', ('aaa', 'aaa'), {}),
             ('interval', ([1, 2, 3], 1, 3), {}),
             ('set', ([1, 1, 2, 2], set([1, 2])), {}),
+            ('stream', ('aaa', 'aaa'), {}),
             ('subset', ([1, 2, 3], set([1, 2])), {}),
             ('superset', ([1, 2], set([1, 2, 3])), {}),
             ('unique', ([1, 2, 3],), {}),
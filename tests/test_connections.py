@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from . import _unittest as unittest
+
+from datatest._load.temptable import create_table
+from datatest._load.temptable import table_exists
+from datatest._query.connections import SingleConnectionPool
+from datatest._query.connections import FileConnectionPool
+from datatest._query.connections import get_file_pool
+from datatest._query.query import Select
+
+
+def run_in_thread(func):
+    """Call *func* in a new thread and return its result."""
+    results = []
+    errors = []
+    def target():
+        try:
+            results.append(func())
+        except Exception as err:
+            errors.append(err)
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if errors:
+        raise errors[0]
+    return results[0]
+
+
+class TestSingleConnectionPool(unittest.TestCase):
+    def test_get_connection(self):
+        connection = sqlite3.connect(':memory:')
+        pool = SingleConnectionPool(connection)
+        self.assertIs(pool.get_connection(), connection)
+
+    def test_create_function(self):
+        pool = SingleConnectionPool(sqlite3.connect(':memory:'))
+        pool.create_function('DOUBLE', 1, lambda x: x * 2)
+        cursor = pool.get_connection().execute('SELECT DOUBLE(21)')
+        self.assertEqual(cursor.fetchone(), (42,))
+
+
+class TestFileConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'test.sqlite3')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_connection_per_thread(self):
+        pool = FileConnectionPool(self.path)
+        connection = pool.get_connection()
+        self.assertIs(pool.get_connection(), connection, msg='same thread')
+
+        other = run_in_thread(pool.get_connection)
+        self.assertIsNot(other, connection, msg='different thread')
+
+    def test_wal_mode(self):
+        pool = FileConnectionPool(self.path)
+        cursor = pool.get_connection().execute('PRAGMA journal_mode')
+        self.assertEqual(cursor.fetchone()[0].lower(), 'wal')
+
+    def test_create_function(self):
+        pool = FileConnectionPool(self.path)
+        pool.create_function('DOUBLE', 1, lambda x: x * 2)
+
+        def call_function():
+            cursor = pool.get_connection().execute('SELECT DOUBLE(21)')
+            return cursor.fetchone()
+        self.assertEqual(run_in_thread(call_function), (42,))
+
+    def test_shared_tables(self):
+        pool = FileConnectionPool(self.path)
+        cursor = pool.get_connection().cursor()
+        create_table(cursor, 'test_table', ['A', 'B'])
+
+        def check_table():
+            return table_exists(pool.get_connection().cursor(), 'test_table')
+        self.assertTrue(run_in_thread(check_table))
+
+    def test_get_file_pool(self):
+        pool1 = get_file_pool(self.path)
+        pool2 = get_file_pool(self.path)
+        self.assertIs(pool1, pool2)
+
+
+class TestSelectDatabase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'test.sqlite3')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_query_from_threads(self):
+        select = Select([['A', 'B'], ['x', 1], ['y', 2], ['z', 3]],
+                        database=self.path)
+        self.assertEqual(select('A').fetch(), ['x', 'y', 'z'])
+
+        def isodd(x):
+            return x % 2 == 1
+
+        threads = []
+        results = {}
+        def worker(key):
+            results[key] = select('A', B=isodd).fetch()
+
+        for key in range(4):
+            thread = threading.Thread(target=worker, args=(key,))
+            threads.append(thread)
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, dict((k, ['x', 'z']) for k in range(4)))
+
+    def test_default_select_uses_temporary_tables(self):
+        select = Select([['A', 'B'], ['x', 1]])
+        cursor = select._connection.cursor()
+        cursor.execute('SELECT name FROM sqlite_temp_master WHERE name=?',
+                       (select._table,))
+        self.assertEqual(len(cursor.fetchall()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
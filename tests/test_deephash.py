@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+import pickle
+from . import _unittest as unittest
+
+from datatest._compatibility.collections.abc import Mapping
+from datatest._deephash import deep_key
+from datatest._deephash import KeyedSet
+from datatest._deephash import make_set
+
+
+class MappingWrapper(Mapping):
+    """A mapping type that is not a dict subclass."""
+    def __init__(self, data):
+        self._data = dict(data)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TestDeepKey(unittest.TestCase):
+    def test_hashable(self):
+        self.assertEqual(deep_key('abc'), 'abc')
+        self.assertEqual(deep_key((1, 2)), (1, 2))
+
+    def test_equal_structures(self):
+        self.assertEqual(deep_key([1, {'a': [2]}]), deep_key([1, {'a': [2]}]))
+        self.assertEqual(deep_key({'a': 1, 'b': 2}), deep_key({'b': 2, 'a': 1}))
+        self.assertEqual(deep_key((1, [2])), deep_key((1, [2])))
+
+    def test_unequal_structures(self):
+        self.assertNotEqual(deep_key([1, 2]), deep_key([2, 1]))
+        self.assertNotEqual(deep_key([1, 2]), deep_key(set([1, 2])))
+        self.assertNotEqual(deep_key([1, [2]]), deep_key((1, [2])))
+
+    def test_keys_differ_from_hashable_elements(self):
+        self.assertNotEqual(deep_key([1, 2]), (1, 2))
+        self.assertNotEqual(deep_key([1, 2]), (list, (1, 2)))
+
+    def test_equal_mapping_and_set_types(self):
+        """Mappings and sets that compare equal should have equal keys."""
+        self.assertEqual(deep_key({'a': 1}), deep_key(MappingWrapper({'a': 1})))
+        self.assertEqual(deep_key([{'a': 1}]), deep_key([MappingWrapper({'a': 1})]))
+        self.assertEqual(deep_key(set([1])), deep_key(frozenset([1])))
+        self.assertEqual(deep_key([set([1])]), deep_key([frozenset([1])]))
+
+    def test_shared_references(self):
+        """Repeated references to the same object are not recursive."""
+        shared = [1]
+        self.assertEqual(deep_key([shared, shared]), deep_key([[1], [1]]))
+
+    def test_recursive_references(self):
+        recursive = [1]
+        recursive.append(recursive)
+        hash(deep_key(recursive))  # <- Should not recurse endlessly.
+
+    def test_unsupported_object(self):
+        class Unhashable(object):
+            __hash__ = None
+
+        with self.assertRaises(TypeError):
+            deep_key([Unhashable()])
+
+
+class TestKeyedSet(unittest.TestCase):
+    def test_elements(self):
+        keyed = KeyedSet([{'a': 1}, [2], {'a': 1}, 3])
+        self.assertEqual(len(keyed), 3)
+        self.assertEqual(list(keyed), [{'a': 1}, [2], 3])
+
+    def test_contains_key(self):
+        keyed = KeyedSet([[2], 3])
+        self.assertIn(3, keyed)
+        self.assertIn(deep_key([2]), keyed)
+        self.assertNotIn(deep_key([3]), keyed)
+
+    def test_contains_element(self):
+        keyed = KeyedSet([[2], {'a': 3}])
+        self.assertIn([2], keyed)
+        self.assertIn({'a': 3}, keyed)
+        self.assertNotIn([3], keyed)
+
+    def test_comparisons(self):
+        keyed = KeyedSet([[1], {'a': 2}, 3])
+        self.assertEqual(keyed, KeyedSet([3, {'a': 2}, [1]]))
+        self.assertNotEqual(keyed, set([1, 2, 3]))
+        self.assertLessEqual(KeyedSet([[1], 3]), keyed)
+        self.assertLess(KeyedSet([[1]]), keyed)
+        self.assertGreater(keyed, set([3]))
+        self.assertFalse(keyed <= set([3]))
+        self.assertTrue(set([3]) <= keyed)
+
+    def test_operators(self):
+        keyed = KeyedSet([[1], {'a': 2}, 3])
+        self.assertEqual(list(keyed - KeyedSet([[1]])), [{'a': 2}, 3])
+        self.assertEqual(list(keyed - set([3])), [[1], {'a': 2}])
+        self.assertEqual(set([3, 4]) - keyed, set([4]))
+        self.assertEqual(list(keyed & KeyedSet([[1], [5]])), [[1]])
+        self.assertEqual(keyed | [[5]], KeyedSet([[1], {'a': 2}, 3, [5]]))
+        self.assertEqual(keyed ^ KeyedSet([[1], [5]]), KeyedSet([{'a': 2}, 3, [5]]))
+        self.assertFalse(keyed.isdisjoint([[1]]))
+
+    def test_update(self):
+        keyed = KeyedSet([[1]])
+        keyed.update(KeyedSet([[1], [2]]))
+        keyed.update(set([3]))
+        self.assertEqual(list(keyed), [[1], [2], 3])
+
+    def test_pickled(self):
+        """Keys should still match after a round-trip through pickle
+        (as when sets are returned from worker processes).
+        """
+        keyed = pickle.loads(pickle.dumps(KeyedSet([[1], {'a': 2}])))
+        self.assertIn(deep_key([1]), keyed)
+        self.assertIn(deep_key({'a': 2}), keyed)
+
+        keyed.update(KeyedSet([[1]]))
+        self.assertEqual(len(keyed), 2)
+
+
+class TestMakeSet(unittest.TestCase):
+    def test_hashable(self):
+        self.assertEqual(make_set(iter([1, 2, 2])), set([1, 2]))
+
+    def test_unhashable(self):
+        result = make_set(iter([[1], [1], 2]))
+        self.assertIsInstance(result, KeyedSet)
+        self.assertEqual(list(result), [[1], 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
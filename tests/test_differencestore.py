@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+from . import _unittest as unittest
+
+from datatest.acceptances import accepted
+from datatest.difference import Extra
+from datatest.difference import Invalid
+from datatest.difference import Missing
+from datatest._differencestore import DifferenceStore
+from datatest._differencestore import MappedDifferenceStore
+from datatest._differencestore import store_differences
+from datatest.validation import ValidationError
+from datatest.validation import validate
+
+
+class TestDifferenceStore(unittest.TestCase):
+    def test_iter_and_len(self):
+        diffs = [Invalid(x) for x in range(10)]
+        store = DifferenceStore(chunk_size=3)
+        store.extend(iter(diffs))
+        self.assertEqual(len(store), 10)
+        self.assertEqual(list(store), diffs)
+        self.assertEqual(list(store), diffs, msg='can be iterated repeatedly')
+
+    def test_bool(self):
+        store = DifferenceStore()
+        self.assertFalse(store)
+        store.extend([Missing('A')])
+        self.assertTrue(store)
+
+    def test_sentinel_values(self):
+        """Invalid differences use a NOVALUE sentinel internally."""
+        store = DifferenceStore()
+        store.extend([Invalid('A'), Invalid('B', 'C')])
+        self.assertEqual(list(store), [Invalid('A'), Invalid('B', 'C')])
+
+    def test_sorted(self):
+        values = [7, 3, 9, 1, 8, 2, 6, 0, 5, 4]
+        store = DifferenceStore(chunk_size=3)  # <- Sorted using 4 runs.
+        store.extend(Invalid(x) for x in values)
+        expected = [Invalid(x) for x in range(10)]
+        self.assertEqual(list(store.sorted(key=lambda x: x.args)), expected)
+
+        store = DifferenceStore(chunk_size=100)  # <- Sorted in memory.
+        store.extend(Invalid(x) for x in values)
+        self.assertEqual(list(store.sorted(key=lambda x: x.args)), expected)
+
+    def test_sorted_interleaved(self):
+        """Iterators from separate calls should not share sorted runs."""
+        store = DifferenceStore(chunk_size=3)
+        store.extend(Invalid(x) for x in [7, 3, 9, 1, 8, 2, 6, 0, 5, 4])
+        ascending = store.sorted(key=lambda x: x.args)
+        first = next(ascending)
+        descending = store.sorted(key=lambda x: [-x.args[0]])
+        self.assertEqual(list(descending), [Invalid(x) for x in range(9, -1, -1)])
+        self.assertEqual([first] + list(ascending), [Invalid(x) for x in range(10)])
+
+        cursor = store._connection.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name LIKE 'sort_runs%'")
+        self.assertEqual(cursor.fetchone()[0], 0, msg='tables should be dropped')
+
+
+class TestMappedDifferenceStore(unittest.TestCase):
+    def test_mapping(self):
+        store = MappedDifferenceStore()
+        store.add('a', iter([Missing(1), Missing(2)]))
+        store.add('b', Extra(3))
+        self.assertEqual(list(store), ['a', 'b'])
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.count(), 3)
+        self.assertEqual(store['a'], [Missing(1), Missing(2)])
+        self.assertEqual(store['b'], Extra(3))
+        with self.assertRaises(KeyError):
+            store['c']
+
+    def test_equal_keys(self):
+        """Keys should be found like dictionary keys (by equality)."""
+        store = MappedDifferenceStore()
+        store.add(1.0, Missing('x'))
+        store.add(('a', 2), Extra('y'))
+        self.assertEqual(store[1], Missing('x'))
+        self.assertEqual(store[True], Missing('x'))
+        self.assertEqual(store[('a', 2.0)], Extra('y'))
+        self.assertIn(1, store)
+        self.assertNotIn(2, store)
+
+    def test_store_differences(self):
+        store = store_differences(iter([Missing(1), Missing(2)]))
+        self.assertNotIsInstance(store, MappedDifferenceStore)
+        self.assertEqual(list(store), [Missing(1), Missing(2)])
+
+        store = store_differences({'a': [Missing(1)], 'b': Missing(2)})
+        self.assertIsInstance(store, MappedDifferenceStore)
+        self.assertEqual(dict(store), {'a': Missing(1), 'b': Missing(2)})
+
+
+class TestValidateStream(unittest.TestCase):
+    def test_passing(self):
+        self.assertIsNone(validate.stream(iter([2, 4, 6]), int))
+
+    def test_failing(self):
+        with self.assertRaises(ValidationError) as cm:
+            data = (x for x in range(10))
+            validate.stream(data, lambda x: x % 2 == 0, chunk_size=2)
+
+        differences = cm.exception.differences
+        self.assertIsInstance(differences, DifferenceStore)
+        self.assertEqual(len(differences), 5)
+        self.assertEqual(list(differences), [Invalid(x) for x in (1, 3, 5, 7, 9)])
+        self.assertTrue(str(cm.exception).startswith(
+            'does not satisfy <lambda> (5 differences): [\n    Invalid(1),'))
+
+    def test_mapping(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate.stream({'a': [1, 2, 3], 'b': [4, 5]}, lambda x: x < 3)
+
+        differences = cm.exception.differences
+        self.assertIsInstance(differences, MappedDifferenceStore)
+        self.assertEqual(dict(differences), {'a': Invalid(3),
+                                             'b': [Invalid(4), Invalid(5)]})
+
+    def test_acceptance(self):
+        with self.assertRaises(ValidationError) as cm:
+            with accepted(Invalid(1)):
+                validate.stream(range(5), lambda x: x % 2 == 0)
+
+        differences = cm.exception.differences
+        self.assertIsInstance(differences, DifferenceStore)
+        self.assertEqual(list(differences), [Invalid(3)])
+
+        with accepted(Invalid):  # <- Accepts all.
+            validate.stream(range(5), lambda x: x % 2 == 0)
+
+    def test_max_differences(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate.stream(range(5), lambda x: x % 2 == 0, max_differences=1)
+
+        self.assertEqual(cm.exception.differences, [Invalid(1)])
+        self.assertEqual(cm.exception.omitted, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
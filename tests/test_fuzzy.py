@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import difflib
+import random
+import threading
+from . import _unittest as unittest
+
+from datatest import _fuzzy
+from datatest._fuzzy import fuzzy_match
+from datatest._utils import LRUCache
+
+
+class TestFuzzyMatch(unittest.TestCase):
+    def test_matches(self):
+        self.assertTrue(fuzzy_match('Saint Louis', 'St. Louis', 0.6))
+        self.assertFalse(fuzzy_match('New York', 'New York City', 0.8))
+        self.assertTrue(fuzzy_match('abc', 'abc', 1.0))
+        self.assertTrue(fuzzy_match('', '', 1.0))
+
+    def test_same_as_ratio(self):
+        rand = random.Random(1234)
+        strings = [''.join(rand.choice('abcd ') for _ in range(rand.randrange(15)))
+                   for _ in range(50)]
+        for _ in range(1000):
+            a = rand.choice(strings)
+            b = rand.choice(strings)
+            cutoff = rand.random()
+            expected = difflib.SequenceMatcher(a=a, b=b).ratio() >= cutoff
+            self.assertEqual(fuzzy_match(a, b, cutoff), expected)
+
+    def test_non_sequences(self):
+        self.assertFalse(fuzzy_match('abc', 123, 0.6))
+        self.assertFalse(fuzzy_match(123, 'abc', 0.6))
+
+    def test_unhashable_sequences(self):
+        self.assertTrue(fuzzy_match([1, 2, 3], [1, 2, 3], 1.0))
+        self.assertFalse(fuzzy_match([1, 2, 3], [4, 5, 6], 0.6))
+
+    def test_matchers_reused(self):
+        _fuzzy._local.matchers = LRUCache(2)
+        fuzzy_match('abc', 'abd', 0.6)
+        matcher = _fuzzy._get_matcher('abd')
+        fuzzy_match('xbd', 'abd', 0.6)
+        self.assertIs(_fuzzy._get_matcher('abd'), matcher)
+
+    def test_least_recently_used_evicted(self):
+        _fuzzy._local.matchers = LRUCache(2)
+        matcher_a = _fuzzy._get_matcher('a')
+        matcher_b = _fuzzy._get_matcher('b')
+        _fuzzy._get_matcher('a')  # <- Makes 'b' the least recently used.
+        _fuzzy._get_matcher('c')  # <- Evicts 'b'.
+        self.assertIs(_fuzzy._get_matcher('a'), matcher_a)
+        self.assertIsNot(_fuzzy._get_matcher('b'), matcher_b)
+
+    def test_threads(self):
+        """Each thread should use its own matchers."""
+        _fuzzy._local.matchers = LRUCache(8)
+        main_matcher = _fuzzy._get_matcher('abd')
+        thread_matchers = []
+        thread = threading.Thread(
+            target=lambda: thread_matchers.append(_fuzzy._get_matcher('abd')))
+        thread.start()
+        thread.join()
+        self.assertIsNot(thread_matchers[0], main_matcher)
+
+if __name__ == '__main__':
+    unittest.main()
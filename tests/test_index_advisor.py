@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import sqlite3
+from . import _unittest as unittest
+
+from datatest._load.temptable import create_table
+from datatest._query.index_advisor import get_indexed_columns
+from datatest._query.index_advisor import is_covered
+from datatest._query.index_advisor import IndexAdvisor
+from datatest._query.query import Select
+
+
+class TestGetIndexedColumns(unittest.TestCase):
+    def test_indexed_columns(self):
+        cursor = sqlite3.connect(':memory:').cursor()
+        create_table(cursor, 'test_table', ['A', 'B', 'C'])
+        self.assertEqual(get_indexed_columns(cursor, 'test_table'), [])
+
+        cursor.execute('CREATE INDEX idx_a ON test_table ("A")')
+        cursor.execute('CREATE INDEX idx_cb ON test_table ("C", "B")')
+        indexed = get_indexed_columns(cursor, 'test_table')
+        self.assertEqual(sorted(indexed), [('A',), ('C', 'B')])
+
+    def test_is_covered(self):
+        indexed = [('A',), ('C', 'B')]
+        self.assertTrue(is_covered(('A',), indexed))
+        self.assertTrue(is_covered(('C',), indexed), msg='leading column')
+        self.assertFalse(is_covered(('B',), indexed))
+        self.assertFalse(is_covered(('A', 'B'), indexed))
+
+
+class TestIndexAdvisor(unittest.TestCase):
+    def test_record(self):
+        advisor = IndexAdvisor()  # <- No threshold.
+        self.assertFalse(advisor.record(('A',)))
+        self.assertFalse(advisor.record(('A',)))
+        self.assertEqual(advisor.usage[('A',)], 2)
+
+    def test_record_threshold(self):
+        advisor = IndexAdvisor(threshold=2)
+        self.assertFalse(advisor.record(('A',)))
+        self.assertTrue(advisor.record(('A',)))
+
+        advisor.indexed.add(('A',))
+        self.assertFalse(advisor.record(('A',)), msg='already indexed')
+
+    def test_recommendations(self):
+        advisor = IndexAdvisor()
+        advisor.record(('B',))
+        advisor.record(('A', 'B'))
+        advisor.record(('A', 'B'))
+        advisor.record(('C',))
+
+        expected = [(('A', 'B'), 2), (('B',), 1), (('C',), 1)]
+        self.assertEqual(advisor.recommendations(), expected)
+
+        expected = [(('A', 'B'), 2), (('B',), 1)]
+        self.assertEqual(advisor.recommendations([('C', 'A')]), expected)
+
+
+class TestSelectIndexes(unittest.TestCase):
+    def setUp(self):
+        self.select = Select([
+            ['A', 'B', 'C'],
+            ['x', 'foo', 20],
+            ['x', 'foo', 30],
+            ['y', 'bar', 10],
+        ])
+
+    def test_recommend_indexes(self):
+        self.select({'A': 'C'}).fetch()        # <- ORDER BY "A"
+        self.select({'A': 'C'}).sum().fetch()  # <- GROUP BY "A"
+        self.select('C', B='foo').fetch()      # <- WHERE B=?
+        query = self.select(('A', 'B')).filter(('x', 'foo'))
+        query.fetch()                          # <- WHERE "A"=? AND "B"=?
+
+        expected = [(('A',), 3), (('B',), 2)]
+        self.assertEqual(self.select.recommend_indexes(), expected)
+
+        self.select.create_index('A')
+        expected = [(('B',), 2)]
+        self.assertEqual(self.select.recommend_indexes(), expected)
+
+    def test_empty_select(self):
+        self.assertEqual(Select().recommend_indexes(), [])
+
+    def test_auto_index(self):
+        select = Select([['A', 'B'], ['x', 1], ['y', 2]], auto_index=2)
+        select._index_advisor.min_rows = 3
+
+        select({'A': 'B'}).fetch()
+        select({'A': 'B'}).fetch()
+        self.assertEqual(select.recommend_indexes(), [(('A',), 2)],
+                         msg='table has too few rows to index')
+        self.assertEqual(select._row_count, 2, msg='row count is cached')
+
+        select.load_data([['A', 'B'], ['z', 3]])
+        self.assertIsNone(select._row_count, msg='cleared when data is loaded')
+        select({'A': 'B'}).fetch()
+        self.assertEqual(select.recommend_indexes(), [])
+        self.assertEqual(select._index_advisor.indexed, set([('A',)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import sqlite3
+import tempfile
+from . import _unittest as unittest
+
+from datatest._load.lazy_load import LazySource
+from datatest._load.lazy_load import add_columns
+from datatest._load.lazy_load import load_columns
+from datatest._load.temptable import get_columns
+from datatest._query.query import Select
+
+
+class TestLazySource(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, 'data.csv')
+        with open(self.csv_path, 'w') as fh:
+            fh.write('A,B,C\nx,1,p\ny,2,q\n')
+
+        connection = sqlite3.connect(':memory:')
+        connection.isolation_level = None
+        self.cursor = connection.cursor()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_fieldnames(self):
+        source = LazySource(self.csv_path)
+        self.assertEqual(source.fieldnames, ['A', 'B', 'C'])
+
+        source = LazySource([['A', 'B'], ['x', 1]])
+        self.assertEqual(source.fieldnames, ['A', 'B'])
+
+    def test_unsupported_object(self):
+        with self.assertRaises(TypeError):
+            LazySource(iter([['A', 'B'], ['x', 1]]))
+
+    def test_fallback_encoding(self):
+        path = os.path.join(self.temp_dir, 'latin1.csv')
+        with open(path, 'wb') as fh:
+            fh.write(b'A,B\n\xe9,1\n')
+
+        with self.assertWarns(UserWarning):
+            source = LazySource(path)
+        load_columns(self.cursor, 'testtable', [source], ['A'])
+        self.cursor.execute('SELECT A FROM testtable')
+        self.assertEqual(self.cursor.fetchall(), [(u'\xe9',)])
+
+    def test_load_and_add_columns(self):
+        sources = [
+            LazySource(self.csv_path),
+            LazySource([['A', 'D'], ['z', 9]]),
+        ]
+        load_columns(self.cursor, 'testtable', sources, ['A'])
+        self.assertEqual(get_columns(self.cursor, 'testtable'), ['A'])
+        self.assertEqual([x.row_count for x in sources], [2, 1])
+
+        add_columns(self.cursor, 'testtable', sources, ['C', 'D'])
+        self.cursor.execute('SELECT A, C, D FROM testtable')
+        expected = [('x', 'p', ''), ('y', 'q', ''), ('z', '', 9)]
+        self.assertEqual(self.cursor.fetchall(), expected)
+
+    def test_no_requested_columns(self):
+        sources = [
+            LazySource([['A'], ['x'], ['y']]),
+            LazySource([['B'], ['z']]),
+        ]
+        load_columns(self.cursor, 'testtable', sources, ['B'])
+        self.cursor.execute('SELECT B FROM testtable')
+        self.assertEqual(self.cursor.fetchall(), [('',), ('',), ('z',)])
+
+
+class TestSelectLazy(unittest.TestCase):
+    def setUp(self):
+        self.data1 = [['A', 'B', 'C'], ['x', 1, 'p'], ['y', 2, 'q']]
+        self.data2 = [['A', 'D'], ['z', 9]]
+
+    def test_deferred_loading(self):
+        select = Select(self.data1, lazy=True)
+        self.assertIsNone(select._table, msg='nothing loaded before query')
+        self.assertEqual(select.fieldnames, ['A', 'B', 'C'])
+
+        self.assertEqual(select('A', B=2).fetch(), ['y'])
+        self.assertEqual(select._lazy_columns, ['A', 'B'])
+
+    def test_same_results_as_eager(self):
+        lazy = Select(self.data1, lazy=True)
+        lazy.load_data(self.data2)
+        eager = Select(self.data1)
+        eager.load_data(self.data2)
+        self.assertEqual(lazy.fieldnames, eager.fieldnames)
+
+        for columns in ['A', {'A': 'B'}, ('A', 'C', 'D')]:
+            self.assertEqual(lazy(columns).fetch(), eager(columns).fetch())
+
+    def test_load_data_after_query(self):
+        select = Select(self.data1, lazy=True)
+        select('A').fetch()
+        select.load_data(self.data2)
+        self.assertEqual(select(('A', 'D')).fetch(),
+                         [('x', ''), ('y', ''), ('z', 9)])
+
+    def test_unsupported_options(self):
+        with self.assertRaises(ValueError):
+            Select(self.data1, lazy=True, types=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
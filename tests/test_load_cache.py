@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import glob
+import os
+import shutil
+import sqlite3
+import tempfile
+from . import _unittest as unittest
+
+from datatest._load.load_cache import get_cache_path
+from datatest._load.load_cache import build_cache
+from datatest._load.load_cache import load_from_cache
+from datatest._load.load_cache import load_cached
+from datatest._query.query import Select
+
+
+class TestLoadCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.csv_path = os.path.join(self.temp_dir, 'data.csv')
+        with open(self.csv_path, 'w') as fh:
+            fh.write('A,B\nx,1\ny,2\n')
+
+        connection = sqlite3.connect(':memory:')
+        connection.isolation_level = None
+        self.cursor = connection.cursor()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_get_cache_path(self):
+        path1 = get_cache_path(self.cache_dir, self.csv_path)
+        path2 = get_cache_path(self.cache_dir, self.csv_path)
+        self.assertEqual(path1, path2)
+        self.assertEqual(os.path.dirname(path1), self.cache_dir)
+
+        path3 = get_cache_path(self.cache_dir, self.csv_path, encoding='latin-1')
+        self.assertNotEqual(path1, path3, msg='load kwds are part of key')
+
+        with open(self.csv_path, 'a') as fh:
+            fh.write('z,3\n')
+        path4 = get_cache_path(self.cache_dir, self.csv_path)
+        self.assertNotEqual(path1, path4, msg='file size is part of key')
+
+    def test_build_and_load(self):
+        cache_path = get_cache_path(self.cache_dir, self.csv_path)
+        self.assertTrue(build_cache(cache_path, self.csv_path))
+        self.assertTrue(os.path.exists(cache_path))
+        self.assertEqual(glob.glob(cache_path + '*.tmp'), [])
+
+        load_from_cache(self.cursor, 'testtable', cache_path)
+        self.cursor.execute('SELECT A, B FROM testtable')
+        self.assertEqual(list(self.cursor), [('x', '1'), ('y', '2')])
+
+    def test_build_empty_file(self):
+        empty_path = os.path.join(self.temp_dir, 'empty.csv')
+        open(empty_path, 'w').close()
+
+        cache_path = get_cache_path(self.cache_dir, empty_path)
+        self.assertFalse(build_cache(cache_path, empty_path))
+        self.assertFalse(os.path.exists(cache_path))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_load_cached_reuses_file(self):
+        load_cached(self.cursor, 'testtable', self.cache_dir, self.csv_path)
+        cache_path = get_cache_path(self.cache_dir, self.csv_path)
+
+        # Replace cache contents to verify that the source is not re-parsed.
+        connection = sqlite3.connect(cache_path)
+        connection.execute("UPDATE cached_data SET A='cached'")
+        connection.commit()
+        connection.close()
+
+        load_cached(self.cursor, 'othertable', self.cache_dir, self.csv_path)
+        self.cursor.execute('SELECT A, B FROM othertable')
+        self.assertEqual(list(self.cursor), [('cached', '1'), ('cached', '2')])
+
+    def test_select_cache_dir(self):
+        select = Select(self.csv_path, cache_dir=self.cache_dir)
+        self.assertEqual(select('A').fetch(), ['x', 'y'])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        select = Select(self.csv_path, cache_dir=self.cache_dir)
+        self.assertEqual(select(('A', 'B')).fetch(), [('x', '1'), ('y', '2')])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        other_path = os.path.join(self.temp_dir, 'other.csv')
+        with open(other_path, 'w') as fh:
+            fh.write('A,C\nz,3\n')
+        select.load_data(other_path, cache_dir=self.cache_dir)
+        self.assertEqual(select.fieldnames, ['A', 'B', 'C'])
+        self.assertEqual(select('A').fetch(), ['x', 'y', 'z'])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 import os
+import shutil
 import sqlite3
 import sys
+import tempfile
 import warnings
 from . import _io as io
 from . import _unittest as unittest
 from datatest._compatibility.builtins import *
 
 from datatest._load.load_csv import load_csv
+from datatest._load.load_csv import read_csv_files
 
 try:
     from StringIO import StringIO
@@ -153,3 +156,79 @@ class TestLoadCsv(unittest.TestCase):
 
         error_message = str(cm.exception)
         self.assertIn('cannot attempt fallback', error_message.lower())
+
+
+class TestReadCsv(unittest.TestCase):
+    def setUp(self):
+        self.original_cwd = os.path.abspath(os.getcwd())
+        os.chdir(os.path.join(os.path.dirname(__file__), 'sample_files'))
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+
+    def test_read_csv_files_fallback(self):
+        """The encoding should be chosen while parsing each file."""
+        paths = ['sample_text_iso88591.csv']
+        with warnings.catch_warnings(record=True) as warning_list:
+            warnings.simplefilter('always')
+            files = read_csv_files(paths, 1)
+            rows = [tuple(x) for x in next(files)]
+            files.close()
+
+        self.assertEqual(len(warning_list), 1)
+        expected = "using fallback 'latin-1'"
+        self.assertIn(expected, str(warning_list[0].message))
+        self.assertEqual(rows, [('col1', 'col2'), ('iso88591', chr(0xe6))])
+
+    def test_read_csv_files_encoding_mismatch(self):
+        files = read_csv_files(['sample_text_iso88591.csv'], 1, 'utf-8')
+        with self.assertRaises(UnicodeDecodeError):
+            next(files)
+        files.close()
+
+    def test_read_csv_files(self):
+        paths = ['sample_text_utf8.csv', 'sample_text_iso88591.csv']
+        with warnings.catch_warnings(record=True) as warning_list:
+            warnings.simplefilter('always')
+            results = [[tuple(row) for row in rows]
+                       for rows in read_csv_files(paths, 2)]
+
+        self.assertEqual(len(warning_list), 1, msg='warning from worker')
+        expected = [
+            [('col1', 'col2'), ('utf8', chr(0x03b1))],
+            [('col1', 'col2'), ('iso88591', chr(0xe6))],
+        ]
+        self.assertEqual(results, expected)
+
+    def test_read_csv_files_batches(self):
+        """Files larger than one batch should be sent in order and rows
+        not used by the caller should be skipped.
+        """
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        paths = []
+        for name, size in [('a.csv', 2500), ('b.csv', 10), ('c.csv', 1200)]:
+            path = os.path.join(tempdir, name)
+            with io.open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(u'col1\n')
+                for x in range(size):
+                    f.write(u'{0}{1}\n'.format(name[0], x))
+            paths.append(path)
+
+        files = read_csv_files(paths, 2)
+        rows = list(next(files))
+        self.assertEqual(len(rows), 2501)
+        self.assertEqual(rows[-1], ['a2499'])
+
+        next(next(files))  # <- Use only the header row of b.csv.
+
+        rows = list(next(files))
+        self.assertEqual(rows[:2], [['col1'], ['c0']])
+        self.assertEqual(len(rows), 1201)
+
+    def test_read_csv_files_error(self):
+        files = read_csv_files(['sample_text_utf8.csv', 'missing_file.csv'], 2)
+        self.assertEqual(len(list(next(files))), 2)
+        with self.assertRaises(IOError):
+            list(next(files))
+        files.close()
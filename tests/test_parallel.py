@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from . import _unittest as unittest
+
+import datatest._parallel
+from datatest.difference import Deviation
+from datatest.difference import Extra
+from datatest.difference import Invalid
+from datatest.difference import Missing
+from datatest.requirements import RequiredMapping
+from datatest.requirements import RequiredPredicate
+from datatest.requirements import RequiredSet
+from datatest.requirements import RequiredUnique
+from datatest._parallel import apply_requirement
+from datatest.validation import ValidationError
+
+
+class TestApplyRequirement(unittest.TestCase):
+    def setUp(self):
+        self._orig_chunk_size = datatest._parallel.PARALLEL_CHUNK_SIZE
+        datatest._parallel.PARALLEL_CHUNK_SIZE = 3  # <- Use several chunks.
+
+    def tearDown(self):
+        datatest._parallel.PARALLEL_CHUNK_SIZE = self._orig_chunk_size
+
+    def assertSameResult(self, requirement, data):
+        """Parallel and serial results should be the same."""
+        expected = requirement(data)
+        actual = apply_requirement(requirement, data, workers=2)
+        if expected is None:
+            self.assertIsNone(actual)
+            return
+
+        expected_diffs, expected_desc = expected
+        actual_diffs, actual_desc = actual
+        self.assertEqual(ValidationError(actual_diffs).differences,
+                         ValidationError(expected_diffs).differences)
+        self.assertEqual(actual_desc, expected_desc)
+
+    def test_predicate(self):
+        requirement = RequiredPredicate(lambda x: x % 3 != 0)
+        self.assertSameResult(requirement, range(20))
+
+        result = apply_requirement(requirement, range(10), workers=2)
+        differences, description = result
+        self.assertEqual(list(differences), [Invalid(0), Invalid(3), Invalid(6), Invalid(9)])
+        self.assertEqual(description, 'does not satisfy <lambda>')
+
+    def test_passing(self):
+        requirement = RequiredPredicate(int)
+        self.assertIsNone(apply_requirement(requirement, [1, 2, 3, 4], workers=2))
+
+    def test_set(self):
+        requirement = RequiredSet(set([1, 2, 9]))
+        result = apply_requirement(requirement, [1, 2, 3, 4] * 5, workers=2)
+        differences, description = result
+        self.assertEqual(set(differences), set([Missing(9), Extra(3), Extra(4)]))
+        self.assertEqual(description, 'does not satisfy set membership')
+
+    def test_set_unhashable(self):
+        """Unhashable elements repeated in several chunks should only
+        be reported once.
+        """
+        requirement = RequiredSet(set([1]))
+        result = apply_requirement(requirement, [1, [2], {'a': 3}] * 4, workers=2)
+        differences, _ = result
+        differences = list(differences)
+        self.assertEqual(len(differences), 2)
+        self.assertIn(Extra([2]), differences)
+        self.assertIn(Extra({'a': 3}), differences)
+
+    def test_mapping_data(self):
+        data = dict((k, list(range(k))) for k in range(8))
+        requirement = RequiredPredicate(lambda x: x < 5)
+        self.assertSameResult(requirement, data)
+
+    def test_required_mapping(self):
+        data = {'a': [1, 2], 'b': 5, 'c': 'x', 'd': 7}
+        requirement = RequiredMapping({'a': int, 'b': 6, 'c': 'x', 'e': 1})
+        self.assertSameResult(requirement, data)
+
+        result = apply_requirement(requirement, data, workers=2)
+        differences, description = result
+        self.assertEqual(dict(differences)['e'], Deviation(-1, 1))
+        self.assertEqual(description, 'does not satisfy mapping requirements')
+
+    def test_consistent_mapping_description(self):
+        data = {'a': 1, 'b': 2, 'c': 3, 'd': 4}
+        requirement = RequiredMapping({'a': 0, 'b': 0, 'c': 0, 'd': 0})
+        differences, description = apply_requirement(requirement, data, workers=2)
+        self.assertEqual(description, 'does not satisfy 0')
+
+    def test_unsupported_requirement(self):
+        """Order-dependent requirements are applied in one process."""
+        self.assertSameResult(RequiredUnique(), [1, 2, 2, 3, 3, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,8 +4,6 @@ from . import _unittest as unittest
 import re
 
 from datatest._predicate import (
-    _check_type,
-    _check_callable,
     _check_wildcard,
     _check_truthy,
     _check_falsy,
@@ -13,31 +11,34 @@ from datatest._predicate import (
     _check_set,
     _get_matcher_parts,
     get_matcher,
+    get_match_function,
     MatcherBase,
     MatcherObject,
     MatcherTuple,
     Predicate,
 )
+from datatest._utils import CacheInfo
 
 
-class TestCheckType(unittest.TestCase):
+class TestTypeHandler(unittest.TestCase):
     def test_isinstance(self):
-        function = lambda x: _check_type(int, x)
+        function, _ = _get_matcher_parts(int)
         self.assertTrue(function(0))
         self.assertTrue(function(1))
         self.assertFalse(function(0.0))
         self.assertFalse(function(1.0))
 
     def test_is_type(self):
-        self.assertTrue(_check_type(int, int))
+        function, _ = _get_matcher_parts(int)
+        self.assertTrue(function(int))
 
 
-class TestCheckCallable(unittest.TestCase):
+class TestCallableHandler(unittest.TestCase):
     def test_function(self):
         def divisible3or5(x):  # <- Helper function.
             return (x % 3 == 0) or (x % 5 == 0)
 
-        function = lambda x: _check_callable(divisible3or5, x)
+        function, _ = _get_matcher_parts(divisible3or5)
         self.assertFalse(function(1))
         self.assertFalse(function(2))
         self.assertTrue(function(3))
@@ -49,7 +50,7 @@ class TestCheckCallable(unittest.TestCase):
         def fails_internally(x):  # <- Helper function.
             raise TypeError('raising an error')
 
-        function = lambda x: _check_callable(fails_internally, x)
+        function, _ = _get_matcher_parts(fails_internally)
         with self.assertRaises(TypeError):
             self.assertFalse(function('abc'))
 
@@ -57,14 +58,14 @@ class TestCheckCallable(unittest.TestCase):
         def always_false(x):  # <- Helper function.
             return False
 
-        function = lambda x: _check_callable(always_false, x)
+        function, _ = _get_matcher_parts(always_false)
         self.assertTrue(function(always_false))
 
     def test_identity_with_error(self):
         def fails_internally(x):  # <- Helper function.
             raise TypeError('raising an error')
 
-        function = lambda x: _check_callable(fails_internally, x)
+        function, _ = _get_matcher_parts(fails_internally)
         self.assertTrue(function(fails_internally))
 
 
@@ -270,6 +271,56 @@ class TestGetMatcher(unittest.TestCase):
         self.assertEqual(repr(matcher), expected)
 
 
+class TestGetMatchFunction(unittest.TestCase):
+    def assertSameResults(self, obj, values):
+        matcher = get_matcher(obj)
+        function = get_match_function(obj)
+        for value in values:
+            self.assertEqual(function(value), matcher == value, msg=repr(value))
+
+    def test_single_value(self):
+        values = [1, 1.0, 'abc', 'xyz', None, int]
+        self.assertSameResults(int, values)
+        self.assertSameResults(re.compile('b'), ['abc', 'xyz', ''])
+        self.assertSameResults(set(['abc', 1]), values)
+        self.assertSameResults('abc', values)
+        self.assertSameResults(True, values)
+
+    def test_tuple_of_values(self):
+        def isodd(x):
+            return x % 2 == 1
+
+        obj = ('abc', isodd, Ellipsis, float)
+        values = [
+            ('abc', 1, None, 1.0),
+            ('abc', 2, None, 1.0),   # <- Callable returns False.
+            ('xyz', 1, None, 1.0),   # <- Does not equal string.
+            ('abc', 1, None, 1),     # <- Not instance of type.
+            ('abc', 1, 1.0),         # <- Different length.
+            ['abc', 1, None, 1.0],   # <- Not a tuple.
+            'abc',
+        ]
+        self.assertSameResults(obj, values)
+
+    def test_tuple_subclass(self):
+        from collections import namedtuple
+        Row = namedtuple('Row', ['a', 'b'])
+        self.assertSameResults(('x', int), [Row('x', 1), Row('x', 'y')])
+
+    def test_regex_error(self):
+        function = get_match_function(re.compile('abc'))
+        with self.assertRaises(TypeError):
+            function(123)
+
+        function = get_match_function(('x', re.compile('abc')))
+        self.assertFalse(function(('y', 123)), msg='stops at first mismatch')
+
+    def test_passthrough(self):
+        token = object()
+        function = get_match_function(lambda x: token)
+        self.assertIs(function(1), token)
+
+
 class TestPredicate(unittest.TestCase):
     def test_predicate_function(self):
         pred = Predicate('abc')
@@ -355,5 +406,68 @@ class TestPredicate(unittest.TestCase):
         self.assertIs(predicate(5), TOKEN, msg='TOKEN should be returned, not True.')
 
 
+
+class TestPredicateCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def isodd(x):
+            self.calls.append(x)
+            return x % 2 == 1
+
+        self.isodd = isodd
+
+    def test_repeated_values(self):
+        pred = Predicate(self.isodd, cache_size=8)
+        results = [pred(x) for x in [1, 2, 1, 1, 2, 3]]
+        self.assertEqual(results, [True, False, True, True, False, True])
+        self.assertEqual(self.calls, [1, 2, 3])
+        self.assertEqual(pred.cache_info(), CacheInfo(3, 3, 8, 3))
+
+    def test_types_distinguished(self):
+        pred = Predicate(int, cache_size=8)
+        self.assertTrue(pred(1))
+        self.assertFalse(pred(1.0))
+        self.assertTrue(pred(True))  # <- bool is a subclass of int.
+
+        pred = Predicate(('a', int), cache_size=8)
+        self.assertTrue(pred(('a', 1)))
+        self.assertFalse(pred(('a', 1.0)))
+
+    def test_lru_eviction(self):
+        pred = Predicate(self.isodd, cache_size=2)
+        pred(1)
+        pred(2)
+        pred(1)  # <- Makes 2 the least recently used.
+        pred(3)  # <- Evicts 2.
+        self.assertEqual(pred.cache_info().currsize, 2)
+
+        pred(1)
+        pred(3)
+        self.assertEqual(self.calls, [1, 2, 3])
+        pred(2)
+        self.assertEqual(self.calls, [1, 2, 3, 2])
+
+    def test_unhashable(self):
+        pred = Predicate(len, cache_size=8)
+        self.assertTrue(pred([1, 2]))
+        self.assertFalse(pred([]))
+        self.assertEqual(pred.cache_info(), CacheInfo(0, 2, 8, 0))
+
+    def test_inverted(self):
+        pred = Predicate(self.isodd, cache_size=8)
+        inverted = ~pred
+        self.assertTrue(pred(1))
+        self.assertFalse(inverted(1))
+        self.assertEqual(self.calls, [1], msg='cache should be shared')
+
+    def test_disabled(self):
+        pred = Predicate(self.isodd)
+        pred(1)
+        pred(1)
+        self.assertEqual(self.calls, [1, 1])
+        self.assertEqual(pred.cache_info(), CacheInfo(0, 0, 0, 0))
+
+
 if __name__ == '__main__':
     unittest.main()
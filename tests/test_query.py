@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 from __future__ import division
+import gc
+import glob
 import os
 import re
 import shutil
@@ -10,12 +12,14 @@ import textwrap
 from . import _io as io
 
 from . import _unittest as unittest
+import datatest._query.query
 from datatest._compatibility.builtins import *
 from datatest._compatibility.collections import namedtuple
 from datatest._compatibility.collections.abc import Mapping
 from datatest._utils import IterItems
 from datatest._utils import nonstringiter
 
+from datatest._load.temptable import table_exists
 from datatest._load.working_directory import working_directory
 from datatest._query.query import (
     BaseElement,
@@ -29,12 +33,16 @@ from datatest._query.query import (
     _unwrap_data,
     _apply_data,
     _apply_to_data,  # <- TODO: Change function name.
+    _make_dataresult,
     _sqlite_sum,
     _sqlite_count,
     _sqlite_avg,
     _sqlite_min,
     _sqlite_max,
     _sqlite_distinct,
+    _split_filter,
+    _FusedSteps,
+    _fused_data,
     _normalize_columns,
     _parse_columns,
     RESULT_TOKEN,
@@ -869,6 +877,53 @@ class TestDistinctData(unittest.TestCase):
         self.assertEqual(result.fetch(), {'a': 2, 'b': 3})
 
 
+class TestSplitFilter(unittest.TestCase):
+    def test_single_column(self):
+        self.assertEqual(_split_filter(['A'], 'x'), ((('A', 'x'),), ()))
+        self.assertEqual(_split_filter(['A'], 5), ((('A', 5),), ()))
+        self.assertEqual(_split_filter(['A'], True), ((('A', True),), ()))
+        self.assertEqual(_split_filter(['A'], Ellipsis), ((), ()))
+
+        values = set(['x', 'y'])
+        self.assertEqual(_split_filter(['A'], values), ((('A', values),), ()))
+
+    def test_not_translatable(self):
+        func = lambda x: True
+        self.assertEqual(_split_filter(['A'], func), ((), (func,)))
+        self.assertEqual(_split_filter(['A'], int), ((), (int,)))
+        self.assertEqual(_split_filter(['A'], None), ((), (None,)))
+        self.assertEqual(_split_filter(['A'], float('inf')), ((('A', float('inf')),), ()))
+
+        nan = float('nan')
+        self.assertEqual(_split_filter(['A'], nan), ((), (nan,)))
+
+        regex = re.compile('x')
+        self.assertEqual(_split_filter(['A'], regex), ((), (regex,)))
+
+        mixed = set(['x', ('y', 'z')])
+        self.assertEqual(_split_filter(['A'], mixed), ((), (mixed,)))
+
+    def test_mapping(self):
+        self.assertEqual(_split_filter({'A': ['B']}, 'x'), ((), ('x',)))
+
+    def test_tuple_columns(self):
+        result = _split_filter([('A', 'B')], ('x', 'y'))
+        self.assertEqual(result, ((('A', 'x'), ('B', 'y')), ()))
+
+        func = lambda x: True
+        result = _split_filter([('A', 'B')], ('x', func))
+        self.assertEqual(result, ((('A', 'x'),), ((Ellipsis, func),)))
+
+        result = _split_filter([('A', 'B')], (func, func))
+        self.assertEqual(result, ((), ((func, func),)))
+
+        result = _split_filter([('A', 'B')], ('x', 'y', 'z'))  # <- Bad length.
+        self.assertEqual(result, ((), (('x', 'y', 'z'),)))
+
+        result = _split_filter([('A', 'B')], 'x')  # <- Not a tuple.
+        self.assertEqual(result, ((), ('x',)))
+
+
 class Test_select_functions(unittest.TestCase):
     def test_normalize_columns(self):
         no_change = 'no change for valid containers'
@@ -1261,6 +1316,174 @@ class TestQuery(unittest.TestCase):
         )
         self.assertEqual(optimized, expected)
 
+    def test_optimize_filter(self):
+        """
+        Unoptimized:
+            Select._select(['col1'], col2='xyz').filter('a')
+
+        Optimized:
+            Select._select(['col1'], ('col1', 'a'), col2='xyz')
+        """
+        unoptimized = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, (['col1'],), {'col2': 'xyz'}),
+            (_filter_data, ('a', RESULT_TOKEN,), {}),
+        )
+        optimized = Query._optimize(unoptimized)
+
+        expected = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, (['col1'], ('col1', 'a')), {'col2': 'xyz'}),
+        )
+        self.assertEqual(optimized, expected)
+
+    def test_optimize_filter_residual(self):
+        """
+        Unoptimized:
+            Select._select([('col1', 'col2')]).filter(('a', isodd)).sum()
+
+        Optimized:
+            Select._select([('col1', 'col2')], ('col1', 'a')).filter((..., isodd)).sum()
+        """
+        isodd = lambda x: x % 2 == 1
+        unoptimized = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, ([('col1', 'col2')],), {}),
+            (_filter_data, (('a', isodd), RESULT_TOKEN,), {}),
+            (_apply_to_data, (_sqlite_sum, RESULT_TOKEN,), {}),
+        )
+        optimized = Query._optimize(unoptimized)
+
+        expected = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, ([('col1', 'col2')], ('col1', 'a')), {}),
+            (_filter_data, ((Ellipsis, isodd), RESULT_TOKEN,), {}),
+            (_apply_to_data, (_sqlite_sum, RESULT_TOKEN,), {}),
+        )
+        self.assertEqual(optimized, expected)
+
+    def test_optimize_filter_aggregation(self):
+        """
+        Unoptimized:
+            Select._select(['col1']).filter(set(['a', 'b'])).count()
+
+        Optimized:
+            Select._select_aggregate('COUNT', ['col1'], ('col1', set(['a', 'b'])))
+        """
+        unoptimized = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, (['col1'],), {}),
+            (_filter_data, (set(['a', 'b']), RESULT_TOKEN,), {}),
+            (_apply_to_data, (_sqlite_count, RESULT_TOKEN,), {}),
+        )
+        optimized = Query._optimize(unoptimized)
+
+        expected = (
+            (getattr, (RESULT_TOKEN, '_select_aggregate'), {}),
+            (RESULT_TOKEN, ('COUNT', ['col1'], ('col1', set(['a', 'b']))), {}),
+        )
+        self.assertEqual(optimized, expected)
+
+    def test_optimize_filter_results(self):
+        """Optimized and unoptimized queries must give the same results."""
+        source = Select([
+            ('A', 'B', 'C'),
+            ('x', 1, ''),
+            ('y', 2, '0'),
+            ('z', 0, None),
+            ('x', 3.0, 'a'),
+            ('w', None, 0),
+        ])
+
+        def fetch(query, optimize):
+            result = query.execute(optimize=optimize)
+            if isinstance(result, Result):
+                return result.fetch()
+            return result
+
+        queries = [
+            source('A').filter('x'),
+            source({'A'}).filter(set(['x', 'z'])),
+            source('A').filter(set()),
+            source('B').filter(),
+            source('C').filter(True),
+            source('C').filter(False),
+            source('B').filter(3).sum(),
+            source({'A'}).filter(set(['x', 'y'])).count(),
+            source([('A', 'B')]).filter(('x', Ellipsis)),
+            source([('A', 'B')]).filter((set(['x', 'y']), lambda b: b > 1)),
+            source({'A': 'B'}).filter(1),  # <- Mapping, not pushed down.
+            source('A').filter(lambda a: a > 'w').filter('x'),
+            source('A').filter(Ellipsis).filter('y').distinct(),
+        ]
+        for query in queries:
+            self.assertEqual(fetch(query, True), fetch(query, False), msg=repr(query))
+
+        self.assertEqual(source('A').filter(set()).fetch(), [])
+
+    def test_optimize_fusion(self):
+        """
+        Unoptimized:
+            Query.from_object(...).map(f).filter(g).map(h).sum()
+
+        Optimized:
+            Query.from_object(...).fused[map(f), filter(g), map(h)].sum()
+        """
+        f = lambda x: x * 2
+        g = lambda x: x > 2
+        h = lambda x: x + 1
+        unoptimized = (
+            (_make_dataresult, (RESULT_TOKEN,), {}),
+            (_map_data, (f, RESULT_TOKEN,), {}),
+            (_filter_data, (g, RESULT_TOKEN,), {}),
+            (_map_data, (h, RESULT_TOKEN,), {}),
+            (_apply_to_data, (_sqlite_sum, RESULT_TOKEN,), {}),
+        )
+        optimized = Query._optimize(unoptimized)
+
+        fused = _FusedSteps([('map', f), ('filter', g), ('map', h)])
+        expected = (
+            (_make_dataresult, (RESULT_TOKEN,), {}),
+            (_fused_data, (fused, RESULT_TOKEN), {}),
+            (_apply_to_data, (_sqlite_sum, RESULT_TOKEN,), {}),
+        )
+        self.assertEqual(optimized, expected)
+
+        # Single element-wise steps are not fused.
+        unoptimized = (
+            (_make_dataresult, (RESULT_TOKEN,), {}),
+            (_map_data, (f, RESULT_TOKEN,), {}),
+            (_apply_to_data, (_sqlite_sum, RESULT_TOKEN,), {}),
+            (_map_data, (h, RESULT_TOKEN,), {}),
+        )
+        self.assertIsNone(Query._optimize(unoptimized))
+
+    def test_optimize_fusion_results(self):
+        """Fused and unfused queries must give the same results."""
+        double = lambda x: x * 2
+        isodd = lambda x: x % 2 == 1
+        queries = [
+            Query.from_object([1, 2, 3, 4]).map(double).filter(lambda x: x > 4),
+            Query.from_object(set([1, 2, 3])).filter(isodd).filter(lambda x: x > 1),
+            Query.from_object(set([1, 2, 3])).filter(isodd).map(double),
+            Query.from_object([(1, 2), (3, 4)]).starmap(max).map(double),
+            Query.from_object({'a': [1, 2, 3], 'b': set([4, 5])}).map(double).filter(True).map(str),
+            Query.from_object({'a': (1, 2), 'b': 'xyz'}).map(lambda x: [x]).map(len),
+            Query.from_object({'a': [1, 2, 3], 'b': [4, 5]}).filter(isodd).map(double).sum(),
+        ]
+        for query in queries:
+            optimized = query.execute(optimize=True)
+            unoptimized = query.execute(optimize=False)
+            if isinstance(optimized, Result):
+                optimized = optimized.fetch()
+                unoptimized = unoptimized.fetch()
+            self.assertEqual(optimized, unoptimized, msg=repr(query))
+
+        query = Query.from_object({'a': 1}).map(double).filter(isodd)
+        regex = 'expects a collection of data elements'
+        with self.assertRaisesRegex(TypeError, regex):
+            query.fetch()
+
     def test_explain(self):
         query = Query(['col1'])
         expected = """
@@ -1273,7 +1496,20 @@ class TestQuery(unittest.TestCase):
         expected = textwrap.dedent(expected).strip()
         self.assertEqual(query._explain(file=None), expected)
 
-        # TODO: Add assert for query that can be optimized.
+        def upper(x):
+            return x.upper()
+        query = Query(['col1']).map(upper).filter('A').map(len).sum()
+        expected = """
+            Data Source:
+              <none given> (assuming Select object)
+            Execution Plan (optimized):
+              getattr, (<RESULT>, '_select'), {}
+              <RESULT>, (['col1']), {}
+              _fused_data, (fused[map(upper), filter('A'), map(len)], <RESULT>), {}
+              _apply_to_data, (_sqlite_sum, <RESULT>), {}
+        """
+        expected = textwrap.dedent(expected).strip()
+        self.assertEqual(query._explain(file=None), expected)
 
     def test_explain2(self):
         query = Query(['label1'])
@@ -1299,6 +1535,49 @@ class TestQuery(unittest.TestCase):
         returned_value = query._explain(file=None)
         self.assertEqual(returned_value, expected)
 
+    def test_explain_analyze(self):
+        select = Select([['A', 'B'], ['x', 1], ['y', 2], ['x', 3]])
+        query = select({'A': 'B'}, B=lambda x: x > 1).sum()
+
+        text = query._explain(file=None, analyze=True)
+        self.assertIn('Execution Plan (optimized, analyzed):', text)
+        self.assertIn('rows in: -, rows out: 2, function calls: 0', text)
+        self.assertIn('GROUP BY "A"', text)
+        self.assertIn('<- full table scan (consider an index)', text)
+        self.assertRegex(text, r'total time: \d+\.\d{3} ms')
+
+        select.create_index('A')
+        text = query._explain(file=None, analyze=True)
+        self.assertNotIn('<- full table scan', text)
+
+    def test_explain_analyze_rows(self):
+        query = Query.from_object([1, 2, 3, 4]).filter(lambda x: x > 1)
+        text = query._explain(file=None, optimize=False, analyze=True)
+        self.assertIn('Execution Plan (analyzed):', text)
+        self.assertIn('rows in: 4, rows out: 3', text)
+
+        with self.assertRaises(ValueError):
+            Query(['A'])._explain(file=None, analyze=True)
+
+    def test_analyze_function_calls(self):
+        select = Select([['A', 'B'], ['x', 1], ['y', 2], ['x', 3]])
+        original_limit = datatest._query.query.DISTINCT_EVALUATION_LIMIT
+        datatest._query.query.DISTINCT_EVALUATION_LIMIT = 0
+        try:
+            query = select('A', B=lambda x: x > 1)
+            source = query.source
+            execution_plan = query._get_execution_plan(source, query._query_steps)
+            step_stats = query._analyze(source, execution_plan)
+        finally:
+            datatest._query.query.DISTINCT_EVALUATION_LIMIT = original_limit
+
+        self.assertEqual([x['function_calls'] for x in step_stats], [0, 3])
+        self.assertEqual([x['rows_out'] for x in step_stats], [None, 2])
+        statement, query_plan = step_stats[1]['statements'][0]
+        self.assertRegex(statement, r'WHERE FUNC\d+\(B\)')
+        self.assertIsNone(select._analysis, msg='analysis should be ended')
+        self.assertEqual(query.fetch(), ['y', 'x'], msg='functions restored')
+
     def test_repr(self):
         # Check "no select" signature.
         query = Query(['label1'])
@@ -1381,6 +1660,57 @@ class TestSelect(unittest.TestCase):
         select.load_data(readerlike2)
         self.assertEqual(select.fieldnames, ['col1', 'col2', 'col3'])
 
+    def test_load_data_workers(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(temp_dir, 'file1.csv'), 'w') as fh:
+                fh.write('A,B\nx,1\ny,2\n')
+            with open(os.path.join(temp_dir, 'file2.csv'), 'w') as fh:
+                fh.write('A,C\nz,3\n')
+            with open(os.path.join(temp_dir, 'file3.csv'), 'w') as fh:
+                fh.write('A,B\nw,4\n')
+
+            pattern = os.path.join(temp_dir, 'file*.csv')
+            expected = Select(sorted(glob.glob(pattern)))
+            select = Select(sorted(glob.glob(pattern)), workers=2)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        self.assertEqual(select.fieldnames, ['A', 'B', 'C'])
+        self.assertEqual(
+            select(('A', 'B', 'C')).fetch(),
+            expected(('A', 'B', 'C')).fetch(),
+        )
+
+    def test_load_data_types(self):
+        data = [['A', 'B', 'C'], ['x', '1', '0.5'], ['y', '2', '1.5']]
+        select = Select(data, types=True)
+        self.assertEqual(select(('A', 'B', 'C')).fetch(),
+                         [('x', 1, 0.5), ('y', 2, 1.5)])
+        self.assertEqual(select('B').sum().fetch(), 3)
+
+        select = Select(data, types={'B': str})
+        self.assertEqual(select(('A', 'B', 'C')).fetch(),
+                         [('x', '1', 0.5), ('y', '2', 1.5)])
+
+    def test_load_data_types_filter(self):
+        """Filters pushed into SQL should compare values the same
+        way as Python even when columns have a declared type.
+        """
+        data = [['A', 'B'], ['x', '1'], ['y', '2']]
+        select = Select(data, types={'A': str, 'B': int})
+
+        for columns, predicate, expected in [
+            ('B', 1, [1]),
+            ('B', '1', []),
+            ('B', set(['1', 2]), [2]),
+            ('A', 'x', ['x']),
+        ]:
+            query = select(columns).filter(predicate)
+            self.assertEqual(query.fetch(), expected)
+            unoptimized = query.execute(optimize=False)
+            self.assertEqual(list(unoptimized), expected)
+
     def test_repr(self):
         data = [['A', 'B'], ['x', 100], ['y', 200]]
 
@@ -1489,30 +1819,106 @@ class TestSelect(unittest.TestCase):
         self.assertEqual(result[0], 'A IN (?, ?)')
         self.assertEqual(set(result[1]), set(['x', 'y']))
 
-        # User-defined function.
-        userfunc = lambda x: len(x) == 1
-        result = select._build_where_clause({'A': userfunc})
-        self.assertEqual(len(result), 2)
-        self.assertRegex(result[0], r'FUNC\d+\(A\)')
-        self.assertEqual(result[1], [])
+        # User-defined function (used when a column has too many
+        # distinct values to pre-evaluate the predicate).
+        original_limit = datatest._query.query.DISTINCT_EVALUATION_LIMIT
+        datatest._query.query.DISTINCT_EVALUATION_LIMIT = 2
+        try:
+            userfunc = lambda x: len(x) == 1
+            result = select._build_where_clause({'A': userfunc})
+            self.assertEqual(len(result), 2)
+            self.assertRegex(result[0], r'FUNC\d+\(A\)')
+            self.assertEqual(result[1], [])
+
+            # Predicate (a type)
+            prev_len = len(select._user_function_dict)
+            predicate = int
+            result = select._build_where_clause({'A': predicate})
+            self.assertEqual(len(result), 2)
+            self.assertRegex(result[0], r'FUNC\d+\(A\)')
+            self.assertEqual(result[1], [])
+            self.assertEqual(len(select._user_function_dict), prev_len + 1)
+
+            # Predicate (a boolean)
+            prev_len = len(select._user_function_dict)
+            predicate = True
+            result = select._build_where_clause({'A': predicate})
+            self.assertEqual(len(result), 2)
+            self.assertRegex(result[0], r'FUNC\d+\(A\)')
+            self.assertEqual(result[1], [])
+            self.assertEqual(len(select._user_function_dict), prev_len + 1)
+        finally:
+            datatest._query.query.DISTINCT_EVALUATION_LIMIT = original_limit
+
+    def test_build_where_clause_match_table(self):
+        select = Select([['A', 'B'], ['x', 1], ['y', 2], ['x', 3], ['', 4]])
+
+        calls = []
+        def userfunc(x):
+            calls.append(x)
+            return len(x) == 1
+
+        clause, params = select._build_where_clause({'A': userfunc})
+        self.assertRegex(clause, r'^A IN \(SELECT value FROM \w+\)$')
+        self.assertEqual(params, [])
+        self.assertEqual(sorted(calls), ['', 'x', 'y'], msg='once per distinct value')
+        self.assertEqual(select('B', A=userfunc).fetch(), [1, 2, 3])
+
+        # Saved matches are reused and cleared when data is loaded.
+        select('B', A=userfunc).fetch()
+        self.assertEqual(len(calls), 3)
+        cursor = select._connection.cursor()
+        match_table = select._match_tables[0]
+        select.load_data([['A', 'B'], ['z', 5]])
+        self.assertFalse(table_exists(cursor, match_table), msg='table dropped')
+        self.assertEqual(select('B', A=userfunc).fetch(), [1, 2, 3, 5])
+        self.assertEqual(len(calls), 7)
+
+    def test_build_where_clause_match_table_reused_id(self):
+        """Matches saved for a predicate that has been garbage collected
+        must not be used for a new predicate (which may have the same
+        id).
+        """
+        select = Select([['A', 'B'], ['a', 1], ['b', 2], ['c', 3], ['d', 4]])
+        results = []
+        for char in 'abcd':
+            results.append(select('B', A=lambda x: x == char).fetch())
+            gc.collect()
+        self.assertEqual(results, [[1], [2], [3], [4]])
+
+    def test_build_where_clause_match_table_nulls(self):
+        select = Select([['A', 'B'], ['x', 1], [None, 2], ['yy', 3]])
+        result = select('B', A=lambda x: x is None or x == 'x').fetch()
+        self.assertEqual(result, [1, 2])
+
+    def test_build_where_clause_match_table_fallback(self):
+        select = Select([['A', 'B'], [1, 'x'], [1.0, 'y'], [2, 'z']])
+        isint = lambda x: isinstance(x, int)
+        clause, params = select._build_where_clause({'A': isint})
+        self.assertRegex(clause, r'FUNC\d+\(A\)', msg='1 and 1.0 are not distinct')
+        self.assertEqual(select('B', A=isint).fetch(), ['x', 'z'])
+
+        def raises_error(x):
+            if x == 2:
+                raise ValueError
+            return True
+        clause, params = select._build_where_clause({'A': raises_error})
+        self.assertRegex(clause, r'FUNC\d+\(A\)')
+
+    def test_build_where_clause_filters(self):
+        select = Select([['A', 'B'], ['x', 1], ['y', 2], ['z', 3]])
 
-        # Predicate (a type)
-        prev_len = len(select._user_function_dict)
-        predicate = int
-        result = select._build_where_clause({'A': predicate})
-        self.assertEqual(len(result), 2)
-        self.assertRegex(result[0], r'FUNC\d+\(A\)')
-        self.assertEqual(result[1], [])
-        self.assertEqual(len(select._user_function_dict), prev_len + 1)
+        result = select._build_where_clause({'A': 'x'}, [('B', 1)])
+        expected = ('A=? AND ("B"=? AND typeof("B") IN (\'integer\', \'real\'))', ['x', 1])
+        self.assertEqual(result, expected)
 
-        # Predicate (a boolean)
-        prev_len = len(select._user_function_dict)
-        predicate = True
-        result = select._build_where_clause({'A': predicate})
-        self.assertEqual(len(result), 2)
-        self.assertRegex(result[0], r'FUNC\d+\(A\)')
-        self.assertEqual(result[1], [])
-        self.assertEqual(len(select._user_function_dict), prev_len + 1)
+        result = select._build_where_clause({}, [('A', 'x'), ('A', 'y')])
+        expected = ('("A"=? AND typeof("A")=\'text\') AND ("A"=? AND typeof("A")=\'text\')', ['x', 'y'])
+        self.assertEqual(result, expected)
+
+        clause, params = select._build_where_clause({}, [('B', True)])
+        self.assertTrue(clause.startswith('CASE'), msg='should not use FUNC')
+        self.assertEqual(params, [])
 
     def test_execute_query(self):
         data = [['A', 'B'], ['x', 101], ['y', 202], ['z', 303]]
@@ -10,6 +10,8 @@ from datatest import Missing
 from datatest import Extra
 from datatest import Deviation
 from datatest import Invalid
+from datatest import BaseDifference
+from datatest._normalize import normalize
 from datatest._predicate import Predicate
 from datatest.requirements import _build_description
 from datatest.requirements import _wrap_differences
@@ -40,6 +42,16 @@ from datatest.requirements import RequiredInterval
 from datatest.requirements import adapts_mapping
 from datatest.difference import NOVALUE
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
 
 class TestBuildDescription(unittest.TestCase):
     def test_docstring_messy(self):
@@ -1070,6 +1082,18 @@ class TestRequiredPredicate2(unittest.TestCase):
         result = self.requirement([])
         self.assertIsNone(result)
 
+    def test_predicate_cache_size(self):
+        """A cache_size should also apply when given a Predicate."""
+        pred = Predicate(str.isdigit)
+        requirement = RequiredPredicate(pred, cache_size=8)
+        diff, _ = requirement(['10', 'XX', '10'])
+        self.assertEqual(list(diff), [Invalid('XX')])
+        self.assertEqual(requirement._pred.cache_info()[:2], (1, 2))
+        self.assertEqual(pred.cache_info()[:2], (0, 0), msg='original unchanged')
+
+        requirement = RequiredPredicate(pred)
+        self.assertIs(requirement._pred, pred)
+
     def test_some_false_deviations(self):
         """When the predicate returns False, numeric differences should
         be Deviation() objects not Invalid() objects.
@@ -1301,6 +1325,15 @@ class TestRequiredFuzzy(unittest.TestCase):
         self.assertEqual(list(diff), [Invalid((2, 'abx')), Invalid((1, 'xyz'))])
         self.assertEqual(desc, "does not satisfy (1, 'abc'), fuzzy matching at ratio 0.6 or greater")
 
+    def test_cache_size(self):
+        data = ['abx', 'xyz', 'abx', 'xyz', 'abx']
+        requirement = RequiredFuzzy('abc', cache_size=8)
+        diff, _ = requirement(data)
+        self.assertEqual(list(diff), [Invalid('xyz'), Invalid('xyz')])
+
+        hits, misses, _, _ = requirement._pred.cache_info()
+        self.assertEqual((hits, misses), (3, 2))
+
     def test_show_expected(self):
         data = ['abx', 'aby', 'xyz']
 
@@ -1500,6 +1533,21 @@ class TestRequiredSet2(unittest.TestCase):
         differences, description = requirement([])
         self.assertEqual(list(differences), [Missing(1)])
 
+    def test_unhashable_elements(self):
+        requirement = RequiredSet([{'a': 1}, {'b': [2]}, 3])
+        self.assertIsNone(requirement([3, {'b': [2]}, {'a': 1}, {'a': 1}]))
+
+        data = iter([{'a': 1}, {'c': 4}, [5], {'c': 4}, 3])
+        differences, description = requirement(data)
+        expected = [Missing({'b': [2]}), Extra({'c': 4}), Extra([5])]
+        self.assertEqual(list(differences), expected)
+
+    def test_unhashable_data_elements(self):
+        """Unhashable elements are compared with hashable requirements."""
+        data = iter([1, [2], 3, [2]])
+        differences, description = self.requirement(data)
+        self.assertEqual(list(differences), [Missing(2), Extra([2])])
+
 
 class TestRequiredSubset(unittest.TestCase):
     def test_element_group(self):
@@ -1537,6 +1585,13 @@ class TestRequiredSubset(unittest.TestCase):
         diff = sorted(diff, key=lambda x: x.args)
         self.assertEqual(diff, [Missing(1), Missing(2)])
 
+    def test_unhashable_elements(self):
+        requirement = RequiredSubset([{'a': 1}, [2, 3]])
+        self.assertIsNone(requirement([[2, 3], 4, {'a': 1}]))
+
+        diff, desc = requirement([{'a': 1}, [3, 2]])
+        self.assertEqual(list(diff), [Missing([2, 3])])
+
 
 class TestRequiredSuperset(unittest.TestCase):
     def test_element_group(self):
@@ -1574,6 +1629,13 @@ class TestRequiredSuperset(unittest.TestCase):
         diff = sorted(diff, key=lambda x: x.args)
         self.assertEqual(diff, [Extra((3, 4))])
 
+    def test_unhashable_elements(self):
+        requirement = RequiredSuperset([{'a': 1}, [2, 3], 4])
+        self.assertIsNone(requirement([[2, 3], {'a': 1}, {'a': 1}]))
+
+        diff, desc = requirement([{'a': 1}, {'a': 2}, [5], {'a': 2}])
+        self.assertEqual(list(diff), [Extra({'a': 2}), Extra([5])])
+
 
 class TestRequiredUnique(unittest.TestCase):
     def setUp(self):
@@ -1609,6 +1671,31 @@ class TestRequiredUnique(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.requirement({'a': (1, 2)})
 
+    def test_unhashable_elements(self):
+        data = [{'a': 1}, [2], {'a': 1}, 3, [2], {'a': [1]}, {'a': 1}]
+        diff, desc = self.requirement(data)
+        self.assertEqual(list(diff), [Extra({'a': 1}), Extra([2]), Extra({'a': 1})])
+
+    def test_partitions_and_error_rate(self):
+        expected = [
+            ('a', [Extra(2)]),
+            ('b', [Extra(3), Extra([4])]),
+        ]
+        for requirement in [RequiredUnique(partitions=4),
+                            RequiredUnique(error_rate=0.01)]:
+            diff, desc = requirement({'a': iter([1, 2, 2]), 'b': [3, [4], 3, [4]]})
+            self.assertEqual(evaluate_items(diff), expected)
+
+        with self.assertRaises(ValueError):
+            RequiredUnique(partitions=4, error_rate=0.01)
+
+        with self.assertRaises(ValueError):
+            RequiredUnique(error_rate=1.5)
+
+        for partitions in [0, -1, 2.5, True]:
+            with self.assertRaises(ValueError):
+                RequiredUnique(partitions=partitions)
+
 
 class TestRequiredOrder2(unittest.TestCase):
     def test_no_difference(self):
@@ -1791,6 +1878,33 @@ class TestRequiredSequence2(unittest.TestCase):
         ]
         self.assertEqual(list(diff), expected)
 
+    def test_predicates_reused(self):
+        requirement = RequiredSequence(['a', 'b'])
+        self.assertIsNone(requirement(['a', 'b']))
+        predicates = requirement._predicates
+        self.assertEqual([x for x, _ in predicates], ['a', 'b'])
+
+        diff, _ = requirement(['a', 'x', 'y'])
+        self.assertEqual(list(diff), [Invalid('x', expected='b'), Extra('y')])
+        self.assertIs(requirement._predicates, predicates)
+
+    def test_exhaustible_iterable(self):
+        requirement = RequiredSequence(iter(['a', 'b']))
+        diff, _ = requirement(['a', 'x'])
+        self.assertEqual(list(diff), [Invalid('x', expected='b')])
+        self.assertIsNone(requirement._predicates)
+
+    def test_factory_requirements_reused(self):
+        requirement = RequiredSequence(['abc', 'def'], factory=RequiredFuzzy)
+        self.assertIsNone(requirement(['abx', 'def']))
+        requirements = requirement._requirements
+        self.assertEqual(len(requirements), 2)
+
+        diff, _ = requirement(['abc', 'xyz', 'ghi'])
+        expected = [Invalid('xyz', expected='def'), Extra('ghi')]
+        self.assertEqual(list(diff), expected)
+        self.assertIs(requirement._requirements, requirements)
+
 
 class TestRequiredMapping(unittest.TestCase):
     def test_instantiation(self):
@@ -2149,3 +2263,134 @@ class TestAdaptsMappingDecorator(unittest.TestCase):
 
         requirement = NoArgs()
         self.assertIsNone(requirement('foo'))  # <- Pass without error.
+
+
+@unittest.skipIf(not numpy, 'numpy not found')
+class TestNumpyArrays(unittest.TestCase):
+    """Vectorized checks should give the same results as checking
+    each element in Python.
+    """
+    def assertSameResult(self, requirement, array):
+        def evaluate(result):
+            if result is None:
+                return None
+            differences, description = result
+            return sorted(differences, key=repr), description
+
+        vectorized = evaluate(requirement(array))
+        element_wise = evaluate(requirement(list(array)))
+        self.assertEqual(vectorized, element_wise)
+
+    def setUp(self):
+        self.floats = numpy.array([0.5, -2.0, 1.0, float('nan'), 3.25])
+        self.ints = numpy.array([3, 1, 4, 1, 5, 9, 2, 6])
+
+    def test_interval(self):
+        self.assertSameResult(RequiredInterval(0, 2), self.floats)
+        self.assertSameResult(RequiredInterval(min=2), self.ints)
+        self.assertSameResult(RequiredInterval(max=1.5), self.ints)  # <- Not reduced.
+
+        differences, _ = RequiredInterval(0, 2)(self.floats)
+        self.assertEqual(list(differences), [Deviation(-2.0, 0), Deviation(1.25, 2)])
+
+    def test_approx(self):
+        self.assertSameResult(RequiredApprox(1.0, places=1), self.floats)
+        self.assertSameResult(RequiredApprox(1.0, delta=0.5), self.floats)
+
+        array = numpy.array([1.04, 1.05, 1.06, 0.95])  # <- Near rounding boundary.
+        self.assertSameResult(RequiredApprox(1.0, places=1), array)
+
+    def test_type(self):
+        self.assertIsNone(RequiredPredicate(float)(self.floats))
+        self.assertSameResult(RequiredPredicate(float), self.ints)
+
+    def test_set(self):
+        self.assertSameResult(RequiredSet(set([1, 2, 3, 7])), self.ints)
+        self.assertSameResult(RequiredSubset(set([1, 7])), self.ints)
+        self.assertSameResult(RequiredSuperset(set([1, 2, 3])), self.ints)
+        self.assertSameResult(RequiredSet(set([0.5])), self.floats)  # <- Has NaN.
+
+    def test_unique(self):
+        differences, _ = RequiredUnique()(self.ints)
+        self.assertEqual(list(differences), [Extra(1)])
+
+        strings = numpy.array(['a', 'b', 'a', 'c', 'a'])
+        self.assertSameResult(RequiredUnique(), strings)
+        self.assertSameResult(RequiredUnique(), self.floats)  # <- Has NaN.
+
+
+
+@unittest.skipIf(not pandas, 'pandas not found')
+class TestPandasObjects(unittest.TestCase):
+    """Checking distinct rows and comparing values using vectorized
+    operations should give the same results as checking each row.
+    """
+    def assertSameResult(self, requirement, obj):
+        def evaluate(result):
+            if result is None:
+                return None
+            differences, description = result
+            differences = [(k, v if isinstance(v, BaseDifference) else list(v))
+                           for k, v in differences]
+            return sorted(differences, key=repr), description
+
+        reduced = evaluate(requirement(obj))
+        row_wise = evaluate(requirement(dict(normalize(obj))))
+        self.assertEqual(repr(reduced), repr(row_wise))  # <- Repr for NaN values.
+
+    def setUp(self):
+        self.series = pandas.Series(
+            ['a', 'b', 'a', 'c', 'a', 'b', 'a', 'x'],
+            index=[10, 11, 12, 13, 14, 15, 16, 17],
+        )
+        self.frame = pandas.DataFrame({
+            'A': ['x', 'x', 'y', 'y', 'x', 'y'],
+            'B': [1, 2, 1, 1, 2, float('nan')],
+        })
+
+    def test_predicate(self):
+        self.assertSameResult(RequiredPredicate(set(['a', 'b'])), self.series)
+        self.assertSameResult(RequiredPredicate(str), self.series)
+        self.assertSameResult(RequiredPredicate(('x', 1.0)), self.frame)
+        self.assertSameResult(RequiredPredicate(('x', float)), self.frame)
+
+        differences, _ = RequiredPredicate(set(['a', 'b']))(self.series)
+        self.assertEqual(list(differences), [(13, Invalid('c')), (17, Invalid('x'))])
+
+    def test_predicate_subclasses(self):
+        numbers = pandas.Series([1.0, 1.25, 1.0, 2.5, 1.0, 1.25])
+        self.assertSameResult(RequiredApprox(1.0, delta=0.3), numbers)
+        self.assertSameResult(RequiredInterval(1, 2), numbers)
+        self.assertSameResult(RequiredFuzzy('a', cutoff=0.5), self.series)
+
+    def test_set(self):
+        self.assertSameResult(RequiredSet(set(['a', 'b'])), self.series)
+        self.assertSameResult(RequiredSubset(set(['a'])), self.series)
+        self.assertSameResult(RequiredSuperset(set(['a', 'z'])), self.series)
+
+    def test_not_reduced(self):
+        mixed = pandas.Series([1, 1.0, True, 1, 1.0, True])  # <- Equal values of different types.
+        self.assertSameResult(RequiredPredicate(int), mixed)
+
+        distinct = pandas.Series(['a', 'b', 'c', 'd'])  # <- Most rows distinct.
+        self.assertSameResult(RequiredPredicate('a'), distinct)
+
+    def test_mapping(self):
+        mapping = {10: 'a', 11: 'x', 12: 5, 13: 'c', 99: 'z'}
+        self.assertSameResult(RequiredMapping(mapping), self.series)
+
+        numbers = pandas.Series([1, 2, 3])
+        self.assertSameResult(RequiredMapping({0: 1, 1: 2.0, 2: 4}), numbers)
+        self.assertSameResult(RequiredMapping({0: int, 1: 2, 2: 3}), numbers)  # <- Not reduced.
+
+    def test_mapping_frame(self):
+        mapping = {0: ('x', 1), 1: ('x', 3), 2: ('y', 1.0), 5: ('y', 2), 9: ('z', 0)}
+        self.assertSameResult(RequiredMapping(mapping), self.frame)
+
+        differences, _ = RequiredMapping(mapping)(self.frame)
+        keys = sorted(key for key, _ in differences)
+        self.assertEqual(keys, [1, 3, 4, 5, 9])
+
+        single = self.frame[['A']]
+        self.assertSameResult(RequiredMapping({0: 'x', 1: 'y', 7: 'z'}), single)
+        self.assertSameResult(RequiredMapping({0: ('x', int)}), self.frame)  # <- Not reduced.
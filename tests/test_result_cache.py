@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+from . import _unittest as unittest
+
+from datatest._query.query import Result
+from datatest._query.query import Select
+from datatest._query.query import _make_cache_key
+from datatest._utils import CacheInfo
+from datatest._query.result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = ResultCache(2)
+        self.assertEqual(cache.get('a'), (False, None))
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), (True, 1))
+        self.assertEqual(cache.info(), CacheInfo(1, 1, 2, 1))
+
+    def test_lru_eviction(self):
+        cache = ResultCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')     # <- Makes 'b' the least recently used.
+        cache.put('c', 3)  # <- Evicts 'b'.
+        self.assertEqual(cache.get('b'), (False, None))
+        self.assertEqual(cache.get('a'), (True, 1))
+        self.assertEqual(cache.get('c'), (True, 3))
+
+    def test_put_existing_key(self):
+        cache = ResultCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 3)  # <- Updates 'a' and makes 'b' least recently used.
+        cache.put('c', 4)  # <- Evicts 'b'.
+        self.assertEqual(cache.get('a'), (True, 3))
+        self.assertEqual(cache.get('b'), (False, None))
+        self.assertEqual(cache.info().currsize, 2)
+
+    def test_clear(self):
+        cache = ResultCache(2)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(1, 0, 2, 0))
+
+
+class TestMakeCacheKey(unittest.TestCase):
+    def test_equivalent_objects(self):
+        key1 = _make_cache_key(({'A': ['B']}, {'C': set(['x', 'y'])}))
+        key2 = _make_cache_key(({'A': ['B']}, {'C': set(['y', 'x'])}))
+        self.assertEqual(key1, key2)
+        hash(key1)  # <- Should not raise error.
+
+    def test_types_distinguished(self):
+        self.assertNotEqual(_make_cache_key(1), _make_cache_key(1.0))
+        self.assertNotEqual(_make_cache_key(['A']), _make_cache_key(('A',)))
+
+    def test_unhashable(self):
+        class Unhashable(object):
+            __hash__ = None
+
+        with self.assertRaises(TypeError):
+            _make_cache_key([Unhashable()])
+
+
+class TestSelectCache(unittest.TestCase):
+    def setUp(self):
+        self.data = [['A', 'B'], ['x', 1], ['y', 2], ['x', 3]]
+
+    def test_repeated_query(self):
+        select = Select(self.data, cache_size=8)
+        self.assertEqual(select({'A': 'B'}).sum().fetch(), {'x': 4, 'y': 2})
+        self.assertEqual(select({'A': 'B'}).sum().fetch(), {'x': 4, 'y': 2})
+        self.assertEqual(select.cache_info(), CacheInfo(1, 1, 8, 1))
+
+        select('A', B=2).fetch()  # <- Different where-keyword.
+        self.assertEqual(select.cache_info(), CacheInfo(1, 2, 8, 2))
+
+    def test_results_are_copies(self):
+        select = Select(self.data, cache_size=8)
+        result = select({'A': 'B'}).fetch()
+        result['x'].append(99)
+
+        result = select({'A': 'B'}).execute()
+        self.assertIsInstance(result, Result)
+        self.assertEqual(result.fetch(), {'x': [1, 3], 'y': [2]})
+
+    def test_load_data_clears_cache(self):
+        select = Select(self.data, cache_size=8)
+        self.assertEqual(select('A').fetch(), ['x', 'y', 'x'])
+
+        select.load_data([['A', 'B'], ['z', 4]])
+        self.assertEqual(select('A').fetch(), ['x', 'y', 'x', 'z'])
+        self.assertEqual(select.cache_info().hits, 0)
+
+    def test_disabled(self):
+        select = Select(self.data)
+        select('A').fetch()
+        select('A').fetch()
+        self.assertEqual(select.cache_info(), CacheInfo(0, 0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
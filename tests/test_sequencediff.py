@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import random
+from . import _unittest as unittest
+
+from datatest._sequencediff import get_opcodes
+from datatest import _sequencediff
+
+
+def apply_opcodes(a, b, opcodes):
+    """Rebuild *b* from *a* using the given *opcodes*."""
+    result = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == 'equal':
+            result.extend(a[i1:i2])
+        elif tag in ('insert', 'replace'):
+            result.extend(b[j1:j2])
+    return result
+
+
+def count_edits(opcodes):
+    total = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag != 'equal':
+            total += (i2 - i1) + (j2 - j1)
+    return total
+
+
+def lcs_edits(a, b):
+    """Return the minimum number of insertions and deletions needed
+    to turn *a* into *b* (dynamic programming, for small sequences).
+    """
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            if x == y:
+                current.append(previous[j] + 1)
+            else:
+                current.append(max(previous[j + 1], current[j]))
+        previous = current
+    return len(a) + len(b) - 2 * previous[-1]
+
+
+class TestGetOpcodes(unittest.TestCase):
+    def test_equal(self):
+        self.assertEqual(get_opcodes('abc', 'abc'), [('equal', 0, 3, 0, 3)])
+
+    def test_empty(self):
+        self.assertEqual(get_opcodes('', ''), [])
+        self.assertEqual(get_opcodes('', 'ab'), [('insert', 0, 0, 0, 2)])
+        self.assertEqual(get_opcodes('ab', ''), [('delete', 0, 2, 0, 0)])
+
+    def test_edits(self):
+        opcodes = get_opcodes('abxcd', 'abcyd')
+        expected = [
+            ('equal', 0, 2, 0, 2),
+            ('delete', 2, 3, 2, 2),
+            ('equal', 3, 4, 2, 3),
+            ('insert', 4, 4, 3, 4),
+            ('equal', 4, 5, 4, 5),
+        ]
+        self.assertEqual(opcodes, expected)
+
+    def test_replace(self):
+        opcodes = get_opcodes('axc', 'ayc')
+        expected = [
+            ('equal', 0, 1, 0, 1),
+            ('replace', 1, 2, 1, 2),
+            ('equal', 2, 3, 2, 3),
+        ]
+        self.assertEqual(opcodes, expected)
+
+    def test_shortest_edit_script(self):
+        rand = random.Random(1234)
+        for _ in range(200):
+            a = [rand.randrange(4) for _ in range(rand.randrange(30))]
+            b = [rand.randrange(4) for _ in range(rand.randrange(30))]
+            opcodes = get_opcodes(a, b)
+            self.assertEqual(apply_opcodes(a, b, opcodes), b)
+            self.assertEqual(count_edits(opcodes), lcs_edits(a, b))
+
+    def test_long_sequences(self):
+        a = list(range(5000))
+        b = a[:100] + a[101:2500] + ['x'] + a[2500:]
+        opcodes = get_opcodes(a, b)
+        self.assertEqual(apply_opcodes(a, b, opcodes), b)
+        self.assertEqual(count_edits(opcodes), 2)
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            get_opcodes([[1], [2]], [[1]])
+
+
+class TestCostLimit(unittest.TestCase):
+    def setUp(self):
+        self.original_limit = _sequencediff._COST_LIMIT
+        _sequencediff._COST_LIMIT = 2
+
+    def tearDown(self):
+        _sequencediff._COST_LIMIT = self.original_limit
+
+    def test_too_expensive(self):
+        """Parts needing too many edits should still give a valid
+        (but not necessarily shortest) edit script.
+        """
+        rand = random.Random(5678)
+        for _ in range(500):
+            a = [rand.randrange(5) for _ in range(rand.randrange(40))]
+            b = [rand.randrange(5) for _ in range(rand.randrange(40))]
+            opcodes = get_opcodes(a, b)
+            self.assertEqual(apply_opcodes(a, b, opcodes), b)
+
+    def test_split_keeps_matches(self):
+        """Splitting at the furthest point should keep long runs of
+        equal elements matched.
+        """
+        a = list(range(2000))
+        b = list(a)
+        for i in range(0, 2000, 40):
+            b[i] = 'x{0}'.format(i)
+        opcodes = get_opcodes(a, b)
+        self.assertEqual(apply_opcodes(a, b, opcodes), b)
+        self.assertLess(count_edits(opcodes), 150)  # <- Shortest is 100.
+
+    def test_nothing_in_common(self):
+        a = list(range(100))
+        b = list(range(100, 190))
+        self.assertEqual(get_opcodes(a, b), [('replace', 0, 100, 0, 90)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,9 @@ from datatest._load.temptable import (
     new_table_name,
     normalize_names,
     normalize_default,
+    normalize_type,
+    infer_types,
+    INFER_SAMPLE_SIZE,
     create_table,
     get_columns,
     insert_records,
@@ -17,6 +20,10 @@ from datatest._load.temptable import (
     drop_table,
     savepoint,
     load_data,
+    map_records,
+    deferred_indexes,
+    load_settings,
+    get_index_statements,
 )
 
 
@@ -108,6 +115,41 @@ class TestNormalizeDefault(unittest.TestCase):
         self.assertEqual(normalized, "''")
 
 
+class TestNormalizeType(unittest.TestCase):
+    def test_python_types(self):
+        self.assertEqual(normalize_type(str), 'TEXT')
+        self.assertEqual(normalize_type(int), 'INTEGER')
+        self.assertEqual(normalize_type(float), 'REAL')
+
+    def test_type_names(self):
+        self.assertEqual(normalize_type('integer'), 'INTEGER')
+        self.assertEqual(normalize_type('NUMERIC'), 'NUMERIC')
+
+    def test_unsupported_type(self):
+        with self.assertRaises(TypeError):
+            normalize_type(list)
+
+
+class TestInferTypes(unittest.TestCase):
+    def test_text_values(self):
+        records = [('x', '1', '1.5', ''), ('y', '20', '2', '')]
+        inferred = infer_types(['A', 'B', 'C', 'D'], records)
+        expected = {'A': 'TEXT', 'B': 'INTEGER', 'C': 'REAL'}
+        self.assertEqual(inferred, expected, msg='empty column D is omitted')
+
+    def test_lossy_conversions(self):
+        records = [('007', '12345678901234567890', ' 5', '1.5')]
+        inferred = infer_types(['A', 'B', 'C', 'D'], records)
+        expected = {'A': 'TEXT', 'B': 'TEXT', 'C': 'TEXT', 'D': 'REAL'}
+        self.assertEqual(inferred, expected)
+
+    def test_non_text_values(self):
+        records = [(1, 1.5, 1, None), (2, 2, 'x', None)]
+        inferred = infer_types(['A', 'B', 'C', 'D'], records)
+        expected = {'A': 'INTEGER', 'B': 'REAL', 'C': 'TEXT'}
+        self.assertEqual(inferred, expected)
+
+
 class TestCreateTable(unittest.TestCase):
     def setUp(self):
         connection = sqlite3.connect(':memory:')
@@ -257,6 +299,29 @@ class TestInsertRecords(unittest.TestCase):
 
         self.assertEqual(results, [])
 
+    def test_batches(self):
+        cursor = self.cursor
+        cursor.execute('CREATE TEMPORARY TABLE test_table ("A", "B")')
+        records = (('x', i) for i in range(7))
+        inserted = insert_records(cursor, 'test_table', ['A', 'B'], records, batch_size=3)
+        self.assertEqual(inserted, 7)
+
+        cursor.execute('SELECT B FROM test_table')
+        self.assertEqual([x[0] for x in cursor], [0, 1, 2, 3, 4, 5, 6])
+
+    def test_load_counter(self):
+        self.cursor.execute('CREATE TEMPORARY TABLE test_table ("A", "B")')
+        counter = temptable.load_counter
+        counter.reset()
+        insert_records(self.cursor, 'test_table', ['A', 'B'], [('x', 1), ('y', 2)])
+        insert_records(self.cursor, 'test_table', ['A', 'B'], [('z', 3)])
+        self.assertEqual(counter.rows, 3)
+        self.assertGreaterEqual(counter.rows_per_second, 0.0)
+
+        counter.reset()
+        self.assertEqual(counter.rows, 0)
+        self.assertEqual(counter.rows_per_second, 0.0)
+
     def test_sqlite3_errors(self):
         """Sqlite errors should not be caught."""
         # No such table.
@@ -301,6 +366,45 @@ class TestAlterTable(unittest.TestCase):
         self.assertEqual(columns, ['A', 'B', 'C', 'D'])
 
 
+class TestDeferredIndexes(unittest.TestCase):
+    def setUp(self):
+        connection = sqlite3.connect(':memory:')
+        connection.isolation_level = None
+        self.cursor = connection.cursor()
+
+    def test_indexes_recreated(self):
+        cursor = self.cursor
+        cursor.execute('CREATE TEMPORARY TABLE test_table ("A", "B")')
+        cursor.execute('CREATE INDEX idx_a ON test_table ("A")')
+        statements = get_index_statements(cursor, 'test_table')
+        self.assertEqual(len(statements), 1)
+
+        with deferred_indexes(cursor, 'test_table'):
+            self.assertEqual(get_index_statements(cursor, 'test_table'), [])
+            insert_records(cursor, 'test_table', ['A', 'B'], [('x', 1)])
+
+        self.assertEqual(get_index_statements(cursor, 'test_table'), statements)
+
+    def test_missing_table(self):
+        with deferred_indexes(self.cursor, 'missing_table'):
+            pass  # <- Should not raise error.
+
+
+class TestLoadSettings(unittest.TestCase):
+    def test_restore_settings(self):
+        connection = sqlite3.connect(':memory:')
+        cursor = connection.cursor()
+        cursor.execute('PRAGMA main.cache_size')
+        original = cursor.fetchone()[0]
+
+        with load_settings(cursor, cache_size=4096):
+            cursor.execute('PRAGMA main.cache_size')
+            self.assertEqual(cursor.fetchone()[0], -4096)
+
+        cursor.execute('PRAGMA main.cache_size')
+        self.assertEqual(cursor.fetchone()[0], original)
+
+
 class TestDropTable(unittest.TestCase):
     def test_drop_table(self):
         connection = sqlite3.connect(':memory:')
@@ -482,6 +586,54 @@ class TestLoadData(unittest.TestCase):
         load_data(self.cursor, 'testtable2', records)  # <- Using three args.
         self.assertFalse(table_exists(self.cursor, 'testtable2'), 'should not create table')
 
+    def test_index_kept_after_load(self):
+        load_data(self.cursor, 'testtable', ['A', 'B'], [('x', 1)])
+        self.cursor.execute('CREATE INDEX idx_test ON testtable ("A")')
+        load_data(self.cursor, 'testtable', ['A', 'C'], [('y', 2)])
+
+        statements = get_index_statements(self.cursor, 'testtable')
+        self.assertEqual(len(statements), 1)
+
+    def test_types(self):
+        records = [['A', 'B', 'C'], ['x', '1', '007'], ['y', '2.5', '008']]
+        load_data(self.cursor, 'testtable', records, types=True)
+        self.cursor.execute('SELECT A, B, C FROM testtable')
+        expected = [('x', 1.0, '007'), ('y', 2.5, '008')]
+        self.assertEqual(self.cursor.fetchall(), expected)
+
+        records = [['A', 'B', 'D'], ['z', '3', '4']]  # <- New column D.
+        load_data(self.cursor, 'testtable', records, types={'D': str})
+        self.cursor.execute('SELECT B, D FROM testtable')
+        expected = [(1.0, ''), (2.5, ''), (3.0, '4')]
+        self.assertEqual(self.cursor.fetchall(), expected)
+
+    def test_types_after_sample(self):
+        records = [['A', 'B']]
+        records.extend([str(x), str(x)] for x in range(INFER_SAMPLE_SIZE + 10))
+        records.extend([['007', '1.50'], ['1.0', '2']])
+        load_data(self.cursor, 'testtable', records, types=True)
+        self.cursor.execute('SELECT A, B FROM testtable ORDER BY rowid DESC LIMIT 3')
+        expected = [('1.0', 2.0), ('007', 1.5), ('1009', 1009.0)]
+        self.assertEqual(self.cursor.fetchall(), expected)
+        self.cursor.execute("SELECT COUNT(*) FROM sqlite_temp_master WHERE type='table'")
+        self.assertEqual(self.cursor.fetchone(), (1,), msg='should drop staging table')
+
+    def test_types_widened(self):
+        load_data(self.cursor, 'testtable', [['A', 'B'], ['1', '2']], types=True)
+        self.cursor.execute('CREATE INDEX idx_test ON testtable ("A")')
+        load_data(self.cursor, 'testtable', [['A', 'B'], ['007', '2.5']], types=True)
+        self.cursor.execute('SELECT A, B FROM testtable')
+        self.assertEqual(self.cursor.fetchall(), [('1', 2.0), ('007', 2.5)])
+
+        statements = get_index_statements(self.cursor, 'testtable')
+        self.assertEqual(len(statements), 1, msg='should keep index')
+
+    def test_types_untyped(self):
+        records = [['A', 'B'], ['x', '1']]
+        load_data(self.cursor, 'testtable', records)  # <- No types.
+        self.cursor.execute('SELECT A, B FROM testtable')
+        self.assertEqual(self.cursor.fetchall(), [('x', '1')])
+
     def test_bad_columns_object(self):
         records = [('x', 1), ('y', 2)]
         columns = 'bad columns object'  # <- Expects iterable of names, not this str.
@@ -490,5 +642,34 @@ class TestLoadData(unittest.TestCase):
             load_data(self.cursor, 'testtable', columns, records)
 
 
+
+class TestMapRecords(unittest.TestCase):
+    def test_complete_records(self):
+        records = [{'A': 'x', 'B': 1}, {'B': 2, 'A': 'y'}]
+        result = [list(x) for x in map_records(records, ['A', 'B'])]
+        self.assertEqual(result, [['x', 1], ['y', 2]])
+
+    def test_missing_values(self):
+        records = [{'A': 'x'}, {'B': 2}]
+        result = [list(x) for x in map_records(records, ['A', 'B'])]
+        self.assertEqual(result, [['x', ''], ['', 2]])
+
+    def test_single_column(self):
+        records = [{'A': 'x', 'B': 1}, {'B': 2}]
+        result = [list(x) for x in map_records(records, ['A'])]
+        self.assertEqual(result, [['x'], ['']])
+
+    def test_defaultdict(self):
+        load_records = collections.defaultdict(lambda: 'bad value')
+        load_records['A'] = 'x'
+
+        connection = sqlite3.connect(':memory:')
+        connection.isolation_level = None
+        cursor = connection.cursor()
+        load_data(cursor, 'testtable', ['A', 'B'], [load_records])
+        cursor.execute('SELECT A, B FROM testtable')
+        self.assertEqual(cursor.fetchall(), [('x', '')])
+
+
 if __name__ == '__main__':
     unittest.main()
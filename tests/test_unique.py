@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import random
+from . import _unittest as unittest
+
+import datatest._unique
+from datatest.difference import NOVALUE
+from datatest._unique import partitioned_duplicates
+from datatest._unique import BloomFilter
+from datatest._unique import ScalableBloomFilter
+from datatest._unique import bloom_duplicates
+
+
+def in_memory_duplicates(iterable):
+    seen = []
+    for element in iterable:
+        if element in seen:
+            yield element
+        else:
+            seen.append(element)
+
+
+class TestPartitionedDuplicates(unittest.TestCase):
+    def test_duplicates(self):
+        data = ['a', 'b', 'a', 'c', 'b', 'a']
+        result = partitioned_duplicates(data, 3)
+        self.assertEqual(list(result), ['a', 'b', 'a'])
+
+    def test_same_order_as_in_memory(self):
+        rand = random.Random(1234)
+        data = [rand.randrange(200) for _ in range(500)]
+        result = partitioned_duplicates(iter(data), 7)
+        self.assertEqual(list(result), list(in_memory_duplicates(data)))
+
+    def test_unhashable_and_sentinel_elements(self):
+        data = [{'a': 1}, NOVALUE, [2], {'a': 1}, NOVALUE]
+        result = partitioned_duplicates(data, 2)
+        self.assertEqual(list(result), [{'a': 1}, NOVALUE])
+
+    def test_no_duplicates(self):
+        self.assertEqual(list(partitioned_duplicates([1, 2, 3], 2)), [])
+        self.assertEqual(list(partitioned_duplicates([], 2)), [])
+
+
+class TestBloomFilter(unittest.TestCase):
+    def test_add(self):
+        bloom = BloomFilter(100, 0.01)
+        self.assertFalse(bloom.add('a'))
+        self.assertTrue(bloom.add('a'))
+        self.assertIn('a', bloom)
+        self.assertEqual(bloom.count, 1)
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(1000, 0.01)
+        for x in range(1000):
+            bloom.add(x)
+        false_positives = sum(1 for x in range(1000, 11000) if x in bloom)
+        self.assertLess(false_positives, 300)  # <- Expect about 100.
+
+    def test_scalable(self):
+        bloom = ScalableBloomFilter(0.01, initial_capacity=10)
+        for x in range(100):
+            bloom.add(x)
+        self.assertGreater(len(bloom.filters), 1)
+        self.assertTrue(all(bloom.add(x) for x in range(100)))
+
+    def test_scalable_growth_boundary(self):
+        """The add that grows the filter should check the full filter."""
+        bloom = ScalableBloomFilter(0.01, initial_capacity=2)
+        self.assertEqual([bloom.add(x) for x in 'aba'], [False, False, True])
+        self.assertEqual(len(bloom.filters), 1)
+
+        self.assertFalse(bloom.add('c'))  # <- Grows filter.
+        self.assertEqual(len(bloom.filters), 2)
+        self.assertEqual([bloom.add(x) for x in 'abc'], [True, True, True])
+
+
+class TestBloomDuplicates(unittest.TestCase):
+    def test_duplicates(self):
+        data = ['a', 'b', 'a', 'c', 'b', 'a']
+        result = bloom_duplicates(data, 0.01)
+        self.assertEqual(list(result), ['a', 'b', 'a'])
+
+    def test_exhaustible_iterable(self):
+        data = iter([{'a': 1}, [2], {'a': 1}, 3, [2]])
+        result = bloom_duplicates(data, 0.01)
+        self.assertEqual(list(result), [{'a': 1}, [2]])
+
+    def test_growth_boundary(self):
+        original_capacity = datatest._unique.INITIAL_CAPACITY
+        datatest._unique.INITIAL_CAPACITY = 2
+        try:
+            result = bloom_duplicates(iter(['a', 'b', 'a']), 0.01)
+            self.assertEqual(list(result), ['a'])
+        finally:
+            datatest._unique.INITIAL_CAPACITY = original_capacity
+
+    def test_same_as_in_memory(self):
+        """False positives should be removed when confirming candidates."""
+        rand = random.Random(1234)
+        data = [rand.randrange(2000) for _ in range(1000)]
+        result = bloom_duplicates(iter(data), 0.5)  # <- High error rate.
+        self.assertEqual(list(result), list(in_memory_duplicates(data)))
+
+
+if __name__ == '__main__':
+    unittest.main()
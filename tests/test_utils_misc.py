@@ -181,3 +181,37 @@ class TestMakeSentinel(unittest.TestCase):
             'TheName', '<the repr>', 'The docstring.', truthy=False
         )
         self.assertFalse(bool(sentinel))
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = _utils.LRUCache(2)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIn('a', cache)
+        self.assertEqual(cache.info(), _utils.CacheInfo(1, 1, 2, 1))
+
+    def test_lru_eviction(self):
+        cache = _utils.LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')     # <- Makes 'b' the least recently used.
+        cache.put('c', 3)  # <- Evicts 'b'.
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_clear(self):
+        cache = _utils.LRUCache(2)
+        cache.put('a', 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('b'), 2)
+
+    def test_unhashable_key(self):
+        cache = _utils.LRUCache(2)
+        with self.assertRaises(TypeError):
+            cache.get(['a'])
@@ -344,6 +344,62 @@ class TestValidationError(unittest.TestCase):
         self.assertEqual(err.args, ([MinimalDifference('A')], None))
 
 
+class TestValidationErrorLimits(unittest.TestCase):
+    def test_max_differences(self):
+        diffs = (MinimalDifference(x) for x in 'ABCDE')
+        err = ValidationError(diffs, max_differences=2)
+        self.assertEqual(err.differences, [MinimalDifference('A'),
+                                           MinimalDifference('B')])
+        self.assertEqual(err.omitted, 3)
+
+        expected = """
+            5 differences: [
+                MinimalDifference('A'),
+                MinimalDifference('B'),
+                ...
+
+            3 more not shown (max_differences=2)
+        """
+        expected = textwrap.dedent(expected).strip()
+        self.assertEqual(str(err), expected)
+
+    def test_max_differences_mapping(self):
+        diffs = {
+            'a': iter([MinimalDifference('A'), MinimalDifference('B')]),
+            'b': MinimalDifference('C'),
+        }
+        err = ValidationError(diffs, max_differences=1)
+        self.assertEqual(len(err.differences), 1)
+        self.assertEqual(err.omitted, 2)
+
+    def test_max_differences_not_reached(self):
+        err = ValidationError([MinimalDifference('A')], max_differences=2)
+        self.assertEqual(err.differences, [MinimalDifference('A')])
+        self.assertEqual(err.omitted, 0)
+
+    def test_bad_max_differences(self):
+        with self.assertRaises(ValueError):
+            ValidationError([MinimalDifference('A')], max_differences=0)
+
+    def test_lazy(self):
+        generated = []
+        def generate():
+            for x in 'ABC':
+                generated.append(x)
+                yield MinimalDifference(x)
+
+        err = ValidationError(generate(), lazy=True)
+        self.assertEqual(next(iter(err.differences)), MinimalDifference('A'))
+        self.assertEqual(generated, ['A'])
+
+    def test_lazy_str(self):
+        diffs = (MinimalDifference(x) for x in 'ABC')
+        err = ValidationError(diffs, lazy=True, max_differences=2)
+        self.assertTrue(str(err).startswith('3 differences: ['))
+        self.assertEqual(err.differences, [MinimalDifference('A'),
+                                           MinimalDifference('B')])
+
+
 class TestValidationIntegration(unittest.TestCase):
     def test_valid(self):
         a = set([1, 2, 3])
@@ -362,6 +418,43 @@ class TestValidationIntegration(unittest.TestCase):
         with self.assertRaises(ValidationError):
             validate(a, b)
 
+    def test_valid_stops_early(self):
+        checked = []
+        def predicate(x):
+            checked.append(x)
+            return False
+
+        self.assertFalse(valid([1, 2, 3], predicate))
+        self.assertEqual(checked, [1])
+
+    def test_validate_max_differences(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate(['a', 'b', 'c'], int, max_differences=1)
+        self.assertEqual(len(cm.exception.differences), 1)
+        self.assertEqual(cm.exception.omitted, 2)
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.set(['a', 'b', 'c'], set(['x']), max_differences=2)
+        self.assertEqual(len(cm.exception.differences), 2)
+        self.assertEqual(cm.exception.omitted, 2)
+
+    def test_validate_workers(self):
+        with self.assertRaises(ValidationError) as cm:
+            validate(range(10), lambda x: x % 4 != 0, workers=2)
+        expected = [Invalid(0), Invalid(4), Invalid(8)]
+        self.assertEqual(cm.exception.differences, expected)
+        self.assertEqual(cm.exception.description, 'does not satisfy <lambda>')
+
+    def test_requirement_max_differences(self):
+        from datatest.requirements import RequiredPredicate
+        requirement = RequiredPredicate(int)
+        requirement.max_differences = 2
+
+        with self.assertRaises(ValidationError) as cm:
+            validate(['a', 'b', 'c'], requirement)
+        self.assertEqual(len(cm.exception.differences), 2)
+        self.assertEqual(cm.exception.omitted, 1)
+
 
 class TestValidate(unittest.TestCase):
     """An integration test to check behavior of validate() function."""